@@ -1,67 +1,83 @@
-import speech_recognition as sr
-import asyncio
-import threading
 import time
-import os
+import itertools
+import threading
 from datetime import datetime
 
-from Jarvis.features import date_time
-from Jarvis.features import launch_app
-from Jarvis.features import website_open
-from Jarvis.features import weather
-from Jarvis.features import wikipedia
-from Jarvis.features import news
-from Jarvis.features import send_email
-from Jarvis.features import google_search
-from Jarvis.features import google_calendar
-from Jarvis.features import note
-from Jarvis.features import system_stats
-from Jarvis.features import loc
+# Every feature module imported from here on is timed function by function (see get_instrumentation_report)
+from Jarvis.features.instrumentation import instrumentation
+instrumentation.install()
+
+# Feature modules are imported the first time a method needs them (see get_import_report)
+from Jarvis.features.lazy_import import import_report, lazy_import
+
+date_time = lazy_import('Jarvis.features.date_time')
+launch_app = lazy_import('Jarvis.features.launch_app')
+website_open = lazy_import('Jarvis.features.website_open')
+weather = lazy_import('Jarvis.features.weather')
+wikipedia = lazy_import('Jarvis.features.wikipedia')
+news = lazy_import('Jarvis.features.news')
+send_email = lazy_import('Jarvis.features.send_email')
+google_search = lazy_import('Jarvis.features.google_search')
+google_calendar = lazy_import('Jarvis.features.google_calendar')
+note = lazy_import('Jarvis.features.note')
+system_stats = lazy_import('Jarvis.features.system_stats')
+loc = lazy_import('Jarvis.features.loc')
 
 # Import new enhanced features
 from Jarvis.features.language_support import LanguageSupport
 from Jarvis.features.performance_optimizer import PerformanceOptimizer
 from Jarvis.features.enhanced_features import EnhancedErrorHandler, EnhancedVoiceCommands, ContextAwareProcessor
+from Jarvis.features.command_patterns import CommandPatterns
+from Jarvis.features.deadline import Deadline, DeadlineExceeded, current, scope
+from Jarvis.features.intents import build_registry
+from Jarvis.features.prefetcher import IntentPredictor, SpeculativePrefetcher
+from Jarvis.features.warmup import IDLE
+from Jarvis.features.warm_state import WarmState
+from Jarvis.features.voice_activity import noise_floor
+from Jarvis.features.tracing import tracer
+from Jarvis.config import config
 
-# Initialize TTS engine with platform detection
-try:
-    if os.name == 'nt':  # Windows
-        import pyttsx3
-        engine = pyttsx3.init('sapi5')
-        voices = engine.getProperty('voices')
-        engine.setProperty('voices', voices[0].id)
-        TTS_AVAILABLE = True
-    else:  # Linux/Unix
-        try:
-            import subprocess
-            subprocess.run(['espeak', '--version'], capture_output=True, check=True)
-            engine = None  # Will use espeak directly
-            TTS_AVAILABLE = True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            print("TTS not available on this platform")
-            engine = None
-            TTS_AVAILABLE = False
-except Exception as e:
-    print(f"TTS initialization failed: {e}")
-    engine = None
-    TTS_AVAILABLE = False
+_compound_ids = itertools.count(1)  # task ids must stay unique while earlier parts are still in the pool
 
 class JarvisAssistant:
     def __init__(self):
+        # State saved by the last run on this machine; each section is restored as its owner registers it
+        self.warm_state = WarmState(config.warm_state_file, config.warm_state_max_age_hours * 3600)
+        if config.warm_state_enabled:
+            self.warm_state.load()
+        self.geocodes = {}
+        self.register_warm_state()
+        
         # Initialize enhanced features
-        self.language_support = LanguageSupport()
+        self.language_support = LanguageSupport(self.warm_state)
         self.performance_optimizer = PerformanceOptimizer()
         self.error_handler = EnhancedErrorHandler(self.language_support)
         self.enhanced_commands = EnhancedVoiceCommands(self.error_handler)
         self.context_processor = ContextAwareProcessor()
-        
-        # Initialize performance optimization
-        self.performance_optimizer.optimize_startup()
+        self.command_patterns = CommandPatterns()
+        self.intents = build_registry(
+            fuzzy_threshold=config.fuzzy_match_threshold, executor=self.performance_optimizer.thread_pool.executor
+        )
+        self.last_intent = None
+        self.predictor = IntentPredictor(self.intents.follow_ups())
+        self.prefetcher = SpeculativePrefetcher(
+            self.intents, self.predictor, self.performance_optimizer.thread_pool.executor,
+            config.prefetch_top_k, config.prefetch_min_probability, config.prefetch_budget_per_hour
+        )
         
         # Performance metrics
         self.command_count = 0
+        self.active_commands = 0
+        self.active_lock = threading.Lock()
         self.session_start_time = datetime.now()
         
+        # Initialize performance optimization: warmup runs in the background, optional work only while idle
+        for name in config.warmup_preload_intents:
+            self.performance_optimizer.warmup.add(f"preload_{name}", lambda name=name: self.preload_intent(name), IDLE)
+        self.performance_optimizer.optimize_startup(self.is_busy)
+        if config.warm_state_enabled:
+            self.warm_state.start_autosave(config.warm_state_interval, self.save_warm_state)
+        
         print("🚀 JARVIS Enhanced Assistant Initialized!")
         print(f"🌐 Language: {self.language_support.supported_languages[self.language_support.current_language]}")
         print("✨ All systems ready!")
@@ -109,6 +125,17 @@ class JarvisAssistant:
         :return: True/False (Play sound if True otherwise write exception to log and return False)
         """
         try:
+            # A cancelled command says nothing more, and cancelling it cuts off what it is saying
+            deadline = current()
+            if deadline is not None:
+                if deadline.cancelled.is_set():
+                    return False
+                deadline.on_cancel(self.language_support.stop_speaking)
+            
+            # The network is idle while speaking: fetch the likeliest next commands meanwhile
+            if config.prefetch_enabled:
+                self.prefetcher.start(self, self.language_support.current_language)
+            
             # Use language-specific TTS
             self.language_support.speak(text)
             return True
@@ -117,9 +144,9 @@ class JarvisAssistant:
             print(error_msg)
             return False
 
-    def tell_me_date(self):
+    def tell_me_date(self, language_code='en'):
 
-        return date_time.date()
+        return date_time.date(language_code)
 
     def tell_time(self):
 
@@ -144,26 +171,14 @@ class JarvisAssistant:
 
     def weather(self, city):
         """
-        Return weather with caching for better performance
+        Return weather; repeated requests are answered from the weather intent's cache policy
         :param city: Any city of this world
         :return: weather info as string if True, or False
         """
         try:
-            # Use cached response for better performance
-            cache_key = f"weather_{city}"
-            cached_result = self.performance_optimizer.cache.get(cache_key)
-            
-            if cached_result:
-                print("📋 Using cached weather data")
-                return cached_result
-            
-            # Fetch fresh weather data
             res = weather.fetch_weather(city)
             
             if res:
-                # Cache the result
-                self.performance_optimizer.cache.set(cache_key, res)
-                
                 # Translate if needed
                 if self.language_support.current_language != 'en':
                     res = self.language_support.translate_text(res, self.language_support.current_language)
@@ -172,6 +187,8 @@ class JarvisAssistant:
             else:
                 return self.error_handler.handle_error('api_error')
                 
+        except DeadlineExceeded as e:
+            return self.error_handler.handle_error('timeout_error', e)
         except Exception as e:
             return self.error_handler.handle_error('network_error', e)
 
@@ -213,37 +230,33 @@ class JarvisAssistant:
         return system_stats.system_stats()
 
     def location(self, location):
-        current_loc, target_loc, distance = loc.loc(location)
+        current_loc, target_loc, distance = loc.loc(location, self.geocodes)
         return current_loc, target_loc, distance
 
     def my_location(self):
         city, state, country = loc.my_location()
         return city, state, country
+
+    def current_location(self):
+        """City the session is running in, looked up once; keys location-dependent cached answers"""
+        if not hasattr(self, '_current_location'):
+            try:
+                self._current_location = self.my_location()[0]
+            except Exception as e:
+                self.error_handler.record_error('network_error', e, 'current_location')
+                return None  # not remembered, so the next lookup tries again
+        return self._current_location
     
     # =================== NEW ENHANCED FEATURES ===================
     
-    def process_enhanced_command(self, command):
+    def canonicalize_command(self, command):
         """
-        Process commands using enhanced features
+        Rewrite a native-language command into its English form using the offline pattern tables
+        so it dispatches without a translation round trip
         """
-        try:
-            # Find matching enhanced command
-            category, function = self.enhanced_commands.find_matching_command(command)
-            
-            if function:
-                print(f"🎯 Processing {category} command: {command}")
-                response = function(command)
-                
-                # Add to conversation history
-                self.context_processor.add_to_history(command, response)
-                
-                return response
-            
-            # If no enhanced command found, return None to use traditional processing
-            return None
-            
-        except Exception as e:
-            return self.error_handler.handle_error('command_error', e)
+        if not command:
+            return command
+        return self.command_patterns.canonicalize(command, self.language_support.current_language)
     
     def get_help(self):
         """Get comprehensive help text"""
@@ -254,95 +267,209 @@ class JarvisAssistant:
         if self.language_support.set_language(language_code):
             lang_name = self.language_support.supported_languages[language_code]
             return self.language_support.get_template('language_changed', language=lang_name)
-        return "Language not supported"
+        return self.language_support.get_template('language_not_supported')
     
     def get_performance_stats(self):
         """Get performance statistics"""
         session_duration = datetime.now() - self.session_start_time
         
+        performance_report = self.performance_optimizer.get_performance_report()
+        performance_report['translation_cache'] = self.language_support.translation_cache.get_stats()
+        performance_report['translation_service'] = self.language_support.translator.get_stats()
+        performance_report['intent_cache'] = self.intents.get_cache_stats()
+        performance_report['prefetch'] = self.prefetcher.get_stats()
+        performance_report['imports'] = self.get_import_report()
+        performance_report['warm_state'] = self.warm_state.get_stats()
+        performance_report['instrumentation'] = self.get_instrumentation_report(limit=20)
+        
         stats = {
             'session_duration': str(session_duration),
             'commands_processed': self.command_count,
             'current_language': self.language_support.get_current_language_info(),
-            'performance_report': self.performance_optimizer.get_performance_report(),
+            'performance_report': performance_report,
             'error_stats': self.error_handler.get_error_stats()
         }
         
         return stats
     
+    def is_busy(self):
+        """Whether a command is running or an answer is being spoken"""
+        return self.active_commands > 0 or self.language_support.is_speaking
+    
+    def preload_intent(self, name):
+        """Fill a cached intent's entry ahead of its first request"""
+        with scope(Deadline()):
+            self.intents.prefetch(self, name, self.language_support.current_language)
+    
+    def register_warm_state(self):
+        """Sections of the warm state owned by the assistant itself (the voice map belongs to LanguageSupport)"""
+        self.warm_state.register('noise_floor', noise_floor.snapshot, noise_floor.restore)
+        self.warm_state.register(
+            'location', lambda: getattr(self, '_current_location', None), self.restore_location,
+            config.warm_state_location_max_age
+        )
+        self.warm_state.register('geocodes', self.capture_geocodes, self.restore_geocodes)
+    
+    def restore_location(self, city):
+        if not isinstance(city, str) or not city:
+            raise ValueError(f"invalid city {city!r}")
+        self._current_location = city
+    
+    def capture_geocodes(self):
+        """The most recently resolved places, within config.warm_state_max_geocodes"""
+        # A copy: loc() adds places from worker threads while this runs on the autosave thread
+        places = list(self.geocodes.items())
+        newest = sorted(places, key=lambda item: -item[1]['resolved_at'])
+        return dict(newest[:config.warm_state_max_geocodes]) or None
+    
+    def restore_geocodes(self, geocodes):
+        """Keep the places resolved recently enough; each ages out on its own"""
+        oldest = time.time() - config.warm_state_geocodes_max_age
+        for place, entry in geocodes.items():
+            if entry['resolved_at'] >= oldest and len(entry['latlng']) == 2 and isinstance(entry['address'], dict):
+                self.geocodes[place] = entry
+    
+    def save_warm_state(self):
+        """Snapshot what this run has learned, so the next start on this machine skips rediscovering it"""
+        self.language_support.translation_cache.save_cache()  # translations keep their own file
+        return self.warm_state.save()
+    
+    def get_instrumentation_report(self, limit=None):
+        """Calls, errors, in-flight calls and latency percentiles of every instrumented function, costliest first"""
+        return instrumentation.get_stats(limit)
+    
+    def set_instrumentation(self, enabled):
+        """Switch per-function timing on or off; while off each wrapped call only checks a flag"""
+        if enabled:
+            instrumentation.enable()
+        else:
+            instrumentation.disable()
+        return instrumentation.enabled
+    
+    def get_import_report(self):
+        """How long each feature module took to import on first use, and which this session never needed"""
+        return import_report()
+    
     def get_context_suggestions(self, current_input=""):
-        """Get context-aware suggestions"""
-        return self.context_processor.get_context_suggestions(current_input)
+        """Get context-aware suggestions, led by the known commands closest to the input"""
+        suggestions = self.intents.suggest(current_input, config.fuzzy_suggestion_count) if current_input else []
+        return suggestions + self.context_processor.get_context_suggestions(current_input)
     
     def cleanup(self):
         """Clean up resources when shutting down"""
+        self.warm_state.stop()
+        if config.warm_state_enabled:
+            self.warm_state.save()
         self.performance_optimizer.cleanup()
+        self.language_support.cleanup()
         print("👋 JARVIS Enhanced Assistant shutting down gracefully...")
     
-    def process_command_intelligently(self, command):
+    def process_command_intelligently(self, command, on_part=None, deadline=None):
         """
         Main intelligent command processing with all enhancements
+        :param on_part: called with each answer as soon as it is ready, so speech can start before the rest is done
+        :param deadline: Deadline bounding the command, config.command_deadline from now if omitted
+        """
+        self.last_intent, response = self.handle_command(command, on_part, deadline)
+        return response
+    
+    def handle_command(self, command, on_part=None, deadline=None):
+        """
+        Process a command without touching per-session state, so several can run at once
+        Its HTTP calls, worker-pool waits and speech are bounded by the deadline
+        :return: (intent name or None, response)
         """
         if not command:
-            return self.error_handler.handle_error('voice_error')
+            return None, self.error_handler.handle_error('voice_error')
         
-        command = command.lower().strip()
-        
-        # Check for help request
-        if command in ['help', 'what can you do', 'commands']:
-            return self.get_help()
+        with self.active_lock:
+            self.active_commands += 1
+        try:
+            with scope(deadline or Deadline()), tracer.trace('command', command=command):
+                return self.run_command(command, on_part)
+        finally:
+            with self.active_lock:
+                self.active_commands -= 1
+    
+    def run_command(self, command, on_part=None):
+        """handle_command under the current deadline"""
+        command = self.canonicalize_command(command)
         
-        # Check for enhanced commands first
-        enhanced_response = self.process_enhanced_command(command)
-        if enhanced_response:
-            return enhanced_response
+        parts = self.intents.split(command)
+        if len(parts) > 1:
+            return self.process_compound_command(parts, on_part)
         
-        # Traditional command processing with enhanced error handling
         try:
-            # Date command
-            if 'date' in command:
-                result = self.tell_me_date()
-                if self.language_support.current_language != 'en':
-                    result = self.language_support.translate_text(result, self.language_support.current_language)
-                return result
-            
-            # Time command
-            elif 'time' in command:
-                result = self.tell_time()
-                template = self.language_support.get_template('time_response', time=result)
-                return template
-            
-            # Weather command
-            elif 'weather' in command:
-                # Extract city from command
-                words = command.split()
-                city = words[-1] if len(words) > 1 else "London"
-                return self.weather(city)
-            
-            # Wikipedia command
-            elif 'tell me about' in command:
-                topic = command.replace('tell me about', '').strip()
-                result = self.tell_me(topic)
-                if result and self.language_support.current_language != 'en':
-                    result = self.language_support.translate_text(result, self.language_support.current_language)
-                return result or self.language_support.get_template('not_found')
-            
-            # News command
-            elif any(word in command for word in ['news', 'headlines', 'buzzing']):
-                news_result = self.news()
-                if news_result:
-                    headlines = [article['title'] for article in news_result[:3]]  # Top 3 headlines
-                    result = "Top headlines: " + ". ".join(headlines)
-                    if self.language_support.current_language != 'en':
-                        result = self.language_support.translate_text(result, self.language_support.current_language)
-                    return result
-                return self.error_handler.handle_error('api_error')
+            intent, response = self.dispatch_command(command)
             
             # Default response for unrecognized commands
-            else:
-                return self.error_handler.handle_error('command_error')
-                
+            if intent is None:
+                return None, self.error_handler.handle_error('command_error')
+            
+            self.context_processor.add_to_history(command, response)
+            if on_part and response:
+                on_part(response)
+            return intent, response
+        
+        except DeadlineExceeded as e:
+            return None, self.error_handler.handle_error('timeout_error', e, 'command_processing')
         except Exception as e:
-            return self.error_handler.handle_error('system_error', e, 'command_processing')
+            return None, self.error_handler.handle_error('system_error', e, 'command_processing')
     
-    # =================== LEGACY METHODS (UPDATED) ===================
\ No newline at end of file
+    def dispatch_command(self, command):
+        """Run one command through the intent registry: (intent name, response)"""
+        intent, response = self.intents.dispatch(self, command, self.language_support.current_language)
+        if intent is not None:
+            print(f"🎯 Processing {intent} command: {command}")
+            self.predictor.observe(intent)
+        return intent, response
+    
+    def process_compound_command(self, parts, on_part=None):
+        """
+        Run the commands of a compound utterance together on the worker pool
+        Answers are merged in utterance order; each is handed to on_part as soon as it and those before it are ready
+        Parts still running when the deadline passes are cancelled and answered with a timeout message
+        :return: (intent name of the last part, merged response)
+        """
+        print(f"🧩 Compound command: {' | '.join(parts)}")
+        thread_pool = self.performance_optimizer.thread_pool
+        
+        if self.intents.runs_concurrently(parts):
+            compound_id = next(_compound_ids)
+            task_ids = [f"part_{compound_id}_{index}" for index in range(len(parts))]
+            for task_id, part in zip(task_ids, parts):
+                thread_pool.submit_task(task_id, self.dispatch_command, part)
+            results = (lambda task_id=task_id: thread_pool.get_task_result(task_id) for task_id in task_ids)
+        else:
+            # A part holds a dialog with the user, so the parts take turns
+            results = (lambda part=part: self.dispatch_command(part) for part in parts)
+        
+        intents, responses = [], []
+        for part, result in zip(parts, results):
+            try:
+                intent, response = result()
+                if intent is None:
+                    response = self.error_handler.handle_error('command_error')
+            except DeadlineExceeded as e:
+                deadline = current()
+                if deadline is not None:
+                    deadline.cancel()  # the parts still running stop at their next HTTP call
+                intent, response = None, self.error_handler.handle_error('timeout_error', e, 'command_processing')
+            except Exception as e:
+                intent, response = None, self.error_handler.handle_error('system_error', e, 'command_processing')
+            
+            intents.append(intent)
+            if response:
+                response = str(response)
+                responses.append(response if response.rstrip()[-1:] in '.!?' else f"{response}.")
+                self.context_processor.add_to_history(part, response)
+                if on_part:
+                    on_part(response)
+        
+        return intents[-1], ' '.join(responses)
+    
+    # =================== LEGACY METHODS (UPDATED) ===================
+
+
+# JarvisAssistant's methods are timed like the feature modules' functions
+instrumentation.instrument_class(JarvisAssistant)
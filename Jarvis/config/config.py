@@ -25,11 +25,42 @@ google_calendar_credentials = "<path_to_credentials.json>"
 default_language = "en"  # English
 speech_rate = 175  # Words per minute
 speech_volume = 0.9  # 0.0 to 1.0
+tts_engine_pool_size = 3  # Pre-configured TTS engines kept for recently used languages
 
 # Performance Configuration
 cache_enabled = True
 cache_duration_hours = 1
 max_cache_size = 100
+translation_cache_size = 500  # Translated phrases kept in the LRU cache
+translation_cache_ttl_hours = 168  # Translations older than a week are refetched
+translation_timeout = 3.0  # Seconds a single translation may take before English is used
+translation_pool_size = 4  # Concurrent translation requests (each worker keeps its own connections)
+translation_breaker_failures = 3  # Consecutive failures before translation is switched off
+translation_breaker_reset = 30  # Seconds between background probes while switched off
+command_deadline = 10  # Seconds a command may take, including its HTTP calls; overrunning work is cancelled
+http_timeout = 5  # Longest single HTTP request, shortened to what is left of the command's deadline
+speech_timeout = 30  # Longest a single answer may be spoken
+tracing_enabled = False  # Write a latency trace of every utterance/command (also on with JARVIS_TRACE=1)
+tracing_file = "/tmp/jarvis_cache/traces.jsonl"  # One JSON trace per line
+tracing_max_bytes = 5 * 1024 * 1024  # The trace file is rotated at this size
+tracing_backups = 3  # Rotated trace files kept
+warmup_idle_wait = 30  # Seconds optional warmup (preloads, cache compaction) waits for an idle moment before it is skipped
+warmup_max_load = 0.75  # Load average per CPU above which optional warmup holds off
+warmup_preload_intents = ["weather", "news"]  # Cached intents fetched at startup once the assistant is idle
+warm_state_enabled = True  # Save warmed-up state (noise floor, voice map, location, geocodes) for the next start
+warm_state_file = "/tmp/jarvis_cache/warm_state.json"
+warm_state_interval = 300  # Seconds between periodic snapshots, besides the one taken at shutdown
+warm_state_max_age_hours = 72  # Snapshots older than this are ignored
+warm_state_voices_max_age = 7 * 24 * 3600  # Seconds a saved TTS voice map is trusted
+warm_state_location_max_age = 6 * 3600  # Seconds a saved current location is trusted (laptops move)
+warm_state_geocodes_max_age = 30 * 24 * 3600  # Seconds a resolved place is kept
+warm_state_max_geocodes = 200  # Places kept in the geocode cache
+
+# Command Server Configuration (jarvis_server.py / jarvis_client.py)
+server_socket_path = "/tmp/jarvis.sock"  # Unix socket; set to None to listen on localhost TCP instead
+server_host = "127.0.0.1"
+server_port = 8765
+server_workers = 8  # Commands processed at the same time
 
 # GUI Configuration
 default_theme = "dark"  # "dark" or "light"
@@ -37,11 +68,17 @@ window_width = 1400
 window_height = 900
 
 # Voice Recognition Configuration
-energy_threshold = 4000
+energy_threshold = 4000  # Floor; a noisier room raises it to the measured ambient level
+noise_floor_max_age = 600  # Seconds a measured ambient level is reused before listening measures it again
 pause_threshold = 0.8
 phrase_threshold = 0.3
 timeout_duration = 5
 
+# Barge-in Configuration (interrupt speech by talking over it)
+barge_in_enabled = True
+barge_in_energy_ratio = 1.5  # Multiple of energy_threshold needed while JARVIS is speaking
+barge_in_min_speech_ms = 200  # Sustained speech required before playback is cut
+
 # Smart Home Configuration (placeholder for future use)
 smart_home_enabled = False
 smart_home_api_key = "<your_smart_home_api_key>"
@@ -50,4 +87,19 @@ smart_home_api_key = "<your_smart_home_api_key>"
 context_awareness = True
 multi_language_support = True
 performance_monitoring = True
+latency_window = 1024  # Recent samples per operation used for response time percentiles
+latency_rate_window = 60  # Seconds over which each operation's rate is reported
+instrumentation_enabled = False  # Time entry-point feature functions and JarvisAssistant methods (toggle with set_instrumentation)
+instrumentation_modules = [  # Feature modules whose public functions are wrapped; keep per-call helpers out
+    "intent_handlers", "weather", "news", "wikipedia", "loc", "google_search", "google_calendar", "send_email",
+    "youtube_search", "website_open", "launch_app", "note", "system_stats", "date_time"
+]
 command_history_size = 50
+fuzzy_match_threshold = 0.5  # Similarity (0-1) above which a misheard command runs its closest intent
+fuzzy_suggestion_count = 3  # Closest commands offered when nothing is close enough
+
+# Speculative Prefetch (likely next commands are fetched while JARVIS is speaking)
+prefetch_enabled = True
+prefetch_top_k = 2  # Predicted intents considered after each answer
+prefetch_min_probability = 0.2  # Skip predictions less likely than this
+prefetch_budget_per_hour = 30  # Most prefetches (network calls) per rolling hour
@@ -0,0 +1,153 @@
+"""
+Response cache policies for JARVIS intents
+An intent declares how its answers may be reused; the dispatcher looks up, stores and refreshes them uniformly
+"""
+
+import time
+import threading
+from collections import OrderedDict
+
+FRESH = 'fresh'
+STALE = 'stale'
+MISS = 'miss'
+
+
+class CachePolicy:
+    """How long an intent's responses may be reused, and what else they depend on besides the slots"""
+
+    def __init__(self, ttl, stale_ttl=0, per_language=True, per_location=False):
+        self.ttl = ttl  # seconds a response is fresh
+        self.stale_ttl = stale_ttl  # further seconds it may still be served while a refresh runs in the background
+        self.per_language = per_language  # answers are spoken in the current language
+        self.per_location = per_location  # answers depend on where the user is
+
+    def key(self, name, slots, language=None, location=None):
+        """Cache key of one response"""
+        return (
+            name,
+            language if self.per_language else None,
+            location if self.per_location else None,
+            tuple(sorted(slots.items()))
+        )
+
+    def state(self, age):
+        """Whether a response of this age is fresh, stale (servable while refreshing) or unusable"""
+        if age < self.ttl:
+            return FRESH
+        if age < self.ttl + self.stale_ttl:
+            return STALE
+        return MISS
+
+
+def ttl(seconds, per_language=True, per_location=False):
+    """Reuse responses for a fixed time"""
+    return CachePolicy(seconds, 0, per_language, per_location)
+
+
+def stale_while_revalidate(fresh, stale, per_language=True, per_location=False):
+    """Reuse responses while fresh; after that, answer from the stale copy at once and refresh it in the background"""
+    return CachePolicy(fresh, stale, per_language, per_location)
+
+
+class ResponseCache:
+    """Cached intent responses with per-intent hit rates and prefetch bookkeeping"""
+
+    def __init__(self, max_entries=512):
+        self.entries = OrderedDict()  # key -> (response, stored at, policy), oldest first
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.refreshing = set()
+        self.stats = {}  # intent -> counters
+        self.prefetched = {}  # key -> time, prefetched and not used yet
+        self.prefetch_stats = {'issued': 0, 'hits': 0, 'wasted': 0}
+
+    def _count(self, name, counter):
+        counters = self.stats.setdefault(name, {'hits': 0, 'stale_hits': 0, 'misses': 0, 'stores': 0, 'refreshes': 0})
+        counters[counter] += 1
+
+    def peek(self, key):
+        """State of an entry without counting a lookup"""
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry is None:
+            return MISS
+        return entry[2].state(time.time() - entry[1])
+
+    def lookup(self, name, key):
+        """
+        Find a response
+        :return: (FRESH or STALE, response), or (MISS, None)
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            state = MISS if entry is None else entry[2].state(time.time() - entry[1])
+            self._count(name, {FRESH: 'hits', STALE: 'stale_hits', MISS: 'misses'}[state])
+            if state == MISS:
+                return MISS, None
+            if self.prefetched.pop(key, None) is not None:
+                self.prefetch_stats['hits'] += 1
+        return state, entry[0]
+
+    def store(self, name, key, response, policy, prefetched=False):
+        """Cache a response under its key"""
+        with self.lock:
+            self.entries[key] = (response, time.time(), policy)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+            self._count(name, 'stores')
+            if prefetched:
+                if key in self.prefetched:
+                    self.prefetch_stats['wasted'] += 1  # an earlier prefetch of this entry expired unused
+                self.prefetched[key] = time.time()
+                self.prefetch_stats['issued'] += 1
+
+    def record_failed_prefetch(self):
+        """A prefetch whose handler failed: it used the budget and nothing came of it"""
+        with self.lock:
+            self.prefetch_stats['issued'] += 1
+            self.prefetch_stats['wasted'] += 1
+
+    def begin_refresh(self, name, key):
+        """Claim the background refresh of a stale entry; False if one is already running"""
+        with self.lock:
+            if key in self.refreshing:
+                return False
+            self.refreshing.add(key)
+            self._count(name, 'refreshes')
+            return True
+
+    def end_refresh(self, key):
+        with self.lock:
+            self.refreshing.discard(key)
+
+    def invalidate(self, name=None):
+        """Drop the cached responses of one intent, or all of them"""
+        with self.lock:
+            for key in [key for key in self.entries if name is None or key[0] == name]:
+                del self.entries[key]
+                self.prefetched.pop(key, None)
+
+    def get_stats(self):
+        """Lookups of each intent and the share answered from the cache"""
+        with self.lock:
+            stats = {name: dict(counters) for name, counters in self.stats.items()}
+            size = len(self.entries)
+        for counters in stats.values():
+            lookups = counters['hits'] + counters['stale_hits'] + counters['misses']
+            counters['hit_rate'] = round((counters['hits'] + counters['stale_hits']) / lookups, 3) if lookups else None
+        return {'entries': size, 'intents': stats}
+
+    def get_prefetch_stats(self):
+        """Prefetches issued, used (hits), expired unused (wasted) and still waiting"""
+        now = time.time()
+        with self.lock:
+            for key, fetched_at in list(self.prefetched.items()):
+                entry = self.entries.get(key)
+                if entry is None or entry[2].state(now - fetched_at) == MISS:
+                    del self.prefetched[key]
+                    self.prefetch_stats['wasted'] += 1
+            stats = dict(self.prefetch_stats, pending=len(self.prefetched))
+        settled = stats['hits'] + stats['wasted']
+        stats['hit_rate'] = round(stats['hits'] / settled, 3) if settled else None
+        return stats
@@ -0,0 +1,151 @@
+"""
+Offline response catalogs for JARVIS
+Per-language templates, error messages and command patterns, built ahead of time and loaded on first use
+
+Build or refresh the catalogs (fills in missing entries only, reviewed ones are kept):
+    python -m Jarvis.features.catalogs [language_code ...]
+"""
+
+import os
+import re
+import json
+import threading
+from collections.abc import Mapping
+
+CATALOG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'utils', 'catalogs')
+SOURCE_LANGUAGE = 'en'
+CATALOG_SECTIONS = ('templates', 'errors', 'patterns')
+
+PLACEHOLDER_RE = re.compile(r'\{(\w+)\}')
+PROTECTED_RE = re.compile(r'\[\[(\d+)\]\]')
+
+_catalogs = {}
+_catalog_lock = threading.Lock()
+
+
+def catalog_path(language_code):
+    """Path of the on-disk catalog for a language"""
+    return os.path.join(CATALOG_DIR, f"{language_code}.json")
+
+
+def load_catalog(language_code):
+    """Load a language catalog the first time it is needed ({} if it was never built)"""
+    with _catalog_lock:
+        if language_code not in _catalogs:
+            try:
+                with open(catalog_path(language_code), 'r', encoding='utf-8') as f:
+                    _catalogs[language_code] = json.load(f)
+            except FileNotFoundError:
+                _catalogs[language_code] = {}
+            except Exception as e:
+                print(f"Error loading {language_code} catalog: {e}")
+                _catalogs[language_code] = {}
+        return _catalogs[language_code]
+
+
+def save_catalog(language_code, catalog):
+    """Write a catalog in the compact on-disk format"""
+    os.makedirs(CATALOG_DIR, exist_ok=True)
+    with open(catalog_path(language_code), 'w', encoding='utf-8') as f:
+        json.dump(catalog, f, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+        f.write('\n')
+    with _catalog_lock:
+        _catalogs[language_code] = catalog
+
+
+def available_languages():
+    """Languages that have a catalog on disk"""
+    try:
+        return sorted(name[:-len('.json')] for name in os.listdir(CATALOG_DIR) if name.endswith('.json'))
+    except FileNotFoundError:
+        return []
+
+
+def lookup(section, language_code, key):
+    """Look up a catalog entry, falling back to the English source"""
+    entries = load_catalog(language_code).get(section, {})
+    if key in entries:
+        return entries[key]
+    return load_catalog(SOURCE_LANGUAGE).get(section, {}).get(key)
+
+
+class CatalogView(Mapping):
+    """Read-only {language: {key: text}} view of one catalog section"""
+
+    def __init__(self, section):
+        self.section = section
+
+    def __getitem__(self, language_code):
+        entries = load_catalog(language_code).get(self.section)
+        if not entries:
+            raise KeyError(language_code)
+        return entries
+
+    def __iter__(self):
+        return iter(available_languages())
+
+    def __len__(self):
+        return len(available_languages())
+
+
+def _protect_placeholders(text):
+    """Swap {name} placeholders for numbered tokens that translation leaves alone"""
+    names = PLACEHOLDER_RE.findall(text)
+    for index, name in enumerate(names):
+        text = text.replace('{' + name + '}', f'[[{index}]]', 1)
+    return text, names
+
+
+def _restore_placeholders(text, names):
+    """Put the placeholders back, or None if the translation lost one"""
+    if sorted(int(i) for i in PROTECTED_RE.findall(text)) != list(range(len(names))):
+        return None
+    return PROTECTED_RE.sub(lambda match: '{' + names[int(match.group(1))] + '}', text)
+
+
+def build_catalogs(language_codes, translate_many):
+    """
+    Fill in missing catalog entries for each language from the English source
+    translate_many(texts, target_lang, source_lang) does the translation in one batch per language
+    """
+    source = load_catalog(SOURCE_LANGUAGE)
+
+    for code in language_codes:
+        if code == SOURCE_LANGUAGE:
+            continue
+
+        existing = load_catalog(code)
+        catalog = {section: dict(existing.get(section, {})) for section in CATALOG_SECTIONS}
+        missing = [
+            (section, key)
+            for section in CATALOG_SECTIONS
+            for key in source.get(section, {})
+            if key not in catalog[section]
+        ]
+
+        if not missing:
+            print(f"✅ {code}: catalog up to date")
+            continue
+
+        protected = [_protect_placeholders(source[section][key]) for section, key in missing]
+        translations = translate_many([text for text, _ in protected], code, SOURCE_LANGUAGE)
+
+        added = 0
+        for (section, key), (text, names), translated in zip(missing, protected, translations):
+            restored = _restore_placeholders(translated, names)
+            if restored is None or translated == text:
+                print(f"⚠️ {code}: could not translate {section}.{key}, English will be used")
+                continue
+            catalog[section][key] = restored
+            added += 1
+
+        save_catalog(code, catalog)
+        print(f"📦 {code}: added {added} of {len(missing)} missing entries")
+
+
+if __name__ == "__main__":
+    import sys
+    from Jarvis.features.language_support import LanguageSupport
+
+    language_support = LanguageSupport()
+    build_catalogs(sys.argv[1:] or list(language_support.supported_languages), language_support.translate_many)
@@ -0,0 +1,81 @@
+"""
+Native-language command patterns for JARVIS
+Matches commands against the per-language 'patterns' catalog section and rewrites them to the English command they stand for
+"""
+
+import threading
+import unicodedata
+
+from Jarvis.features.catalogs import SOURCE_LANGUAGE, load_catalog
+from Jarvis.features.command_router import CommandRouter
+from Jarvis.features.language_detection import detect_script_language
+
+
+def normalize_command(text):
+    """Lowercase, NFC-normalize and collapse whitespace so spoken input and catalog phrases compare equal"""
+    return ' '.join(unicodedata.normalize('NFC', text).lower().split())
+
+
+class PatternTable:
+    """One language's phrases compiled into a single automaton"""
+
+    def __init__(self, language_code, patterns, english_patterns):
+        self.language_code = language_code
+        self.router = CommandRouter()
+
+        for key, variants in patterns.items():
+            english = english_patterns.get(key)
+            if not english:
+                continue
+            for phrase in ([variants] if isinstance(variants, str) else variants):
+                phrase = normalize_command(phrase)
+                if phrase and phrase != english:
+                    self.router.add(phrase, english, whole_word=True)
+
+        self.router.compile()
+
+    def canonicalize(self, command):
+        """Replace every native phrase with its English pattern (a single left-to-right scan)"""
+        parts = []
+        position = 0
+        for start, end, english, _ in self.router.segments(command):
+            parts.extend((command[position:start], english))
+            position = end
+        parts.append(command[position:])
+        return ' '.join(' '.join(parts).split())
+
+
+class CommandPatterns:
+    """Per-language pattern tables, built the first time a language is seen"""
+
+    def __init__(self):
+        self.tables = {}
+        self.lock = threading.Lock()
+
+    def get_table(self, language_code):
+        """Get the compiled table for a language (None for English or an unknown language)"""
+        if not language_code or language_code == SOURCE_LANGUAGE:
+            return None
+
+        with self.lock:
+            if language_code not in self.tables:
+                patterns = load_catalog(language_code).get('patterns', {})
+                english_patterns = load_catalog(SOURCE_LANGUAGE).get('patterns', {})
+                self.tables[language_code] = PatternTable(language_code, patterns, english_patterns) if patterns else None
+            return self.tables[language_code]
+
+    def candidate_languages(self, command, language_code):
+        """The active language plus whatever the command's script says, without duplicates"""
+        return [code for code in dict.fromkeys((language_code, detect_script_language(command))) if code]
+
+    def canonicalize(self, command, language_code):
+        """Rewrite a native-language command into the English command the handlers understand"""
+        if not command:
+            return command
+
+        command = normalize_command(command)
+        for code in self.candidate_languages(command, language_code):
+            table = self.get_table(code)
+            if table is not None:
+                command = table.canonicalize(command)
+        return command
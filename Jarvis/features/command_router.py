@@ -0,0 +1,152 @@
+"""
+Compiled command routing for JARVIS
+All command patterns go into one Aho-Corasick automaton, so an utterance is scanned once no matter how many patterns exist
+"""
+
+from collections import deque
+
+
+def is_spaced_letter(char):
+    """Latin and Cyrillic letters, the scripts where a pattern must not match inside a longer word"""
+    return char.isalpha() and ord(char) < 0x0530
+
+
+class AhoCorasick:
+    """Multi-pattern string automaton: finds every occurrence of every pattern in one pass"""
+
+    def __init__(self):
+        self.goto = [{}]
+        self.fail = [0]
+        self.patterns = [()]  # (length, value) of patterns ending exactly at each state
+        self.outputs = [()]  # patterns ending at each state, suffix matches included
+        self.compiled = True
+
+    def add(self, pattern, value):
+        """Add a pattern; value is reported with each of its matches"""
+        state = 0
+        for char in pattern:
+            next_state = self.goto[state].get(char)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto[state][char] = next_state
+                self.goto.append({})
+                self.fail.append(0)
+                self.patterns.append(())
+            state = next_state
+        self.patterns[state] += ((len(pattern), value),)
+        self.compiled = False
+
+    def compile(self):
+        """Build the failure links breadth-first so each state also reports its suffix matches"""
+        self.outputs = list(self.patterns)
+        queue = deque(self.goto[0].values())
+        for state in queue:
+            self.fail[state] = 0
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(char, 0)
+                self.outputs[next_state] += self.outputs[self.fail[next_state]]
+
+        self.compiled = True
+
+    def iter_matches(self, text):
+        """Yield (start, end, value) for every pattern occurrence, overlapping ones included"""
+        if not self.compiled:
+            self.compile()
+
+        goto, fail, outputs = self.goto, self.fail, self.outputs
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length, value in outputs[state]:
+                yield index - length + 1, index + 1, value
+
+
+class CommandRouter:
+    """
+    Routes text to targets registered against patterns
+    When several patterns match, the most specific wins: longest match, then priority, then earliest position
+    """
+
+    def __init__(self):
+        self.automaton = AhoCorasick()
+        self.routes = []  # (pattern, target, priority, whole_word)
+
+    def __len__(self):
+        return len(self.routes)
+
+    def add(self, pattern, target, priority=0, whole_word=False):
+        """
+        Register a pattern for a target
+        whole_word keeps Latin/Cyrillic patterns from matching inside longer words
+        """
+        pattern = pattern.lower()
+        if not pattern:
+            return
+        self.automaton.add(pattern, len(self.routes))
+        self.routes.append((pattern, target, priority, whole_word))
+
+    def compile(self):
+        """Build the automaton now instead of on the first match"""
+        self.automaton.compile()
+
+    def _on_word_boundary(self, text, start, end, pattern):
+        """Whether a whole-word match is not glued to letters on either side"""
+        if is_spaced_letter(pattern[0]) and start > 0 and text[start - 1].isalnum():
+            return False
+        if is_spaced_letter(pattern[-1]) and end < len(text) and text[end].isalnum():
+            return False
+        return True
+
+    def iter_matches(self, text):
+        """Yield (start, end, route) for every valid match in lowercased text"""
+        for start, end, index in self.automaton.iter_matches(text):
+            route = self.routes[index]
+            if route[3] and not self._on_word_boundary(text, start, end, route[0]):
+                continue
+            yield start, end, route
+
+    def match(self, text):
+        """Find the most specific match: (target, pattern), or (None, None)"""
+        best = None
+        best_rank = None
+        for start, end, route in self.iter_matches(text.lower()):
+            # Tuple comparison: longer match, then higher priority, then earlier start
+            rank = (end - start, route[2], -start)
+            if best_rank is None or rank > best_rank:
+                best, best_rank = route, rank
+
+        if best is None:
+            return None, None
+        return best[1], best[0]
+
+    def ranked(self, text):
+        """Every match as (target, pattern), most specific first"""
+        matches = sorted(
+            (((end - start, route[2], -start), route) for start, end, route in self.iter_matches(text.lower())),
+            key=lambda item: item[0], reverse=True
+        )
+        return [(route[1], route[0]) for _, route in matches]
+
+    def segments(self, text):
+        """Non-overlapping matches chosen leftmost-longest, as (start, end, target, pattern)"""
+        candidates = sorted(
+            ((start, end, route) for start, end, route in self.iter_matches(text.lower())),
+            key=lambda item: (item[0], -(item[1] - item[0]), -item[2][2])
+        )
+
+        chosen = []
+        position = 0
+        for start, end, route in candidates:
+            if start >= position:
+                chosen.append((start, end, route[1], route[0]))
+                position = end
+        return chosen
@@ -0,0 +1,212 @@
+"""
+Local command server for JARVIS
+One warmed JarvisAssistant shared by many clients over a Unix socket or localhost TCP, answers streamed back as they are ready
+"""
+
+import os
+import json
+import time
+import asyncio
+import ipaddress
+from concurrent.futures import ThreadPoolExecutor
+
+from Jarvis.features.deadline import Deadline
+
+# Protocol: newline-delimited JSON in both directions
+#   request  {"id": 1, "command": "what's the time and the weather", "timeout": 5}   or   {"id": 2, "type": "stats"}
+#   replies  {"id": 1, "type": "part", "text": "..."}                   one per answer, in utterance order
+#            {"id": 1, "type": "done", "intent": "...", "response": "...", "latency_ms": 12.3}
+#            {"id": 2, "type": "error", "error": "..."}
+# Requests on one connection may be pipelined; replies carry the request id
+# "timeout" (seconds, default config.command_deadline) bounds a command; a client that disconnects cancels its commands
+
+OVERRUN_GRACE = 0.5  # seconds past the deadline a command has to report its own timeout before the server does
+
+
+def is_loopback(host):
+    """Whether a TCP host only accepts connections from this machine; the protocol has no authentication"""
+    if host == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def encode(message):
+    """One protocol line"""
+    return (json.dumps(message, ensure_ascii=False, default=str) + '\n').encode('utf-8')
+
+
+class CommandServer:
+    """Serves text commands to a single JarvisAssistant"""
+
+    def __init__(self, assistant, socket_path=None, host='127.0.0.1', port=8765, max_workers=8):
+        if not socket_path and not is_loopback(host):
+            raise ValueError(f"refusing to serve commands on {host}: only loopback addresses are allowed")
+        self.assistant = assistant
+        self.socket_path = socket_path  # Unix socket if set, otherwise TCP on host:port
+        self.host = host
+        self.port = port
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='jarvis-command')
+        self.server = None
+        self.clients = 0
+        self.stats = {'connections': 0, 'commands': 0, 'errors': 0, 'timeouts': 0}
+
+    @property
+    def address(self):
+        return self.socket_path or f"{self.host}:{self.port}"
+
+    async def start(self):
+        """Start listening"""
+        if self.socket_path:
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)  # stale socket from a previous run
+            self.server = await asyncio.start_unix_server(self.handle_client, path=self.socket_path)
+        else:
+            self.server = await asyncio.start_server(self.handle_client, self.host, self.port)
+        print(f"🛰️ JARVIS command server listening on {self.address}")
+
+    async def serve_forever(self):
+        """Start and serve until cancelled"""
+        await self.start()
+        try:
+            async with self.server:
+                await self.server.serve_forever()
+        finally:
+            self.close()
+
+    def close(self):
+        """Stop accepting clients and release the worker threads"""
+        if self.server:
+            self.server.close()
+        self.executor.shutdown(wait=False)
+        if self.socket_path and os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    async def handle_client(self, reader, writer):
+        """Read requests from one client; each runs as its own task so slow commands don't block the next"""
+        self.clients += 1
+        self.stats['connections'] += 1
+        write_lock = asyncio.Lock()
+        tasks = set()
+        deadlines = set()  # commands of this client still running
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                task = asyncio.create_task(self.handle_request(line, writer, write_lock, deadlines))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            for deadline in list(deadlines):
+                deadline.cancel()  # nobody is left to answer
+        finally:
+            self.clients -= 1
+            writer.close()
+
+    async def send(self, writer, write_lock, message):
+        """Write one reply; replies of concurrent requests never interleave mid-line"""
+        async with write_lock:
+            writer.write(encode(message))
+            await writer.drain()
+
+    async def handle_request(self, line, writer, write_lock, deadlines=None):
+        """Answer one request"""
+        try:
+            request = json.loads(line)
+        except ValueError:
+            await self.send(writer, write_lock, {'type': 'error', 'error': 'invalid JSON'})
+            return
+
+        if not isinstance(request, dict):
+            await self.send(writer, write_lock, {'type': 'error', 'error': 'invalid request'})
+            return
+
+        request_id = request.get('id')
+        if request.get('type') == 'stats':
+            await self.send(writer, write_lock, {'id': request_id, 'type': 'stats', 'stats': self.get_stats()})
+            return
+
+        command = request.get('command') or ''
+        if not isinstance(command, str):
+            await self.send(writer, write_lock, {'id': request_id, 'type': 'error', 'error': 'invalid request'})
+            return
+        command = command.strip()
+        if not command:
+            await self.send(writer, write_lock, {'id': request_id, 'type': 'error', 'error': 'no command'})
+            return
+
+        try:
+            deadline = Deadline(float(request['timeout']) if request.get('timeout') else None)
+        except (TypeError, ValueError):
+            await self.send(writer, write_lock, {'id': request_id, 'type': 'error', 'error': 'invalid timeout'})
+            return
+        if deadlines is not None:
+            deadlines.add(deadline)
+
+        try:
+            await self.run_command(request_id, command, deadline, writer, write_lock)
+        except ConnectionError:
+            deadline.cancel()  # the client is gone
+        finally:
+            if deadlines is not None:
+                deadlines.discard(deadline)
+
+    async def run_command(self, request_id, command, deadline, writer, write_lock):
+        """Run a command on a worker, streaming its answers until it finishes or its deadline passes"""
+        loop = asyncio.get_running_loop()
+        parts = asyncio.Queue()
+
+        def on_part(text):
+            # Called on a worker thread as each answer is ready
+            loop.call_soon_threadsafe(parts.put_nowait, text)
+
+        started = time.perf_counter()
+        self.stats['commands'] += 1
+        future = loop.run_in_executor(self.executor, self.assistant.handle_command, command, on_part, deadline)
+
+        # Stream answers while the command is still running
+        while True:
+            next_part = asyncio.ensure_future(parts.get())
+            timeout = deadline.remaining() + (0 if deadline.cancelled.is_set() else OVERRUN_GRACE)
+            await asyncio.wait({next_part, future}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not next_part.done():
+                next_part.cancel()
+                if not future.done():
+                    # Overran: the handler stops at its next HTTP call or pool wait, nobody waits for it
+                    deadline.cancel()
+                    self.stats['timeouts'] += 1
+                    await self.send(writer, write_lock, {'id': request_id, 'type': 'error', 'error': 'timeout'})
+                    return
+                break
+            await self.send(writer, write_lock, {'id': request_id, 'type': 'part', 'text': next_part.result()})
+        while not parts.empty():
+            await self.send(writer, write_lock, {'id': request_id, 'type': 'part', 'text': parts.get_nowait()})
+
+        try:
+            intent, response = await future
+        except Exception as e:
+            self.stats['errors'] += 1
+            await self.send(writer, write_lock, {'id': request_id, 'type': 'error', 'error': str(e)})
+            return
+
+        await self.send(writer, write_lock, {
+            'id': request_id,
+            'type': 'done',
+            'intent': intent,
+            'response': response,
+            'latency_ms': round((time.perf_counter() - started) * 1e3, 3)
+        })
+
+    def get_stats(self):
+        """Server counters plus the assistant's own performance stats"""
+        return {
+            'address': self.address,
+            'clients': self.clients,
+            **self.stats,
+            'assistant': self.assistant.get_performance_stats()
+        }
@@ -1,13 +1,29 @@
 import datetime
 
+# Numeric dates in each language's usual order, so no month name has to be translated
+DATE_FORMATS = {
+    'de': "{day:02}.{month:02}.{year}",
+    'ru': "{day:02}.{month:02}.{year}",
+    'tr': "{day:02}.{month:02}.{year}",
+    'ja': "{year}年{month}月{day}日",
+    'zh': "{year}年{month}月{day}日",
+    'ko': "{year}년 {month}월 {day}일",
+}
+DEFAULT_DATE_FORMAT = "{day:02}/{month:02}/{year}"
 
-def date():
+
+def date(language_code='en'):
     """
     Just return date as string
+    :param language_code: English gets "Oct 19 2026", other languages a numeric date in their own order
     :return: date if success, False if fail
     """
     try:
-        date = datetime.datetime.now().strftime("%b %d %Y")
+        now = datetime.datetime.now()
+        if language_code == 'en':
+            date = now.strftime("%b %d %Y")
+        else:
+            date = DATE_FORMATS.get(language_code, DEFAULT_DATE_FORMAT).format(day=now.day, month=now.month, year=now.year)
     except Exception as e:
         print(e)
         date = False
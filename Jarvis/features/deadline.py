@@ -0,0 +1,109 @@
+"""
+Command deadlines for JARVIS
+Every command carries a deadline that bounds its HTTP calls, worker-pool waits and speech; cancelling it stops the work still in flight
+"""
+
+import time
+import threading
+import contextvars
+from contextlib import contextmanager
+
+from Jarvis.config import config
+
+_current = contextvars.ContextVar('jarvis_deadline', default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """A command ran out of time or was cancelled"""
+
+
+class Deadline:
+    """Point in time by which a command must finish, plus a flag to cancel it sooner"""
+
+    def __init__(self, seconds=None):
+        seconds = config.command_deadline if seconds is None else seconds
+        self.expires_at = time.monotonic() + seconds
+        self.cancelled = threading.Event()
+        self.callbacks = []  # run once on cancel, to stop work that can't check the deadline itself
+        self.lock = threading.Lock()
+
+    def remaining(self):
+        """Seconds left, 0 once expired or cancelled"""
+        if self.cancelled.is_set():
+            return 0.0
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self):
+        return self.remaining() <= 0
+
+    def check(self):
+        """Raise DeadlineExceeded if no time is left"""
+        if self.cancelled.is_set():
+            raise DeadlineExceeded("command cancelled")
+        if self.expired:
+            raise DeadlineExceeded("command deadline exceeded")
+
+    def timeout(self, cap=None):
+        """Timeout for one blocking call: the time left, at most cap; raises if none is left"""
+        self.check()
+        remaining = self.remaining()
+        return remaining if cap is None else min(remaining, cap)
+
+    def on_cancel(self, callback):
+        """Call callback when the deadline is cancelled (at once if it already was)"""
+        with self.lock:
+            if not self.cancelled.is_set():
+                self.callbacks.append(callback)
+                return
+        callback()
+
+    def cancel(self):
+        """Stop the command: later checks raise and registered work is told to stop"""
+        with self.lock:
+            if self.cancelled.is_set():
+                return
+            self.cancelled.set()
+            callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Cancel callback error: {e}")
+
+
+def current():
+    """Deadline of the command running on this thread, or None"""
+    return _current.get()
+
+
+@contextmanager
+def scope(deadline):
+    """Make a deadline current for the code inside the block"""
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+def time_left(cap=None):
+    """
+    Timeout for a blocking call under the current deadline, at most cap
+    Without a deadline the cap is returned unchanged; raises DeadlineExceeded if the deadline has passed
+    """
+    deadline = current()
+    if deadline is None:
+        return cap
+    return deadline.timeout(cap)
+
+
+def http_timeout():
+    """Timeout for one HTTP request: config.http_timeout, shortened to what is left of the command's deadline"""
+    return time_left(config.http_timeout)
+
+
+def run_with_context(func, *args, **kwargs):
+    """Callable that runs func on another thread with the caller's deadline still current"""
+    context = contextvars.copy_context()
+    return lambda: context.run(func, *args, **kwargs)
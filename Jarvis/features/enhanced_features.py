@@ -12,29 +12,32 @@ import threading
 import subprocess
 import webbrowser
 from datetime import datetime, timedelta
-import requests
-import psutil
-from PIL import Image
-import cv2
-import numpy as np
-import speech_recognition as sr
-from googletrans import Translator
 
-# Only import pyautogui if display is available
-try:
-    import pyautogui
-    PYAUTOGUI_AVAILABLE = True
-except Exception as e:
-    print(f"PyAutoGUI not available (headless environment): {e}")
-    PYAUTOGUI_AVAILABLE = False
-    # Mock pyautogui for headless environments
-    class MockPyAutoGUI:
-        def press(self, key): print(f"Mock key press: {key}")
-        def hotkey(self, *keys): print(f"Mock hotkey: {keys}")
-        def screenshot(self): print("Mock screenshot"); return None
-        def keyDown(self, key): print(f"Mock key down: {key}")
-        def keyUp(self, key): print(f"Mock key up: {key}")
-    pyautogui = MockPyAutoGUI()
+from Jarvis.features.catalogs import CatalogView, lookup
+from Jarvis.features.intents import COMMAND_CATEGORIES, build_registry
+from Jarvis.features.translation import get_translation_client
+
+class MockPyAutoGUI:
+    """Stand-in for pyautogui in headless environments"""
+    def press(self, key): print(f"Mock key press: {key}")
+    def hotkey(self, *keys): print(f"Mock hotkey: {keys}")
+    def screenshot(self): print("Mock screenshot"); return None
+    def keyDown(self, key): print(f"Mock key down: {key}")
+    def keyUp(self, key): print(f"Mock key up: {key}")
+
+_pyautogui = None
+
+def get_pyautogui():
+    """pyautogui, imported the first time a desktop command needs it; the mock if there is no display"""
+    global _pyautogui
+    if _pyautogui is None:
+        try:
+            import pyautogui
+            _pyautogui = pyautogui
+        except Exception as e:
+            print(f"PyAutoGUI not available (headless environment): {e}")
+            _pyautogui = MockPyAutoGUI()
+    return _pyautogui
 
 class EnhancedErrorHandler:
     """Enhanced error handling with user-friendly messages"""
@@ -43,44 +46,13 @@ class EnhancedErrorHandler:
         self.language_support = language_support
         self.error_log = []
         self.max_log_size = 100
+        self.thread_errors = threading.local()  # errors recorded on each thread, so callers can tell a failed answer
         
-        # Error messages in different languages
-        self.error_messages = {
-            'en': {
-                'network_error': "I'm having trouble connecting to the internet. Please check your connection.",
-                'api_error': "There was an issue with the service. Please try again later.",
-                'file_error': "I couldn't access the file. Please check if it exists and you have permission.",
-                'voice_error': "I couldn't understand what you said. Please speak clearly and try again.",
-                'command_error': "I don't recognize that command. Say 'help' to see what I can do.",
-                'system_error': "Something went wrong with the system. Please restart JARVIS.",
-                'timeout_error': "The operation took too long. Please try again.",
-                'permission_error': "I don't have permission to perform that action."
-            },
-            'hi': {
-                'network_error': "मुझे इंटरनेट से जुड़ने में समस्या हो रही है। कृपया अपना कनेक्शन जांचें।",
-                'api_error': "सेवा में कोई समस्या थी। कृपया बाद में पुनः प्रयास करें।",
-                'file_error': "मैं फ़ाइल को एक्सेस नहीं कर सका। कृपया जांचें कि यह मौजूद है और आपके पास अनुमति है।",
-                'voice_error': "मैं समझ नहीं सका कि आपने क्या कहा। कृपया स्पष्ट रूप से बोलें और पुनः प्रयास करें।",
-                'command_error': "मैं उस कमांड को नहीं पहचानता। 'help' कहें कि मैं क्या कर सकता हूं।",
-                'system_error': "सिस्टम में कुछ गड़बड़ हुई। कृपया JARVIS को रीस्टार्ट करें।",
-                'timeout_error': "ऑपरेशन में बहुत समय लगा। कृपया पुनः प्रयास करें।",
-                'permission_error': "मुझे वह क्रिया करने की अनुमति नहीं है।"
-            },
-            'ur': {
-                'network_error': "مجھے انٹرنیٹ سے جڑنے میں دشواری ہو رہی ہے۔ برائے کرم اپنا کنکشن چیک کریں۔",
-                'api_error': "سروس میں کوئی مسئلہ تھا۔ برائے کرم بعد میں دوبارہ کوشش کریں۔",
-                'file_error': "میں فائل تک رسائی نہیں کر سکا۔ برائے کرم چیک کریں کہ یہ موجود ہے اور آپ کے پاس اجازت ہے۔",
-                'voice_error': "میں سمجھ نہیں سکا کہ آپ نے کیا کہا۔ براہ کرم صاف بولیں اور دوبارہ کوشش کریں۔",
-                'command_error': "میں اس کمانڈ کو نہیں پہچانتا۔ 'help' کہیں کہ میں کیا کر سکتا ہوں۔",
-                'system_error': "سسٹم میں کچھ غلط ہوا۔ برائے کرم JARVIS کو دوبارہ شروع کریں۔",
-                'timeout_error': "آپریشن میں بہت وقت لگا۔ برائے کرم دوبارہ کوشش کریں۔",
-                'permission_error': "مجھے وہ عمل کرنے کی اجازت نہیں ہے۔"
-            }
-        }
+        # Error messages in different languages, loaded per language on first use
+        self.error_messages = CatalogView('errors')
     
-    def handle_error(self, error_type, exception=None, context=None):
-        """Handle errors with appropriate user messages"""
-        # Log the error
+    def record_error(self, error_type, exception=None, context=None):
+        """Log an error without producing a message, for callers that word their own"""
         error_entry = {
             'timestamp': datetime.now().isoformat(),
             'type': error_type,
@@ -89,10 +61,20 @@ class EnhancedErrorHandler:
         }
         
         self.error_log.append(error_entry)
+        self.thread_errors.count = self.errors_on_this_thread() + 1
         
         # Limit log size
         if len(self.error_log) > self.max_log_size:
             self.error_log.pop(0)
+    
+    def errors_on_this_thread(self):
+        """Errors recorded so far by the calling thread"""
+        return getattr(self.thread_errors, 'count', 0)
+    
+    def handle_error(self, error_type, exception=None, context=None):
+        """Handle errors with appropriate user messages"""
+        # Log the error
+        self.record_error(error_type, exception, context)
         
         # Get appropriate language
         current_lang = 'en'
@@ -100,8 +82,9 @@ class EnhancedErrorHandler:
             current_lang = self.language_support.current_language
         
         # Get error message
-        messages = self.error_messages.get(current_lang, self.error_messages['en'])
-        error_message = messages.get(error_type, messages['system_error'])
+        error_message = lookup('errors', current_lang, error_type)
+        if error_message is None:
+            error_message = lookup('errors', current_lang, 'system_error')
         
         print(f"ERROR: {error_message}")
         return error_message
@@ -123,92 +106,15 @@ class EnhancedVoiceCommands:
     
     def __init__(self, error_handler=None):
         self.error_handler = error_handler
-        self.translator = Translator()
-        
-        # Extended command patterns
-        self.command_patterns = {
-            'system_control': {
-                'patterns': [
-                    'shutdown', 'restart', 'sleep', 'hibernate', 'lock screen',
-                    'show desktop', 'task manager', 'control panel'
-                ],
-                'function': self.handle_system_control
-            },
-            'media_control': {
-                'patterns': [
-                    'play music', 'pause music', 'stop music', 'next song', 'previous song',
-                    'volume up', 'volume down', 'mute', 'unmute'
-                ],
-                'function': self.handle_media_control
-            },
-            'web_search': {
-                'patterns': [
-                    'search for', 'google', 'youtube search', 'wikipedia search',
-                    'find information about', 'look up'
-                ],
-                'function': self.handle_web_search
-            },
-            'file_operations': {
-                'patterns': [
-                    'open file', 'create file', 'delete file', 'copy file',
-                    'move file', 'rename file', 'show files'
-                ],
-                'function': self.handle_file_operations
-            },
-            'productivity': {
-                'patterns': [
-                    'set reminder', 'set alarm', 'schedule meeting',
-                    'create task', 'add to calendar', 'take note'
-                ],
-                'function': self.handle_productivity
-            },
-            'entertainment': {
-                'patterns': [
-                    'tell joke', 'play game', 'random fact', 'quote of the day',
-                    'riddle', 'story', 'poem'
-                ],
-                'function': self.handle_entertainment
-            },
-            'smart_home': {
-                'patterns': [
-                    'turn on lights', 'turn off lights', 'set temperature',
-                    'close blinds', 'open blinds', 'lock doors', 'unlock doors'
-                ],
-                'function': self.handle_smart_home
-            },
-            'communication': {
-                'patterns': [
-                    'send message', 'make call', 'video call', 'send email',
-                    'check messages', 'read messages'
-                ],
-                'function': self.handle_communication
-            },
-            'advanced_ai': {
-                'patterns': [
-                    'translate', 'summarize', 'explain', 'analyze',
-                    'compare', 'recommend', 'predict'
-                ],
-                'function': self.handle_advanced_ai
-            }
-        }
-    
-    def find_matching_command(self, user_input):
-        """Find matching command pattern"""
-        user_input_lower = user_input.lower()
-        
-        for category, data in self.command_patterns.items():
-            for pattern in data['patterns']:
-                if pattern in user_input_lower:
-                    return category, data['function']
-        
-        return None, None
+        self.translator = get_translation_client()
     
     def handle_system_control(self, command):
         """Handle system control commands"""
         try:
             command_lower = command.lower()
             
-            if not PYAUTOGUI_AVAILABLE:
+            pyautogui = get_pyautogui()
+            if isinstance(pyautogui, MockPyAutoGUI):
                 return "System control features not available in headless environment"
             
             if 'shutdown' in command_lower:
@@ -243,7 +149,8 @@ class EnhancedVoiceCommands:
         try:
             command_lower = command.lower()
             
-            if not PYAUTOGUI_AVAILABLE:
+            pyautogui = get_pyautogui()
+            if isinstance(pyautogui, MockPyAutoGUI):
                 return "Media control features not available in headless environment"
             
             if 'play' in command_lower:
@@ -437,8 +344,7 @@ class EnhancedVoiceCommands:
                 text_to_translate = command_lower.replace('translate', '').strip()
                 if text_to_translate:
                     try:
-                        result = self.translator.translate(text_to_translate, dest='en')
-                        return f"Translation: {result.text}"
+                        return f"Translation: {self.translator.translate(text_to_translate, 'en')}"
                     except Exception as e:
                         return "Translation service unavailable"
                 else:
@@ -588,6 +494,7 @@ if __name__ == "__main__":
     error_handler = EnhancedErrorHandler()
     voice_commands = EnhancedVoiceCommands(error_handler)
     context_processor = ContextAwareProcessor()
+    registry = build_registry()
     
     # Test command processing
     test_commands = [
@@ -602,11 +509,11 @@ if __name__ == "__main__":
     for command in test_commands:
         print(f"\nCommand: {command}")
         
-        # Find matching command
-        category, function = voice_commands.find_matching_command(command)
+        # Route through the intent registry, the same way JarvisAssistant does
+        intent, _ = registry.match(command)
         
-        if function:
-            response = function(command)
+        if intent is not None and intent.name in COMMAND_CATEGORIES:
+            response = getattr(voice_commands, f"handle_{intent.name}")(command)
             print(f"Response: {response}")
             
             # Add to context
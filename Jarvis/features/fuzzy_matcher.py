@@ -0,0 +1,197 @@
+"""
+Fuzzy command matching for JARVIS
+Character n-gram TF-IDF over every known phrase, so a misheard command is scored against all of them in one vectorized pass
+"""
+
+import numpy as np
+
+
+def char_ngrams(text, n=3):
+    """Character n-grams of each word, padded so short words and word edges count"""
+    grams = []
+    for word in text.lower().split():
+        padded = f" {word} "
+        if len(padded) <= n:
+            grams.append(padded)
+        else:
+            grams.extend(padded[i:i + n] for i in range(len(padded) - n + 1))
+    return grams
+
+
+class FuzzyMatcher:
+    """
+    Similarity between TF-IDF n-gram vectors of a command and every known phrase
+    The index is stored as postings (n-gram -> phrases and weights), so a query only touches the n-grams it contains
+    """
+
+    def __init__(self, n=3):
+        self.n = n
+        self.phrases = []  # (phrase, target)
+        self.vocabulary = {}  # n-gram -> column
+        self.idf = np.zeros(0)
+        self.postings_start = np.zeros(1, dtype=np.int64)  # postings of column c: [start[c], start[c + 1])
+        self.postings_rows = np.zeros(0, dtype=np.int64)
+        self.postings_weights = np.zeros(0)
+        self.row_targets = np.zeros(0, dtype=np.int64)  # target index of each phrase
+        self.targets = []
+        self.max_words = 1  # words in the longest phrase
+        self.compiled = True
+
+    def __len__(self):
+        return len(self.phrases)
+
+    def add(self, phrase, target):
+        """Index a phrase for a target"""
+        phrase = phrase.lower().strip()
+        if phrase:
+            self.phrases.append((phrase, target))
+            self.compiled = False
+
+    def compile(self):
+        """Build the TF-IDF postings from every added phrase"""
+        self.targets = list(dict.fromkeys(target for _, target in self.phrases))
+        target_index = {target: index for index, target in enumerate(self.targets)}
+        self.row_targets = np.array([target_index[target] for _, target in self.phrases], dtype=np.int64)
+        self.max_words = max((len(phrase.split()) for phrase, _ in self.phrases), default=1)
+
+        # Term counts per phrase, as parallel (row, column, count) arrays
+        self.vocabulary = {}
+        rows, columns, counts = [], [], []
+        for row, (phrase, _) in enumerate(self.phrases):
+            phrase_counts = {}
+            for gram in char_ngrams(phrase, self.n):
+                column = self.vocabulary.setdefault(gram, len(self.vocabulary))
+                phrase_counts[column] = phrase_counts.get(column, 0) + 1
+            rows.extend([row] * len(phrase_counts))
+            columns.extend(phrase_counts.keys())
+            counts.extend(phrase_counts.values())
+
+        rows = np.array(rows, dtype=np.int64)
+        columns = np.array(columns, dtype=np.int64)
+        document_frequency = np.bincount(columns, minlength=len(self.vocabulary))
+        self.idf = np.log((1 + len(self.phrases)) / (1 + document_frequency)) + 1.0
+
+        weights = np.array(counts, dtype=float) * self.idf[columns]
+        norms = np.sqrt(np.bincount(rows, weights=weights ** 2, minlength=len(self.phrases)))
+        weights /= norms[rows]
+
+        order = np.argsort(columns, kind='stable')
+        self.postings_rows = rows[order]
+        self.postings_weights = weights[order]
+        self.postings_start = np.concatenate(([0], np.cumsum(document_frequency))).astype(np.int64)
+        self.compiled = True
+
+    def candidate_scores(self, text):
+        """
+        Similarity of the text to every phrase sharing an n-gram with it: (phrase rows, scores, best word spans)
+        A phrase may sit anywhere in a longer command, so each phrase is scored against its best-aligned run of up to
+        max_words words; the score is the geometric mean of the cosine with that window and with the whole command,
+        so filler words cost less than in a plain cosine but a phrase explaining more of the command still wins
+        """
+        if not self.compiled:
+            self.compile()
+
+        empty = (np.zeros(0, dtype=np.int64), np.zeros(0), np.zeros((0, 2), dtype=np.int64))
+        words = text.lower().split()
+        if not words or not self.phrases:
+            return empty
+
+        # Dense word x n-gram TF-IDF matrix over the query's own n-grams; unknown ones get the highest idf
+        local = {}
+        word_ids, local_ids = [], []
+        for word_id, word in enumerate(words):
+            for gram in char_ngrams(word, self.n):
+                word_ids.append(word_id)
+                local_ids.append(local.setdefault(gram, len(local)))
+        gram_columns = np.array([self.vocabulary.get(gram, -1) for gram in local], dtype=np.int64)
+        known = gram_columns >= 0
+        if not known.any():
+            return empty
+        gram_idf = np.full(len(local), np.log(1 + len(self.phrases)) + 1.0)
+        gram_idf[known] = self.idf[gram_columns[known]]
+        counts = np.zeros((len(words), len(local)))
+        np.add.at(counts, (np.array(word_ids), np.array(local_ids)), 1.0)
+        matrix = counts * gram_idf
+
+        # Gather the postings of every known query n-gram; only the phrases they reach can score above zero
+        word_index, gram_index = np.nonzero(matrix[:, known])
+        columns = gram_columns[known][gram_index]
+        query_weights = matrix[:, known][word_index, gram_index]
+        starts = self.postings_start[columns]
+        lengths = self.postings_start[columns + 1] - starts
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        rows, candidate_index = np.unique(self.postings_rows[offsets], return_inverse=True)
+
+        # Dot products of every word with every candidate phrase, in one bincount
+        contributions = self.postings_weights[offsets] * np.repeat(query_weights, lengths)
+        cells = np.repeat(word_index, lengths) * len(rows) + candidate_index
+        word_dots = np.bincount(cells, weights=contributions, minlength=len(words) * len(rows))
+        word_dots = word_dots.reshape(len(words), len(rows))
+
+        # Word-by-word inner products give the exact norm of any window of words
+        inner = matrix @ matrix.T
+        dot_prefix = np.vstack((np.zeros(len(rows)), np.cumsum(word_dots, axis=0)))
+        inner_prefix = np.zeros((len(words) + 1, len(words) + 1))
+        inner_prefix[1:, 1:] = inner.cumsum(axis=0).cumsum(axis=1)
+
+        query_norm = np.sqrt(inner_prefix[-1, -1])
+        best = np.zeros(len(rows))
+        spans = np.zeros((len(rows), 2), dtype=np.int64)  # [start, end) words of each phrase's best window
+        for size in range(1, min(self.max_words, len(words)) + 1):
+            start = np.arange(len(words) - size + 1)
+            end = start + size
+            norms = np.sqrt(
+                inner_prefix[end, end] - inner_prefix[start, end] - inner_prefix[end, start] + inner_prefix[start, start]
+            )
+            window_scores = (dot_prefix[end] - dot_prefix[start]) / np.sqrt(norms * query_norm)[:, None]
+            window = window_scores.argmax(axis=0)
+            window_best = window_scores[window, np.arange(len(rows))]
+            better = window_best > best
+            best[better] = window_best[better]
+            spans[better] = np.column_stack((start[window], end[window]))[better]
+        return rows, best, spans
+
+    def scores(self, text):
+        """Similarity of the text to every phrase, as an array indexed like self.phrases"""
+        rows, candidate_scores, _ = self.candidate_scores(text)
+        scores = np.zeros(len(self.phrases))
+        scores[rows] = candidate_scores
+        return scores
+
+    def closest(self, text, limit=5):
+        """Closest targets, one entry each: [(target, phrase, score, (start, end) word span)], best first"""
+        rows, scores, spans = self.candidate_scores(text)
+
+        # Best phrase of each target: first occurrence of the target in score order
+        order = np.argsort(-scores, kind='stable')
+        ordered_targets = self.row_targets[rows[order]]
+        _, first = np.unique(ordered_targets, return_index=True)
+        first.sort()
+
+        closest = []
+        for position in first[:limit]:
+            index = order[position]
+            if scores[index] <= 0:
+                break
+            span = (int(spans[index][0]), int(spans[index][1]))
+            closest.append((self.targets[ordered_targets[position]], self.phrases[rows[index]][0], float(scores[index]), span))
+        return closest
+
+    def rank(self, text, limit=5):
+        """Closest targets, one entry each: [(target, phrase, score)], best first"""
+        return [(target, phrase, score) for target, phrase, score, _ in self.closest(text, limit)]
+
+    def correct(self, text, phrase, span):
+        """The text with the words of span replaced by the phrase they were closest to"""
+        words = text.split()
+        return ' '.join(words[:span[0]] + [phrase] + words[span[1]:])
+
+    def match(self, text, threshold=0.5, limit=3):
+        """
+        Best guess plus suggestions
+        :return: ((target, phrase, score) or None, [(target, phrase, score)] below the threshold)
+        """
+        ranked = self.rank(text, limit + 1)
+        if ranked and ranked[0][2] >= threshold:
+            return ranked[0], ranked[1:limit + 1]
+        return None, ranked[:limit]
@@ -0,0 +1,37 @@
+"""
+Headless runtime support for JARVIS
+Keeps display-only packages out of processes that have no display
+"""
+
+import sys
+
+GUI_PACKAGES = ('PyQt5', 'matplotlib', 'pyautogui')
+
+
+class GuiImportBlocker:
+    """Import hook that refuses GUI packages, so code paths needing a display fail fast instead of loading them"""
+
+    def __init__(self, packages=GUI_PACKAGES):
+        self.packages = set(packages)
+        self.refused = set()
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname.split('.')[0] in self.packages:
+            self.refused.add(fullname)
+            raise ImportError(f"{fullname} is not available in the headless runtime")
+        return None
+
+
+def block_gui_imports(packages=GUI_PACKAGES):
+    """Install the import hook; packages already imported stay usable"""
+    for finder in sys.meta_path:
+        if isinstance(finder, GuiImportBlocker):
+            return finder
+    blocker = GuiImportBlocker(packages)
+    sys.meta_path.insert(0, blocker)
+    return blocker
+
+
+def loaded_gui_modules(packages=GUI_PACKAGES):
+    """GUI packages present in this process"""
+    return sorted(name for name in packages if name in sys.modules)
@@ -0,0 +1,222 @@
+"""
+Automatic instrumentation for JARVIS
+Public functions of the entry-point feature modules (intent handlers, network features) are wrapped as the module is
+imported, and JarvisAssistant's methods when the class is defined; each wrapped call records its latency, whether it
+raised and how many calls are in flight. Per-character and per-call helpers are never wrapped: a wrapper costs more
+than they do
+"""
+
+import sys
+import time
+import inspect
+import functools
+import threading
+
+from Jarvis.config import config
+from Jarvis.features.latency_stats import LatencyStats
+
+PACKAGE = 'Jarvis.features'
+
+
+class CallStats:
+    """Latency, calls, errors and in-flight calls of one instrumented function"""
+
+    def __init__(self, capacity):
+        self.latency = LatencyStats(capacity)
+        self.calls = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def enter(self):
+        with self.lock:
+            self.calls += 1
+            self.in_flight += 1
+            if self.in_flight > self.max_in_flight:
+                self.max_in_flight = self.in_flight
+
+    def exit(self, seconds, failed):
+        with self.lock:
+            self.in_flight -= 1
+            if failed:
+                self.errors += 1
+        self.latency.record(seconds)
+
+    def summary(self):
+        latency = self.latency.summary(config.latency_rate_window) or {}
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'in_flight': self.in_flight,
+            'max_in_flight': self.max_in_flight,
+            'average': latency.get('average'),
+            'p50': latency.get('p50'),
+            'p95': latency.get('p95'),
+            'p99': latency.get('p99'),
+            'max': latency.get('max')
+        }
+
+
+class InstrumentationRegistry:
+    """Wraps functions once and keeps their stats; recording can be switched off at runtime"""
+
+    def __init__(self, enabled=False, modules=(), capacity=256):
+        self.enabled = enabled
+        self.modules = {f"{PACKAGE}.{name}" for name in modules}  # the only feature modules wrapped
+        self.capacity = capacity  # recent samples kept per function
+        self.stats = {}  # qualified name -> CallStats
+        self.wrapped = {}  # qualified name -> original function
+        self.instrumented_modules = set()
+        self.lock = threading.Lock()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        """Stop recording; wrapped functions then only pay for one flag check"""
+        self.enabled = False
+
+    def wants(self, module_name):
+        return module_name in self.modules
+
+    def _stats(self, name):
+        stats = self.stats.get(name)
+        if stats is None:
+            with self.lock:
+                stats = self.stats.setdefault(name, CallStats(self.capacity))
+        return stats
+
+    def wrap(self, func, name):
+        """Instrumented version of func; generator functions are returned unchanged (their work happens later)"""
+        if inspect.isgeneratorfunction(func) or inspect.isasyncgenfunction(func) or hasattr(func, '__instrumented__'):
+            return func
+        registry = self
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                if not registry.enabled:
+                    return await func(*args, **kwargs)
+                stats = registry._stats(name)
+                stats.enter()
+                started = time.perf_counter()
+                failed = True
+                try:
+                    result = await func(*args, **kwargs)
+                    failed = False
+                    return result
+                finally:
+                    stats.exit(time.perf_counter() - started, failed)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not registry.enabled:
+                    return func(*args, **kwargs)
+                stats = registry._stats(name)
+                stats.enter()
+                started = time.perf_counter()
+                failed = True
+                try:
+                    result = func(*args, **kwargs)
+                    failed = False
+                    return result
+                finally:
+                    stats.exit(time.perf_counter() - started, failed)
+
+        wrapper.__instrumented__ = name
+        self.wrapped[name] = func
+        return wrapper
+
+    def instrument_module(self, module):
+        """Wrap the public functions a module defines (not the ones it imported)"""
+        if module.__name__ in self.instrumented_modules:
+            return 0
+        self.instrumented_modules.add(module.__name__)
+
+        count = 0
+        short_name = module.__name__.rsplit('.', 1)[-1]
+        for attribute, value in list(vars(module).items()):
+            if attribute.startswith('_') or not inspect.isfunction(value) or value.__module__ != module.__name__:
+                continue
+            wrapper = self.wrap(value, f"{short_name}.{attribute}")
+            if wrapper is not value:
+                setattr(module, attribute, wrapper)
+                count += 1
+        return count
+
+    def instrument_class(self, cls):
+        """Wrap a class's public methods in place"""
+        for attribute, value in list(vars(cls).items()):
+            if not attribute.startswith('_') and inspect.isfunction(value):
+                setattr(cls, attribute, self.wrap(value, f"{cls.__name__}.{attribute}"))
+        return cls
+
+    def install(self):
+        """Instrument the feature modules already imported and every one imported from now on"""
+        for finder in sys.meta_path:
+            if isinstance(finder, InstrumentingFinder):
+                break
+        else:
+            sys.meta_path.insert(0, InstrumentingFinder(self))
+
+        for name, module in list(sys.modules.items()):
+            if module is not None and self.wants(name):
+                self.instrument_module(module)
+
+    def get_stats(self, limit=None):
+        """Per function stats, slowest total time first"""
+        summaries = {name: stats.summary() for name, stats in list(self.stats.items()) if stats.calls}
+        ranked = sorted(summaries.items(), key=lambda item: -(item[1]['average'] or 0) * item[1]['calls'])
+        return {
+            'enabled': self.enabled,
+            'functions_wrapped': len(self.wrapped),
+            'modules': len(self.instrumented_modules),
+            'functions': dict(ranked[:limit] if limit else ranked)
+        }
+
+
+class InstrumentingLoader:
+    """Loader wrapper that instruments a module right after it has executed"""
+
+    def __init__(self, loader, registry):
+        self.loader = loader
+        self.registry = registry
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        self.loader.exec_module(module)
+        self.registry.instrument_module(module)
+
+    def __getattr__(self, attribute):
+        # get_source, is_package, ... for inspect and pkgutil
+        return getattr(self.loader, attribute)
+
+
+class InstrumentingFinder:
+    """Meta path finder that hands feature modules to InstrumentingLoader; everything else is left alone"""
+
+    def __init__(self, registry):
+        self.registry = registry
+
+    def find_spec(self, fullname, path=None, target=None):
+        if not self.registry.wants(fullname):
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+            spec.loader = InstrumentingLoader(spec.loader, self.registry)
+        return spec
+
+
+# Process-wide registry, installed by Jarvis/__init__.py before any feature module is imported
+instrumentation = InstrumentationRegistry(config.instrumentation_enabled, config.instrumentation_modules)
@@ -0,0 +1,286 @@
+"""
+Intent handlers for JARVIS
+Imported the first time any intent fires; desktop-only dependencies are imported inside the handler that needs them
+Every handler takes (assistant, command, **slots) and returns the response text
+"""
+
+import os
+import random
+import datetime
+
+from Jarvis.config import config
+from Jarvis.features.deadline import http_timeout
+from Jarvis.features.tracing import tracer
+
+GREETING_RESPONSES = [
+    "always there for you sir", "i am ready sir", "your wish my command", "how can i help you sir?",
+    "i am online and ready sir", "at your service", "ready to assist you", "how may I help you today?",
+    "good to see you back", "what can I do for you?"
+]
+
+EMAIL_CONTACTS = {
+    'myself': 'your_email@gmail.com',
+    'my official email': 'your_email@gmail.com',
+    'my second email': 'your_email@gmail.com',
+    'boss': 'boss@company.com',
+    'team': 'team@company.com'
+}
+
+APPLICATION_PATHS = {
+    'chrome': 'C:/Program Files/Google/Chrome/Application/chrome.exe',
+    'firefox': 'C:/Program Files/Mozilla Firefox/firefox.exe',
+    'notepad': 'notepad.exe',
+    'calculator': 'calc.exe',
+    'paint': 'mspaint.exe'
+}
+
+
+# =================== BUILT-IN COMMANDS ===================
+
+def help(assistant, command):
+    return assistant.get_help()
+
+
+def greeting(assistant, command):
+    return random.choice(GREETING_RESPONSES)
+
+
+def date(assistant, command):
+    language = assistant.language_support.current_language
+    if language == 'en':
+        return assistant.tell_me_date()
+    return assistant.language_support.get_template('date_response', date=assistant.tell_me_date(language))
+
+
+def time(assistant, command):
+    return assistant.language_support.get_template('time_response', time=assistant.tell_time())
+
+
+def weather(assistant, command, city):
+    return assistant.weather(city)
+
+
+def wikipedia(assistant, command, topic):
+    result = assistant.tell_me(topic)
+    if not result:
+        # tell_me_about returns False for an outage as well as a missing page; neither answer should be cached
+        assistant.error_handler.record_error('network_error', None, 'wikipedia')
+        return assistant.language_support.get_template('not_found')
+    if assistant.language_support.current_language != 'en':
+        result = assistant.language_support.translate_text(result, assistant.language_support.current_language)
+    return result
+
+
+def news(assistant, command):
+    news_result = assistant.news()
+    if news_result:
+        headlines = [article['title'] for article in news_result[:3]]  # Top 3 headlines
+        if assistant.language_support.current_language != 'en':
+            # One round trip for every headline
+            headlines = assistant.language_support.translate_many(headlines, assistant.language_support.current_language)
+        heading = assistant.language_support.get_template('top_headlines')
+        return f"{heading}: " + ". ".join(headlines)
+    return assistant.error_handler.handle_error('api_error')
+
+
+# =================== ENHANCED COMMAND CATEGORIES ===================
+
+def system_control(assistant, command):
+    return assistant.enhanced_commands.handle_system_control(command)
+
+
+def media_control(assistant, command):
+    return assistant.enhanced_commands.handle_media_control(command)
+
+
+def web_search(assistant, command):
+    return assistant.enhanced_commands.handle_web_search(command)
+
+
+def file_operations(assistant, command):
+    return assistant.enhanced_commands.handle_file_operations(command)
+
+
+def productivity(assistant, command):
+    return assistant.enhanced_commands.handle_productivity(command)
+
+
+def entertainment(assistant, command):
+    return assistant.enhanced_commands.handle_entertainment(command)
+
+
+def smart_home(assistant, command):
+    return assistant.enhanced_commands.handle_smart_home(command)
+
+
+def communication(assistant, command):
+    return assistant.enhanced_commands.handle_communication(command)
+
+
+def advanced_ai(assistant, command):
+    return assistant.enhanced_commands.handle_advanced_ai(command)
+
+
+# =================== DESKTOP COMMANDS ===================
+
+def launch_app(assistant, command, app):
+    if not app:
+        return "Please specify which application to launch"
+    try:
+        assistant.launch_any_app(APPLICATION_PATHS[app])
+        return f"Launching {app}"
+    except Exception as e:
+        return f"Could not launch {app}: {str(e)}"
+
+
+def open_website(assistant, command, domain):
+    try:
+        assistant.website_opener(domain)
+        return f"Opening {domain}"
+    except Exception as e:
+        return f"Could not open {domain}: {str(e)}"
+
+
+def youtube(assistant, command, query):
+    if not query:
+        return "Please specify what to play on YouTube"
+    try:
+        import pywhatkit
+        pywhatkit.playonyt(query)
+        return f"Playing {query} on YouTube"
+    except Exception as e:
+        return f"YouTube error: {str(e)}"
+
+
+def email(assistant, command):
+    try:
+        sender_email = config.email
+        sender_password = config.email_password
+
+        if sender_email == "<your_email>" or sender_password == "<your_email_password>":
+            return "Email configuration not set up. Please configure your email in config.py"
+
+        assistant.tts("Whom do you want to email?")
+        recipient = assistant.mic_input()
+        receiver_email = EMAIL_CONTACTS.get(recipient.lower()) if recipient else None
+
+        if not receiver_email:
+            return "Recipient not found in contacts"
+
+        assistant.tts("What is the subject?")
+        subject = assistant.mic_input()
+        assistant.tts("What should I say?")
+        message = assistant.mic_input()
+
+        if subject and message:
+            assistant.send_mail(sender_email, sender_password, receiver_email, f'Subject: {subject}\n\n{message}')
+            return "Email sent successfully!"
+        return "Email cancelled - missing subject or message"
+    except Exception as e:
+        return f"Email error: {str(e)}"
+
+
+def calculate(assistant, command, query):
+    try:
+        app_id = config.wolframalpha_id
+        if not app_id or app_id == "<your_wolframalpha_id>":
+            assistant.error_handler.record_error('api_error', None, 'computational_intelligence')
+            return "Wolfram Alpha API key not configured. Please add your API key to config.py"
+
+        import wolframalpha
+        answer = wolframalpha.Client(app_id).query(query)
+        answer_text = next(answer.results).text
+        print(f"🧠 Computational result: {answer_text}")
+        return answer_text
+    except Exception as e:
+        return assistant.error_handler.handle_error('api_error', e, 'computational_intelligence')
+
+
+def calendar(assistant, command):
+    try:
+        assistant.google_calendar_events(command)
+        return "Checking your calendar..."
+    except Exception as e:
+        return f"Calendar error: {str(e)}"
+
+
+def music_player(assistant, command):
+    return "Music player feature needs to be configured with your music directory"
+
+
+def system_info(assistant, command):
+    try:
+        return assistant.system_info()
+    except Exception as e:
+        return f"System info error: {str(e)}"
+
+
+def where_is(assistant, command, place):
+    if not place:
+        return "Please specify a location"
+    try:
+        current_loc, target_loc, distance = assistant.location(place)
+        return f"{place} is {distance} km away from your current location"
+    except Exception as e:
+        assistant.error_handler.record_error('network_error', e, 'where_is')
+        return f"Location error: {str(e)}"
+
+
+def ip_address(assistant, command):
+    try:
+        import requests
+        with tracer.span('http', host='api.ipify.org'):
+            ip = requests.get('https://api.ipify.org', timeout=http_timeout()).text
+        return f"Your IP address is {ip}"
+    except Exception as e:
+        assistant.error_handler.record_error('network_error', e, 'ip_address')
+        return "Could not retrieve IP address"
+
+
+def my_location(assistant, command):
+    try:
+        city, state, country = assistant.my_location()
+        return f"You are currently in {city}, {state}, {country}"
+    except Exception as e:
+        assistant.error_handler.record_error('network_error', e, 'my_location')
+        return "Could not determine current location"
+
+
+def screenshot(assistant, command):
+    try:
+        import pyautogui
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"jarvis_screenshot_{timestamp}.png"
+        pyautogui.screenshot().save(filename)
+        return f"Screenshot saved as {filename}"
+    except Exception as e:
+        return f"Screenshot error: {str(e)}"
+
+
+def hide_files(assistant, command):
+    try:
+        os.system("attrib +h /s /d")
+        return "All files in current folder are now hidden"
+    except Exception as e:
+        return f"File operation error: {str(e)}"
+
+
+def unhide_files(assistant, command):
+    try:
+        os.system("attrib -h /s /d")
+        return "All files in current folder are now visible"
+    except Exception as e:
+        return f"File operation error: {str(e)}"
+
+
+def switch_window(assistant, command):
+    try:
+        import pyautogui
+        pyautogui.hotkey('alt', 'tab')
+        return "Switching window"
+    except Exception as e:
+        return f"Window switching error: {str(e)}"
+
+
+def goodbye(assistant, command):
+    return assistant.language_support.get_template('goodbye')
@@ -0,0 +1,322 @@
+"""
+Declarative intent registry for JARVIS
+Each intent declares its patterns, slot extractors, cache policy and handler; one router dispatches them all
+"""
+
+import re
+import importlib
+import threading
+
+from Jarvis.features.cache_policy import FRESH, STALE, ResponseCache
+from Jarvis.features.command_router import CommandRouter
+from Jarvis.features.deadline import Deadline, scope
+from Jarvis.features.fuzzy_matcher import FuzzyMatcher
+from Jarvis.features.tracing import tracer
+
+# Words that may join two commands in one utterance ("what's the time and the weather in london")
+CONJUNCTIONS = re.compile(r'\s*(,|\band then\b|\band also\b|\bthen\b|\balso\b|\band\b)\s*')
+
+
+# =================== SLOT EXTRACTORS ===================
+# An extractor takes (command, matched pattern) and returns the slot value
+
+def without_pattern(default=None):
+    """Slot: the command with the matched pattern removed ("tell me about X", "X के बारे में बताओ")"""
+    def extract(command, pattern):
+        return command.replace(pattern, '', 1).strip() or default
+    return extract
+
+
+def whole_command():
+    """Slot: the command itself, for intents whose answer depends on all of it"""
+    def extract(command, pattern):
+        return command.strip()
+    return extract
+
+
+def last_word(default=None):
+    """Slot: the last word, when the command has more than one"""
+    def extract(command, pattern):
+        words = command.split()
+        return words[-1] if len(words) > 1 else default
+    return extract
+
+
+def without_words(*words, default=None):
+    """Slot: the command with the given words removed"""
+    def extract(command, pattern):
+        for word in words:
+            command = command.replace(word, '')
+        return command.strip() or default
+    return extract
+
+
+def first_of(choices, default=None):
+    """Slot: the first of the choices that appears in the command"""
+    def extract(command, pattern):
+        for choice in choices:
+            if choice in command:
+                return choice
+        return default
+    return extract
+
+
+class Intent:
+    """A command the assistant understands"""
+
+    def __init__(self, name, handler, patterns=(), exact=(), slots=None, requires=(),
+                 priority=0, whole_word=False, fallback=False, guessable=False, concurrent=True, cache=None,
+                 follow_ups=()):
+        self.name = name
+        self.handler = handler  # "package.module:function", imported on first use
+        self.patterns = list(patterns)  # matched anywhere in the command
+        self.exact = list(exact)  # matched only as the whole command
+        self.slots = slots or {}
+        self.requires = list(requires)  # words that must also be present
+        self.priority = priority
+        self.whole_word = whole_word
+        self.fallback = fallback  # broad catch-all, only used when nothing more specific matched
+        self.guessable = guessable  # may run from a fuzzy near miss; only read-only intents opt in
+        self.concurrent = concurrent  # may run alongside other parts of a compound command; off for dialogs
+        self.cache = cache  # CachePolicy for reusing responses, None to never cache
+        self.follow_ups = list(follow_ups)  # intents often asked for next, worth prefetching
+        self._handler = None
+
+    def accepts(self, command):
+        """Whether the command satisfies the intent's extra requirements"""
+        return all(word in command for word in self.requires)
+
+    def extract_slots(self, command, pattern):
+        """Fill every declared slot from the command"""
+        return {name: extractor(command, pattern) for name, extractor in self.slots.items()}
+
+    def resolve_handler(self):
+        """Import the handler the first time the intent fires"""
+        if self._handler is None:
+            module_name, function_name = self.handler.split(':')
+            self._handler = getattr(importlib.import_module(module_name), function_name)
+        return self._handler
+
+
+class IntentRegistry:
+    """All intents behind one compiled router, with O(1) lookup from a match to its intent"""
+
+    def __init__(self, fuzzy_threshold=0.5, executor=None):
+        self.intents = {}
+        self.exact = {}  # whole command -> intent name
+        self.router = CommandRouter()
+        self.fuzzy = FuzzyMatcher()  # near misses, scored when the router finds nothing
+        self.fuzzy_threshold = fuzzy_threshold
+        self.cache = ResponseCache()
+        self.executor = executor  # runs stale-while-revalidate refreshes; a daemon thread each if None
+        self.last_requests = {}  # intent name -> (command, slots) it was last asked with
+
+    def register(self, intent):
+        """Add an intent and its patterns"""
+        self.intents[intent.name] = intent
+        for phrase in intent.exact:
+            self.exact.setdefault(phrase.lower(), intent.name)
+            self.fuzzy.add(phrase, intent.name)
+        for pattern in intent.patterns:
+            self.router.add(pattern, intent.name, intent.priority, intent.whole_word)
+            self.fuzzy.add(pattern, intent.name)
+
+    def follow_ups(self):
+        """Declared follow-up intents of every intent"""
+        return {name: intent.follow_ups for name, intent in self.intents.items() if intent.follow_ups}
+
+    def compile(self):
+        """Build the router and the fuzzy index now instead of on the first command"""
+        self.router.compile()
+        self.fuzzy.compile()
+
+    def match(self, command):
+        """Find the intent for a command: (intent, matched pattern), or (None, None)"""
+        command = command.lower().strip()
+        if command in self.exact:
+            return self.intents[self.exact[command]], command
+
+        fallback = None
+        for name, pattern in self.router.ranked(command):
+            intent = self.intents[name]
+            if not intent.accepts(command):
+                continue
+            if not intent.fallback:
+                return intent, pattern
+            if fallback is None:
+                fallback = (intent, pattern)
+        return fallback or (None, None)
+
+    def guess(self, command):
+        """
+        Closest intent for a command the router missed
+        :return: (intent, phrase, command with the misheard words replaced by the phrase), or (None, None, command)
+        """
+        command = command.lower().strip()
+        for name, phrase, score, span in self.fuzzy.closest(command):
+            if score < self.fuzzy_threshold:
+                break
+            intent = self.intents[name]
+            corrected = self.fuzzy.correct(command, phrase, span)
+            if intent.guessable and intent.accepts(corrected):
+                print(f"🔎 Closest command: '{phrase}' ({score:.2f})")
+                return intent, phrase, corrected
+        return None, None, command
+
+    def suggest(self, command, limit=3, min_score=0.25):
+        """Known phrases closest to a command, best first"""
+        return [phrase for _, phrase, score in self.fuzzy.rank(command.lower().strip(), limit) if score >= min_score]
+
+    def split(self, command):
+        """
+        Split a compound utterance into independent commands, in utterance order
+        A piece only starts a new command if it matches an intent itself, so "tell me about tom and jerry" stays whole
+        """
+        pieces = CONJUNCTIONS.split(command.strip())
+        if len(pieces) < 3:
+            return [command]
+
+        parts = [pieces[0]]
+        for joiner, piece in zip(pieces[1::2], pieces[2::2]):
+            if piece and parts[-1] and self.match(piece)[0] is not None:
+                parts.append(piece)
+            else:
+                separator = f"{joiner} " if joiner == ',' else f" {joiner} "
+                parts[-1] = f"{parts[-1]}{separator}{piece}".strip()
+        return parts
+
+    def runs_concurrently(self, parts):
+        """Whether every part of a compound command may run at the same time as the others"""
+        for part in parts:
+            intent, _ = self.match(part)
+            if intent is not None and not intent.concurrent:
+                return False
+        return True
+
+    def dispatch(self, assistant, command, language='en'):
+        """
+        Run the handler for a command, through the intent's cache policy
+        :return: (intent name, response), or (None, None) if no intent matched
+        """
+        with tracer.span('route') as route:
+            intent, pattern = self.match(command)
+            if intent is None:
+                intent, pattern, command = self.guess(command)
+            route.set(intent=intent.name if intent is not None else None)
+        if intent is None:
+            return None, None
+
+        slots = intent.extract_slots(command, pattern)
+        with self.cache.lock:
+            self.last_requests[intent.name] = (command, slots)
+
+        if intent.cache is None:
+            return intent.name, self.run_handler(intent, assistant, command, slots)
+
+        cache_key = self.cache_key(intent, assistant, language, slots)
+        state, cached = self.cache.lookup(intent.name, cache_key)
+        route.set(cache=state)
+        if state == FRESH:
+            return intent.name, cached
+        if state == STALE:
+            self.refresh(intent, assistant, command, slots, cache_key)
+            return intent.name, cached
+
+        response = self.run_handler(intent, assistant, command, slots, cache_key)
+        return intent.name, response
+
+    def run_handler(self, intent, assistant, command, slots, cache_key=None, prefetched=False):
+        """Call the intent's handler and cache its response, unless the handler reported an error"""
+        return self._run_handler(intent, assistant, command, slots, cache_key, prefetched)[0]
+
+    def _run_handler(self, intent, assistant, command, slots, cache_key, prefetched):
+        """run_handler, also telling whether the response was stored: (response, stored)"""
+        errors_before = self.errors_on_this_thread(assistant)
+        with tracer.span('handler', intent=intent.name):
+            response = intent.resolve_handler()(assistant, command, **slots)
+        if cache_key is not None and response and self.errors_on_this_thread(assistant) == errors_before:
+            self.cache.store(intent.name, cache_key, response, intent.cache, prefetched)
+            return response, True
+        return response, False
+
+    @staticmethod
+    def errors_on_this_thread(assistant):
+        error_handler = getattr(assistant, 'error_handler', None)
+        return error_handler.errors_on_this_thread() if error_handler else 0
+
+    def refresh(self, intent, assistant, command, slots, cache_key):
+        """Re-run a stale intent in the background; the stale response has already been answered"""
+        if not self.cache.begin_refresh(intent.name, cache_key):
+            return
+
+        def run():
+            try:
+                with scope(Deadline()):  # a refresh gets a deadline of its own, not the answered command's
+                    self.run_handler(intent, assistant, command, slots, cache_key)
+            except Exception as e:
+                print(f"Cache refresh error for {intent.name}: {e}")
+            finally:
+                self.cache.end_refresh(cache_key)
+
+        if self.executor is not None:
+            self.executor.submit(run)
+        else:
+            threading.Thread(target=run, daemon=True).start()
+
+    def cache_key(self, intent, assistant, language, slots):
+        """Key of a cacheable response under the intent's policy"""
+        location = None
+        if intent.cache.per_location:
+            location = assistant.current_location() if hasattr(assistant, 'current_location') else None
+        return intent.cache.key(intent.name, slots, language, location)
+
+    def invalidate(self, name=None):
+        """Forget the cached responses of one intent, or of all of them"""
+        self.cache.invalidate(name)
+
+    def prefetch_target(self, name, assistant, language='en'):
+        """
+        The request an intent would most likely get next, with its last slots (or its defaults)
+        :return: (command, slots, cache key), or None if the intent is never cached or its entry is still fresh
+        """
+        intent = self.intents.get(name)
+        if intent is None or intent.cache is None:
+            return None
+
+        with self.cache.lock:
+            command, slots = self.last_requests.get(name) or (None, None)
+        if command is None:
+            command = (intent.patterns or intent.exact)[0]
+            slots = intent.extract_slots(command, command)
+
+        cache_key = self.cache_key(intent, assistant, language, slots)
+        if self.cache.peek(cache_key) == FRESH:
+            return None
+        return command, slots, cache_key
+
+    def prefetch(self, assistant, name, language='en'):
+        """
+        Warm the cache entry of an intent ahead of the request
+        Only cached intents can be prefetched (a cache policy already marks a handler as safe to run again)
+        :return: True if an entry was cached; a handler that failed (offline, no answer) counts as a wasted prefetch
+        """
+        target = self.prefetch_target(name, assistant, language)
+        if target is None:
+            return False
+        command, slots, cache_key = target
+        try:
+            _, stored = self._run_handler(self.intents[name], assistant, command, slots, cache_key, prefetched=True)
+        except Exception:
+            self.cache.record_failed_prefetch()
+            raise
+        if not stored:
+            self.cache.record_failed_prefetch()
+        return stored
+
+    def get_cache_stats(self):
+        """Per-intent cache hit rates"""
+        return self.cache.get_stats()
+
+    def get_prefetch_stats(self):
+        """Prefetches issued, used (hits), expired unused (wasted) and still waiting"""
+        return self.cache.get_prefetch_stats()
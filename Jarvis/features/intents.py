@@ -0,0 +1,122 @@
+"""
+Intent declarations for JARVIS
+Every command the assistant understands, in one table: patterns, slots, cache policy and handler
+"""
+
+from Jarvis.features.cache_policy import stale_while_revalidate, ttl
+from Jarvis.features.intent_registry import Intent, IntentRegistry, first_of, last_word, whole_command, without_pattern, without_words
+
+HANDLERS = 'Jarvis.features.intent_handlers'
+
+# Patterns of the EnhancedVoiceCommands categories
+COMMAND_CATEGORIES = {
+    'system_control': [
+        'shutdown', 'restart', 'sleep', 'hibernate', 'lock screen',
+        'show desktop', 'task manager', 'control panel'
+    ],
+    'media_control': [
+        'play music', 'pause music', 'stop music', 'next song', 'previous song',
+        'volume up', 'volume down', 'mute', 'unmute'
+    ],
+    'web_search': [
+        'search for', 'google', 'youtube search', 'wikipedia search',
+        'find information about', 'look up'
+    ],
+    'file_operations': [
+        'open file', 'create file', 'delete file', 'copy file',
+        'move file', 'rename file', 'show files'
+    ],
+    'productivity': [
+        'set reminder', 'set alarm', 'schedule meeting',
+        'create task', 'add to calendar', 'take note'
+    ],
+    'entertainment': [
+        'tell joke', 'play game', 'random fact', 'quote of the day',
+        'riddle', 'story', 'poem'
+    ],
+    'smart_home': [
+        'turn on lights', 'turn off lights', 'set temperature',
+        'close blinds', 'open blinds', 'lock doors', 'unlock doors'
+    ],
+    'communication': [
+        'send message', 'make call', 'video call', 'send email',
+        'check messages', 'read messages'
+    ],
+    'advanced_ai': [
+        'translate', 'summarize', 'explain', 'analyze',
+        'compare', 'recommend', 'predict'
+    ]
+}
+
+GREETINGS = [
+    "hello jarvis", "jarvis", "wake up jarvis", "you there jarvis", "time to work jarvis", "hey jarvis",
+    "ok jarvis", "are you there", "hi jarvis", "good morning jarvis", "good afternoon jarvis", "good evening jarvis",
+    # Multi-language greetings
+    "नमस्ते jarvis", "जार्विस", "السلام علیکم jarvis", "سلام جارویس"
+]
+
+CALENDAR_PHRASES = ["what do i have", "do i have plans", "am i busy", "my schedule", "what's on my calendar"]
+
+# Categories that only answer; every other category acts on the machine or the outside world and a fuzzy guess
+# ("open the door" -> "open file the door") must never run it
+READ_ONLY_CATEGORIES = {'entertainment', 'advanced_ai'}
+
+APPLICATIONS = ['chrome', 'firefox', 'notepad', 'calculator', 'paint']
+
+DAY = 24 * 3600
+
+INTENTS = [
+    # Built-in assistant commands
+    Intent('help', f'{HANDLERS}:help', exact=['help', 'what can you do', 'commands'], guessable=True),
+    Intent('greeting', f'{HANDLERS}:greeting', exact=GREETINGS, guessable=True, follow_ups=['news', 'weather']),
+    # Never cached: the answer changes every time
+    Intent('date', f'{HANDLERS}:date', patterns=['date'], guessable=True, follow_ups=['calendar']),
+    Intent('time', f'{HANDLERS}:time', patterns=['time'], guessable=True, follow_ups=['date', 'weather']),
+    Intent('weather', f'{HANDLERS}:weather', patterns=['weather'], guessable=True,
+           slots={'city': last_word(default='London')}, cache=stale_while_revalidate(600, 1800),
+           follow_ups=['weather', 'news']),
+    Intent('wikipedia', f'{HANDLERS}:wikipedia', patterns=['tell me about'], guessable=True,
+           slots={'topic': without_pattern()}, cache=ttl(DAY)),
+    Intent('news', f'{HANDLERS}:news', patterns=['news', 'headlines', 'buzzing'], guessable=True,
+           cache=stale_while_revalidate(600, 3600), follow_ups=['weather', 'calendar']),
+
+    # Enhanced command categories
+    *[
+        Intent(category, f'{HANDLERS}:{category}', patterns=patterns, guessable=category in READ_ONLY_CATEGORIES)
+        for category, patterns in COMMAND_CATEGORIES.items()
+    ],
+
+    # Desktop commands
+    Intent('launch_app', f'{HANDLERS}:launch_app', patterns=['launch'],
+           slots={'app': first_of(APPLICATIONS)}),
+    Intent('open_website', f'{HANDLERS}:open_website', patterns=['.com', '.org', '.net', 'website'],
+           requires=['open'], slots={'domain': last_word()}),
+    Intent('youtube', f'{HANDLERS}:youtube', patterns=['youtube'],
+           slots={'query': without_words('youtube', 'play')}),
+    Intent('email', f'{HANDLERS}:email', patterns=['email'], concurrent=False),
+    Intent('calculate', f'{HANDLERS}:calculate', patterns=['calculate', 'what is', 'who is'], fallback=True,
+           guessable=True, slots={'query': whole_command()}, cache=ttl(DAY, per_language=False)),
+    Intent('calendar', f'{HANDLERS}:calendar', patterns=CALENDAR_PHRASES, guessable=True),
+    Intent('music_player', f'{HANDLERS}:music_player', patterns=['hit some music'], guessable=True),
+    Intent('system_info', f'{HANDLERS}:system_info', patterns=['system'], fallback=True, guessable=True),
+    Intent('where_is', f'{HANDLERS}:where_is', patterns=['where is'], slots={'place': without_pattern()}),
+    Intent('ip_address', f'{HANDLERS}:ip_address', patterns=['ip address'], guessable=True,
+           cache=ttl(600, per_language=False)),
+    Intent('my_location', f'{HANDLERS}:my_location', patterns=['where am i', 'current location', 'where i am'],
+           guessable=True, cache=ttl(1800, per_language=False)),
+    Intent('screenshot', f'{HANDLERS}:screenshot', patterns=['take screenshot', 'capture screen']),
+    Intent('hide_files', f'{HANDLERS}:hide_files', patterns=['hide files']),
+    Intent('unhide_files', f'{HANDLERS}:unhide_files', patterns=['visible files']),
+    Intent('switch_window', f'{HANDLERS}:switch_window', patterns=['switch window']),
+    Intent('goodbye', f'{HANDLERS}:goodbye', patterns=['goodbye', 'offline', 'bye', 'exit', 'quit'],
+           whole_word=True),
+]
+
+
+def build_registry(intents=None, fuzzy_threshold=0.5, executor=None):
+    """Registry with every declared intent, router and fuzzy index compiled"""
+    registry = IntentRegistry(fuzzy_threshold, executor)
+    for intent in INTENTS if intents is None else intents:
+        registry.register(intent)
+    registry.compile()
+    return registry
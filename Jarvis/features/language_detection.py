@@ -0,0 +1,145 @@
+"""
+Layered language detection for JARVIS
+Unicode script classifier first, then a memo of earlier answers, langdetect only as the last resort
+"""
+
+import bisect
+import threading
+from collections import OrderedDict
+
+# (first code point, last code point, script)
+SCRIPT_RANGES = sorted([
+    (0x0400, 0x04FF, 'cyrillic'),
+    (0x0600, 0x06FF, 'arabic'),
+    (0x0750, 0x077F, 'arabic'),
+    (0x0900, 0x097F, 'devanagari'),
+    (0x0980, 0x09FF, 'bengali'),
+    (0x0A00, 0x0A7F, 'gurmukhi'),
+    (0x0A80, 0x0AFF, 'gujarati'),
+    (0x0B80, 0x0BFF, 'tamil'),
+    (0x0C00, 0x0C7F, 'telugu'),
+    (0x0C80, 0x0CFF, 'kannada'),
+    (0x0D00, 0x0D7F, 'malayalam'),
+    (0x1100, 0x11FF, 'hangul'),
+    (0x3040, 0x309F, 'kana'),
+    (0x30A0, 0x30FF, 'kana'),
+    (0x3130, 0x318F, 'hangul'),
+    (0x3400, 0x4DBF, 'han'),
+    (0x4E00, 0x9FFF, 'han'),
+    (0xAC00, 0xD7AF, 'hangul'),
+    (0xFB50, 0xFDFF, 'arabic'),
+    (0xFE70, 0xFEFF, 'arabic'),
+])
+_RANGE_STARTS = [start for start, _, _ in SCRIPT_RANGES]
+
+# Scripts that identify a single supported language on their own
+SCRIPT_LANGUAGES = {
+    'cyrillic': 'ru',
+    'arabic': 'ar',
+    'devanagari': 'hi',
+    'bengali': 'bn',
+    'gurmukhi': 'pa',
+    'gujarati': 'gu',
+    'tamil': 'ta',
+    'telugu': 'te',
+    'kannada': 'kn',
+    'malayalam': 'ml',
+    'hangul': 'ko',
+    'kana': 'ja',
+    'han': 'zh',
+}
+
+# Letters used by Urdu but not by Arabic (ٹ ڈ ڑ ں ھ ہ ے)
+URDU_LETTERS = set('ٹڈڑںھہے')
+# Marathi-only letter ळ and the common Marathi copula
+MARATHI_MARKERS = ('ळ', 'आहे')
+
+
+def char_script(char):
+    """Script of a single character, or None for Latin, digits and punctuation"""
+    code = ord(char)
+    if code < 0x0400:
+        return None
+
+    index = bisect.bisect_right(_RANGE_STARTS, code) - 1
+    if index >= 0:
+        start, end, script = SCRIPT_RANGES[index]
+        if start <= code <= end:
+            return script
+    return None
+
+
+def detect_script_language(text):
+    """Decide the language from its writing system alone, or None if the script is ambiguous"""
+    counts = {}
+    for char in text:
+        script = char_script(char)
+        if script:
+            counts[script] = counts.get(script, 0) + 1
+
+    if not counts:
+        return None
+
+    # Japanese mixes kanji with kana, any kana at all means Japanese
+    if 'kana' in counts:
+        return 'ja'
+
+    script = max(counts, key=counts.get)
+    if script == 'arabic' and any(char in URDU_LETTERS for char in text):
+        return 'ur'
+    if script == 'devanagari' and any(marker in text for marker in MARATHI_MARKERS):
+        return 'mr'
+    return SCRIPT_LANGUAGES[script]
+
+
+class LanguageDetector:
+    """Script classifier, then memo cache, then langdetect for ambiguous Latin text"""
+
+    def __init__(self, supported_languages, default='en', memo_size=1024):
+        self.supported_languages = supported_languages
+        self.default = default
+        self.memo_size = memo_size
+        self.memo = OrderedDict()
+        self.lock = threading.Lock()
+        self.stats = {'script': 0, 'memo': 0, 'langdetect': 0}
+        self._detect = None
+
+    def detect(self, text):
+        """Detect the language of input text"""
+        if not text or not text.strip():
+            return self.default
+
+        language = detect_script_language(text)
+        if language:
+            self.stats['script'] += 1
+            return language if language in self.supported_languages else self.default
+
+        key = ' '.join(text.lower().split())
+        with self.lock:
+            if key in self.memo:
+                self.memo.move_to_end(key)
+                self.stats['memo'] += 1
+                return self.memo[key]
+
+        language = self._langdetect(key)
+        self.stats['langdetect'] += 1
+
+        with self.lock:
+            self.memo[key] = language
+            if len(self.memo) > self.memo_size:
+                self.memo.popitem(last=False)
+        return language
+
+    def _langdetect(self, text):
+        """Last resort: statistical detection for Latin-script text"""
+        try:
+            if self._detect is None:
+                from langdetect import DetectorFactory, detect
+                # Seeded so the same phrase always gets the same answer
+                DetectorFactory.seed = 0
+                self._detect = detect
+
+            detected_lang = self._detect(text)
+            return detected_lang if detected_lang in self.supported_languages else self.default
+        except Exception:
+            return self.default
@@ -5,15 +5,63 @@ Supports English, Hindi, Urdu, and other languages
 
 import json
 import os
+import time
 import subprocess
-from googletrans import Translator
-from langdetect import detect
-import pyttsx3
+import threading
+from collections import OrderedDict
 import speech_recognition as sr
 
+from Jarvis.config import config
+from Jarvis.features.voice_activity import BargeInDetector, noise_floor, playback_marker
+from Jarvis.features.catalogs import CatalogView, lookup
+from Jarvis.features.deadline import DeadlineExceeded, time_left
+from Jarvis.features.language_detection import LanguageDetector
+from Jarvis.features.tracing import tracer
+from Jarvis.features.translation import (
+    BATCH_SEPARATOR, TranslationCache, TranslationUnavailable, get_translation_client, normalize_text,
+    pack_batches, unpack_batch
+)
+
+# Voice name/language fragments used to pick a TTS voice per language
+LANGUAGE_VOICE_MAP = {
+    'en': ['english', 'en-us', 'en-gb'],
+    'hi': ['hindi', 'hi-in'],
+    'ur': ['urdu', 'ur-pk'],
+    'ar': ['arabic', 'ar-sa'],
+    'fr': ['french', 'fr-fr'],
+    'es': ['spanish', 'es-es'],
+    'de': ['german', 'de-de'],
+    'it': ['italian', 'it-it'],
+    'ja': ['japanese', 'ja-jp'],
+    'ko': ['korean', 'ko-kr'],
+    'zh': ['chinese', 'zh-cn'],
+    'ru': ['russian', 'ru-ru'],
+    'pt': ['portuguese', 'pt-br'],
+    'tr': ['turkish', 'tr-tr']
+}
+
+# espeak voice names for languages it can speak
+ESPEAK_VOICES = {
+    'en': 'en',
+    'hi': 'hi',
+    'ur': 'ur',
+    'ar': 'ar',
+    'fr': 'fr',
+    'es': 'es',
+    'de': 'de',
+    'it': 'it',
+    'ja': 'ja',
+    'ko': 'ko',
+    'zh': 'zh',
+    'ru': 'ru',
+    'pt': 'pt',
+    'tr': 'tr'
+}
+
 class LanguageSupport:
-    def __init__(self):
-        self.translator = Translator()
+    def __init__(self, warm_state=None):
+        self.translator = get_translation_client()
+        self.translation_cache = TranslationCache()
         self.current_language = 'en'  # Default English
         self.supported_languages = {
             'en': 'English',
@@ -66,14 +114,33 @@ class LanguageSupport:
             'pa': 'pa-IN'
         }
         
+        self.language_detector = LanguageDetector(self.supported_languages)
+        
         # Load language templates
         self.templates = self.load_language_templates()
         
+        # Interruptible playback state (barge-in)
+        self.stop_speaking_event = threading.Event()
+        self.speech_process = None
+        self.was_interrupted = False
+        self.barge_in = BargeInDetector(self.stop_speaking) if config.barge_in_enabled else None
+        
+        # Voice lookup table and pre-configured engines, keyed by language
+        self.voice_index = {}
+        self.engine_pool = OrderedDict()
+        self.active_engine = None
+        if warm_state is not None:
+            # A restored voice map saves scanning the installed voices at startup
+            warm_state.register('tts_voices', lambda: dict(self.voice_index) or None, self.restore_voice_index,
+                                config.warm_state_voices_max_age)
+        
         # Initialize TTS engine (gracefully handle headless environments)
         try:
             # Check if on Windows
             if os.name == 'nt':
+                import pyttsx3
                 self.tts_engine = pyttsx3.init()
+                self.voice_index = self.voice_index or self.build_voice_index(self.tts_engine)
                 self.setup_tts_for_language(self.current_language)
                 self.tts_available = True
             else:
@@ -95,73 +162,99 @@ class LanguageSupport:
             self.use_espeak = False
     
     def load_language_templates(self):
-        """Load language-specific response templates"""
-        templates = {
-            'en': {
-                'greeting': "Hello! How can I help you today?",
-                'goodbye': "Goodbye! Have a great day!",
-                'error': "Sorry, I couldn't understand that. Please try again.",
-                'listening': "I'm listening...",
-                'processing': "Processing your request...",
-                'time_response': "The current time is {time}",
-                'date_response': "Today's date is {date}",
-                'weather_response': "The weather in {city} is {weather}",
-                'not_found': "Sorry, I couldn't find that information.",
-                'task_completed': "Task completed successfully!",
-                'language_changed': "Language changed to {language}",
-                'help': "I can help you with time, weather, news, calculations, and much more. Just ask me!"
-            },
-            'hi': {
-                'greeting': "नमस्ते! आज मैं आपकी कैसे सहायता कर सकता हूं?",
-                'goodbye': "अलविदा! आपका दिन शुभ हो!",
-                'error': "क्षमा करें, मैं इसे समझ नहीं सका। कृपया पुनः प्रयास करें।",
-                'listening': "मैं सुन रहा हूं...",
-                'processing': "आपका अनुरोध प्रसंस्करण कर रहा हूं...",
-                'time_response': "वर्तमान समय {time} है",
-                'date_response': "आज की तारीख {date} है",
-                'weather_response': "{city} में मौसम {weather} है",
-                'not_found': "क्षमा करें, मुझे वह जानकारी नहीं मिली।",
-                'task_completed': "कार्य सफलतापूर्वक पूरा हुआ!",
-                'language_changed': "भाषा {language} में बदल गई",
-                'help': "मैं समय, मौसम, समाचार, गणना और बहुत कुछ में आपकी मदद कर सकता हूं। बस मुझसे पूछें!"
-            },
-            'ur': {
-                'greeting': "السلام علیکم! آج میں آپ کی کیسے مدد کر سکتا ہوں؟",
-                'goodbye': "خدا حافظ! آپ کا دن اچھا گزرے!",
-                'error': "معذرت، میں اسے سمجھ نہیں سکا۔ براہ کرم دوبارہ کوشش کریں۔",
-                'listening': "میں سن رہا ہوں...",
-                'processing': "آپ کی درخواست پر کارروائی کر رہا ہوں...",
-                'time_response': "موجودہ وقت {time} ہے",
-                'date_response': "آج کی تاریخ {date} ہے",
-                'weather_response': "{city} میں موسم {weather} ہے",
-                'not_found': "معذرت، مجھے یہ معلومات نہیں مل سکیں۔",
-                'task_completed': "کام کامیابی سے مکمل ہوا!",
-                'language_changed': "زبان {language} میں تبدیل ہو گئی",
-                'help': "میں وقت، موسم، خبریں، حساب کتاب اور بہت کچھ میں آپ کی مدد کر سکتا ہوں۔ بس مجھ سے پوچھیں!"
-            }
-        }
-        return templates
+        """Language-specific response templates, each catalog is read from disk on first use"""
+        return CatalogView('templates')
     
     def detect_language(self, text):
         """Detect the language of input text"""
+        return self.language_detector.detect(text)
+    
+    def translation_timeout(self):
+        """Seconds a translation may take: the translator's timeout, shortened to what is left of the command's deadline"""
         try:
-            detected_lang = detect(text)
-            return detected_lang if detected_lang in self.supported_languages else 'en'
-        except:
-            return 'en'  # Default to English if detection fails
+            return time_left(self.translator.timeout)
+        except DeadlineExceeded:
+            return 0
     
     def translate_text(self, text, target_lang='en', source_lang='auto'):
         """Translate text from source language to target language"""
         try:
-            if source_lang == target_lang:
+            if source_lang == target_lang or not text:
                 return text
             
-            result = self.translator.translate(text, src=source_lang, dest=target_lang)
-            return result.text
+            cached = self.translation_cache.get(text, source_lang, target_lang)
+            if cached is not None:
+                return cached
+            
+            timeout = self.translation_timeout()
+            if not timeout:
+                return text  # The command is out of time, answer in English
+            
+            with tracer.span('translate', target=target_lang):
+                translation = self.translator.translate(text, target_lang, source_lang, timeout)
+            self.translation_cache.set(text, source_lang, target_lang, translation)
+            return translation
+        except TranslationUnavailable:
+            return text  # Service is down or slow, answer in English right away
         except Exception as e:
             print(f"Translation error: {e}")
             return text
     
+    def translate_many(self, texts, target_lang='en', source_lang='auto'):
+        """
+        Translate several strings with one round trip
+        Duplicates are translated once, cache hits are served locally and all misses
+        go out as batched requests; anything not translated in time stays in English
+        """
+        texts = list(texts)
+        if source_lang == target_lang:
+            return texts
+        
+        results = list(texts)
+        pending = OrderedDict()  # normalized text -> positions in the input
+        
+        for index, text in enumerate(texts):
+            if not text or not str(text).strip():
+                continue
+            
+            cached = self.translation_cache.get(text, source_lang, target_lang)
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.setdefault(normalize_text(text), []).append(index)
+        
+        timeout = self.translation_timeout()
+        if not pending or not timeout:
+            return results  # Nothing to send, or the command is out of time: cache hits, English for the rest
+        
+        # All batches go out concurrently and share one deadline
+        deadline = time.time() + timeout
+        requests = [
+            (batch, self.translator.submit(BATCH_SEPARATOR.join(batch), target_lang, source_lang))
+            for batch in pack_batches(pending.keys())
+        ]
+        
+        for batch, future in requests:
+            try:
+                with tracer.span('translate', target=target_lang, items=len(batch)):
+                    translated = self.translator.result(future, deadline - time.time())
+                translations = unpack_batch(translated, len(batch))
+                
+                if translations is None:
+                    # Service did not keep our line structure, fall back to one call per item
+                    translations = [self.translate_text(text, target_lang, source_lang) for text in batch]
+                
+                for text, translation in zip(batch, translations):
+                    self.translation_cache.set(text, source_lang, target_lang, translation)
+                    for index in pending[text]:
+                        results[index] = translation
+            except TranslationUnavailable:
+                continue
+            except Exception as e:
+                print(f"Translation error: {e}")
+        
+        return results
+    
     def set_language(self, language_code):
         """Set the current language"""
         if language_code in self.supported_languages:
@@ -170,89 +263,95 @@ class LanguageSupport:
             return True
         return False
     
-    def setup_tts_for_language(self, language_code):
-        """Setup text-to-speech for specific language"""
+    def build_voice_index(self, engine):
+        """Scan the installed voices once and map every language to a voice id"""
+        voice_index = {}
         try:
-            voices = self.tts_engine.getProperty('voices')
-            
-            # Language-specific voice selection
-            language_voice_map = {
-                'en': ['english', 'en-us', 'en-gb'],
-                'hi': ['hindi', 'hi-in'],
-                'ur': ['urdu', 'ur-pk'],
-                'ar': ['arabic', 'ar-sa'],
-                'fr': ['french', 'fr-fr'],
-                'es': ['spanish', 'es-es'],
-                'de': ['german', 'de-de'],
-                'it': ['italian', 'it-it'],
-                'ja': ['japanese', 'ja-jp'],
-                'ko': ['korean', 'ko-kr'],
-                'zh': ['chinese', 'zh-cn'],
-                'ru': ['russian', 'ru-ru'],
-                'pt': ['portuguese', 'pt-br'],
-                'tr': ['turkish', 'tr-tr']
-            }
+            voices = engine.getProperty('voices') or []
             
-            preferred_voices = language_voice_map.get(language_code, ['english'])
-            
-            # Find appropriate voice
-            selected_voice = None
-            if voices:
+            for language_code in self.supported_languages:
+                preferred_voices = LANGUAGE_VOICE_MAP.get(language_code, ['english'])
+                
                 for voice in voices:
                     voice_name = voice.name.lower()
                     voice_lang = voice.languages[0].lower() if voice.languages else ""
                     
-                    for preferred in preferred_voices:
-                        if preferred in voice_name or preferred in voice_lang:
-                            selected_voice = voice
-                            break
-                    
-                    if selected_voice:
+                    if any(preferred in voice_name or preferred in voice_lang for preferred in preferred_voices):
+                        voice_index[language_code] = voice.id
                         break
-                
-                if selected_voice:
-                    self.tts_engine.setProperty('voice', selected_voice.id)
-                elif voices:
-                    # Use default voice if no specific language voice found
-                    self.tts_engine.setProperty('voice', voices[0].id)
-            
-            # Set speech rate and volume
-            self.tts_engine.setProperty('rate', 175)
-            self.tts_engine.setProperty('volume', 0.9)
-            
+                else:
+                    if voices:
+                        # Use default voice if no specific language voice found
+                        voice_index[language_code] = voices[0].id
+        except Exception as e:
+            print(f"TTS voice scan error (this may be normal in headless environments): {e}")
+        
+        return voice_index
+    
+    def restore_voice_index(self, voice_index):
+        """Use a voice map saved by an earlier run"""
+        self.voice_index = {code: str(voice_id) for code, voice_id in voice_index.items() if code in self.supported_languages}
+    
+    def get_engine(self, language_code):
+        """Get a pre-configured TTS engine for a language from the pool"""
+        if language_code in self.engine_pool:
+            self.engine_pool.move_to_end(language_code)
+            return self.engine_pool[language_code]
+        
+        # The first engine is the one pyttsx3.init() gave us, later ones are independent
+        import pyttsx3
+        engine = self.tts_engine if not self.engine_pool else pyttsx3.Engine()
+        engine.connect('started-word', self._on_word)
+        
+        voice_id = self.voice_index.get(language_code)
+        if voice_id:
+            try:
+                engine.setProperty('voice', voice_id)
+            except Exception:
+                # A restored voice that has since been uninstalled: rescan
+                self.voice_index = self.build_voice_index(engine)
+                if self.voice_index.get(language_code):
+                    engine.setProperty('voice', self.voice_index[language_code])
+        engine.setProperty('rate', config.speech_rate)
+        engine.setProperty('volume', config.speech_volume)
+        
+        self.engine_pool[language_code] = engine
+        if len(self.engine_pool) > config.tts_engine_pool_size:
+            self.engine_pool.popitem(last=False)
+        return engine
+    
+    def setup_tts_for_language(self, language_code):
+        """Setup text-to-speech for specific language"""
+        try:
+            self.tts_engine = self.get_engine(language_code)
         except Exception as e:
             print(f"TTS setup error (this may be normal in headless environments): {e}")
     
     def speak(self, text, language=None):
-        """Speak text in the specified language"""
+        """Speak text in the specified language (playback stops early on barge-in)"""
+        with tracer.span('tts', chars=len(text), language=language or self.current_language):
+            self._speak(text, language)
+    
+    def _speak(self, text, language=None):
+        self.stop_speaking_event.clear()
+        self.was_interrupted = False
+        
         try:
             if not self.tts_available:
                 print(f"🔊 TTS: {text}")
                 return
             
+            playback_marker.begin()
+            if self.barge_in:
+                self.barge_in.arm()
+            
             if hasattr(self, 'use_espeak') and self.use_espeak:
                 # Use espeak for Linux systems
                 try:
                     lang_code = language or self.current_language
-                    espeak_lang = {
-                        'en': 'en',
-                        'hi': 'hi',
-                        'ur': 'ur',
-                        'ar': 'ar',
-                        'fr': 'fr',
-                        'es': 'es',
-                        'de': 'de',
-                        'it': 'it',
-                        'ja': 'ja',
-                        'ko': 'ko',
-                        'zh': 'zh',
-                        'ru': 'ru',
-                        'pt': 'pt',
-                        'tr': 'tr'
-                    }.get(lang_code, 'en')
+                    espeak_lang = ESPEAK_VOICES.get(lang_code, 'en')
                     
-                    subprocess.run(['espeak', '-v', espeak_lang, text], 
-                                 capture_output=True, timeout=10)
+                    self._run_espeak(['espeak', '-v', espeak_lang, text], timeout=config.speech_timeout)
                     return
                 except Exception as e:
                     print(f"Espeak error: {e}")
@@ -261,17 +360,53 @@ class LanguageSupport:
             
             # Use pyttsx3 for Windows
             if self.tts_engine:
+                engine = self.tts_engine
                 if language and language != self.current_language:
-                    self.setup_tts_for_language(language)
+                    engine = self.get_engine(language)
                 
-                self.tts_engine.say(text)
-                self.tts_engine.runAndWait()
+                self.active_engine = engine
+                engine.say(text)
+                engine.runAndWait()
             else:
                 print(f"🔊 TTS: {text}")
                 
         except Exception as e:
             print(f"Speech error (printing instead): {text}")
             print(f"   Error details: {e}")
+        finally:
+            if self.barge_in:
+                self.barge_in.disarm()
+            playback_marker.end()
+            self.was_interrupted = self.stop_speaking_event.is_set()
+    
+    def _run_espeak(self, args, timeout):
+        """Run espeak as a child process that can be killed mid-utterance"""
+        self.speech_process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        deadline = time.time() + timeout
+        try:
+            while self.speech_process.poll() is None:
+                if self.stop_speaking_event.is_set() or time.time() > deadline:
+                    self.speech_process.terminate()
+                    break
+                time.sleep(0.02)
+        finally:
+            self.speech_process = None
+    
+    def _on_word(self, name, location, length):
+        """pyttsx3 callback, the only safe place to stop the engine loop"""
+        if self.stop_speaking_event.is_set() and self.active_engine:
+            self.active_engine.stop()
+    
+    def stop_speaking(self):
+        """Cancel the utterance currently being spoken"""
+        self.stop_speaking_event.set()
+        process = self.speech_process
+        if process and process.poll() is None:
+            process.terminate()
+    
+    @property
+    def is_speaking(self):
+        return playback_marker.is_playing
     
     def listen(self, language_code=None):
         """Listen for voice input in specified language"""
@@ -291,12 +426,26 @@ class LanguageSupport:
             
             with sr.Microphone() as source:
                 print(f"Listening in {self.supported_languages[lang_code]}...")
-                r.adjust_for_ambient_noise(source, duration=1)
-                r.energy_threshold = 4000
-                audio = r.listen(source, timeout=5)
+                if not self.was_interrupted and not noise_floor.is_fresh():
+                    # After a barge-in the user is already talking, so skip calibration
+                    with tracer.span('calibrate'):
+                        r.adjust_for_ambient_noise(source, duration=1)
+                    noise_floor.record(r.energy_threshold)
+                r.energy_threshold = noise_floor.threshold()
+                if self.barge_in:
+                    self.barge_in.set_energy_threshold(r.energy_threshold)
+                capture_start = time.time()
+                with tracer.span('capture'):
+                    audio = r.listen(source, timeout=5)
+            
+            if playback_marker.overlaps(capture_start) and not self.was_interrupted:
+                print("🔇 Ignoring audio captured during our own playback")
+                return None
+            self.was_interrupted = False
             
             print("Recognizing...")
-            command = r.recognize_google(audio, language=sr_lang).lower()
+            with tracer.span('recognize', language=sr_lang):
+                command = r.recognize_google(audio, language=sr_lang).lower()
             print(f"You said: {command}")
             return command
             
@@ -313,8 +462,9 @@ class LanguageSupport:
     
     def get_template(self, template_key, **kwargs):
         """Get language-specific template with formatting"""
-        templates = self.templates.get(self.current_language, self.templates['en'])
-        template = templates.get(template_key, templates.get('error'))
+        template = lookup('templates', self.current_language, template_key)
+        if template is None:
+            template = lookup('templates', self.current_language, 'error')
         
         try:
             return template.format(**kwargs)
@@ -357,4 +507,9 @@ class LanguageSupport:
         return {
             'code': self.current_language,
             'name': self.supported_languages[self.current_language]
-        }
\ No newline at end of file
+        }
+    
+    def cleanup(self):
+        """Persist caches and release the translation workers when shutting down"""
+        self.translation_cache.save_cache()
+        self.translator.close()
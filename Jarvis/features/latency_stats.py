@@ -0,0 +1,132 @@
+"""
+Latency statistics for JARVIS
+Recent samples per operation live in a fixed-size NumPy ring buffer and every sample also lands in a log-bucketed
+histogram; recording writes into preallocated arrays and percentiles are computed, vectorized, only when asked for
+"""
+
+import math
+import time
+import threading
+
+import numpy as np
+
+PERCENTILES = (50, 95, 99)
+
+
+class LatencyRing:
+    """The last `capacity` samples and when they were taken"""
+
+    def __init__(self, capacity=1024):
+        self.capacity = capacity
+        self.samples = np.zeros(capacity)
+        self.stamps = np.zeros(capacity)  # time.monotonic() of each sample
+        self.count = 0  # samples ever recorded; the next one goes to count % capacity
+
+    def record(self, seconds, now):
+        index = self.count % self.capacity
+        self.samples[index] = seconds
+        self.stamps[index] = now
+        self.count += 1
+
+    def window(self):
+        """Samples currently held (a view, in no particular order)"""
+        return self.samples[:min(self.count, self.capacity)]
+
+    def percentiles(self, percentiles=PERCENTILES):
+        window = self.window()
+        if not len(window):
+            return [None] * len(percentiles)
+        return np.percentile(window, percentiles).tolist()
+
+    def rate(self, seconds, now):
+        """Samples per second over the last `seconds` (as far back as the buffer reaches)"""
+        stamps = self.stamps[:min(self.count, self.capacity)]
+        return int(np.count_nonzero(stamps >= now - seconds)) / seconds
+
+
+class LogHistogram:
+    """Counts of every sample ever recorded, in buckets whose width grows with latency"""
+
+    def __init__(self, low=1e-4, high=100.0, buckets_per_decade=10):
+        self.low = low
+        self.buckets_per_decade = buckets_per_decade
+        decades = math.log10(high / low)
+        self.size = int(math.ceil(decades * buckets_per_decade))
+        # Bucket i holds [edges[i], edges[i + 1]); the first and last also take everything below and above
+        self.edges = low * 10 ** (np.arange(self.size + 1) / buckets_per_decade)
+        self.counts = [0] * self.size  # a list: incrementing a Python int is cheaper than a NumPy element
+        self.total = 0
+        self.sum = 0.0
+
+    def record(self, seconds):
+        if seconds <= self.low:
+            index = 0
+        else:
+            index = min(int(math.log10(seconds / self.low) * self.buckets_per_decade), self.size - 1)
+        self.counts[index] += 1
+        self.total += 1
+        self.sum += seconds
+
+    def percentiles(self, percentiles=PERCENTILES):
+        """Upper edge of the bucket each percentile falls in"""
+        if not self.total:
+            return [None] * len(percentiles)
+        cumulative = np.cumsum(self.counts)
+        ranks = np.ceil(np.asarray(percentiles) / 100 * self.total)
+        indices = np.searchsorted(cumulative, ranks)
+        return self.edges[np.minimum(indices, self.size - 1) + 1].tolist()
+
+    def buckets(self):
+        """Non-empty buckets as (lower edge, upper edge, count)"""
+        return [(float(self.edges[i]), float(self.edges[i + 1]), count) for i, count in enumerate(self.counts) if count]
+
+
+class LatencyStats:
+    """Ring buffer plus histogram for one operation"""
+
+    def __init__(self, capacity=1024):
+        self.ring = LatencyRing(capacity)
+        self.histogram = LogHistogram()
+        self.min = math.inf
+        self.max = 0.0
+        self.lock = threading.Lock()
+
+    def record(self, seconds):
+        with self.lock:
+            self.ring.record(seconds, time.monotonic())
+            self.histogram.record(seconds)
+            if seconds < self.min:
+                self.min = seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def mean(self):
+        with self.lock:
+            window = self.ring.window()
+            return float(window.mean()) if len(window) else 0
+
+    def summary(self, rate_window=60):
+        """Recent average/percentiles and rate, plus lifetime count, min, max and histogram percentiles"""
+        with self.lock:
+            window = self.ring.window()
+            if not len(window):
+                return None
+            p50, p95, p99 = self.ring.percentiles()
+            # A bucket's upper edge can lie above anything actually seen
+            lifetime_p50, lifetime_p95, lifetime_p99 = (min(value, self.max) for value in self.histogram.percentiles())
+            return {
+                'average': float(window.mean()),
+                'min': self.min,
+                'max': self.max,
+                'count': self.histogram.total,
+                'p50': p50,
+                'p95': p95,
+                'p99': p99,
+                'rate_per_second': self.ring.rate(rate_window, time.monotonic()),
+                'lifetime': {
+                    'average': self.histogram.sum / self.histogram.total,
+                    'p50': lifetime_p50,
+                    'p95': lifetime_p95,
+                    'p99': lifetime_p99
+                }
+            }
@@ -0,0 +1,81 @@
+"""
+Lazy feature-module loading for JARVIS
+Feature modules are imported the first time the assistant uses them, and how long each import took is recorded
+"""
+
+import sys
+import time
+import importlib
+import threading
+
+_started = time.perf_counter()
+_lock = threading.RLock()
+_modules = {}  # module name -> LazyModule
+_report = {}  # module name -> import time and when it happened
+
+
+class LazyModule:
+    """Stand-in for a module, imported on first attribute access"""
+
+    def __init__(self, name):
+        self.__dict__['_name'] = name
+        self.__dict__['_module'] = None
+
+    def _load(self):
+        module = self.__dict__['_module']
+        if module is not None:
+            return module
+
+        name = self.__dict__['_name']
+        with _lock:
+            if self.__dict__['_module'] is None:
+                already_loaded = name in sys.modules
+                started = time.perf_counter()
+                module = importlib.import_module(name)
+                seconds = time.perf_counter() - started
+                _report[name] = {
+                    'import_ms': round(seconds * 1e3, 2),
+                    'first_use_s': round(started - _started, 3),  # seconds after Jarvis was imported
+                    'preloaded': already_loaded  # something else had imported it already, so it cost nothing here
+                }
+                if seconds > 0.1:
+                    print(f"📦 Loaded {name.rsplit('.', 1)[-1]} in {seconds * 1e3:.0f}ms")
+                self.__dict__['_module'] = module
+        return self.__dict__['_module']
+
+    @property
+    def loaded(self):
+        return self.__dict__['_module'] is not None
+
+    def __getattr__(self, attribute):
+        return getattr(self._load(), attribute)
+
+    def __setattr__(self, attribute, value):
+        setattr(self._load(), attribute, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = 'loaded' if self.loaded else 'not loaded'
+        return f"<lazy module '{self.__dict__['_name']}' ({state})>"
+
+
+def lazy_import(name):
+    """Lazy stand-in for a module; the same object is returned for the same name"""
+    with _lock:
+        if name not in _modules:
+            _modules[name] = LazyModule(name)
+        return _modules[name]
+
+
+def import_report():
+    """Import time of every lazily loaded module (slowest first), and the ones this session never needed"""
+    with _lock:
+        loaded = dict(sorted(_report.items(), key=lambda item: -item[1]['import_ms']))
+        pending = sorted(name for name, module in _modules.items() if not module.loaded)
+    return {
+        'loaded': loaded,
+        'total_import_ms': round(sum(entry['import_ms'] for entry in loaded.values()), 2),
+        'never_used': pending
+    }
@@ -1,19 +1,36 @@
+import time
 import webbrowser, requests
 from geopy.geocoders import Nominatim
 from geopy.distance import great_circle
 import geocoder
 
-def loc(place):
-    webbrowser.open("http://www.google.com/maps/place/" + place + "")
-    geolocator = Nominatim(user_agent="myGeocoder")
-    location = geolocator.geocode(place, addressdetails=True)
+from Jarvis.features.deadline import http_timeout
+from Jarvis.features.tracing import tracer
+
+def geocode(place):
+    geolocator = Nominatim(user_agent="myGeocoder", timeout=http_timeout())
+    with tracer.span('http', host='nominatim.openstreetmap.org'):
+        location = geolocator.geocode(place, addressdetails=True)
     target_latlng = location.latitude, location.longitude
     location = location.raw['address']
     target_loc = {'city': location.get('city', ''),
                    'state': location.get('state', ''),
                    'country': location.get('country', '')}
+    return target_latlng, target_loc
 
-    current_loc = geocoder.ip('me')
+def loc(place, geocodes=None):
+    """geocodes: optional dict of resolved places, looked up first and filled in, so each place is resolved once"""
+    webbrowser.open("http://www.google.com/maps/place/" + place + "")
+    key = place.strip().lower()
+    if geocodes is not None and key in geocodes:
+        target_latlng, target_loc = tuple(geocodes[key]['latlng']), geocodes[key]['address']
+    else:
+        target_latlng, target_loc = geocode(place)
+        if geocodes is not None:
+            geocodes[key] = {'latlng': list(target_latlng), 'address': target_loc, 'resolved_at': time.time()}
+
+    with tracer.span('http', host='ipinfo.io'):
+        current_loc = geocoder.ip('me', timeout=http_timeout())
     current_latlng = current_loc.latlng
 
     distance = str(great_circle(current_latlng, target_latlng))
@@ -23,9 +40,11 @@ def loc(place):
     return current_loc, target_loc, distance
 
 def my_location():
-    ip_add = requests.get('https://api.ipify.org').text
+    with tracer.span('http', host='api.ipify.org'):
+        ip_add = requests.get('https://api.ipify.org', timeout=http_timeout()).text
     url = 'https://get.geojs.io/v1/ip/geo/' + ip_add + '.json'
-    geo_requests = requests.get(url)
+    with tracer.span('http', host='get.geojs.io'):
+        geo_requests = requests.get(url, timeout=http_timeout())
     geo_data = geo_requests.json()
     city = geo_data['city']
     state = geo_data['region']
@@ -1,11 +1,15 @@
 import requests
 import json
 
+from Jarvis.features.deadline import http_timeout
+from Jarvis.features.tracing import tracer
+
 
 
 def get_news():
     url = 'http://newsapi.org/v2/top-headlines?sources=the-times-of-india&apiKey=ae5ccbe2006a4debbe6424d7e4b569ec'
-    news = requests.get(url).text
+    with tracer.span('http', host='newsapi.org'):
+        news = requests.get(url, timeout=http_timeout()).text
     news_dict = json.loads(news)
     articles = news_dict['articles']
     try:
@@ -10,11 +10,18 @@ import json
 import os
 import hashlib
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 from functools import wraps
 import speech_recognition as sr
 import queue
 
+from Jarvis.features.deadline import Deadline, DeadlineExceeded, run_with_context, scope, time_left
+from Jarvis.features.latency_stats import LatencyStats
+from Jarvis.features.voice_activity import noise_floor, playback_marker
+from Jarvis.features.tracing import NULL_SPAN, tracer
+from Jarvis.features.warmup import CRITICAL, IDLE, NORMAL, WarmupScheduler
+from Jarvis.config import config
+
 class CacheManager:
     """Manages caching for frequently accessed data"""
     
@@ -74,6 +81,15 @@ class CacheManager:
             del self.cache[cache_key]
             del self.cache_times[cache_key]
     
+    def compact(self):
+        """Drop expired entries and rewrite the cache file"""
+        expired = [key for key, cached_at in self.cache_times.items() if datetime.now() - cached_at >= timedelta(hours=1)]
+        for key in expired:
+            self.cache.pop(key, None)
+            del self.cache_times[key]
+        self.save_cache()
+        return len(expired)
+    
     def clear(self):
         """Clear all cache"""
         self.cache.clear()
@@ -117,24 +133,31 @@ class AsyncVoiceRecognizer:
         self.is_listening = False
         self.executor = ThreadPoolExecutor(max_workers=3)
         
-        # Only initialize microphone if available
+        # The microphone is opened and calibrated once, by the startup warmup (see calibrate)
+        self.microphone = None
+        self.microphone_available = False
+    
+    def calibrate(self, duration=0.5):
+        """
+        Open the microphone and measure ambient noise; listening is unavailable until this has run
+        A noise floor restored from the warm state is used as is, so the microphone opens without a measuring pause
+        """
         try:
             if not os.getenv('JARVIS_DEMO_MODE'):
                 self.microphone = sr.Microphone()
                 # Optimize recognizer settings
-                with self.microphone as source:
-                    self.recognizer.adjust_for_ambient_noise(source)
+                if not noise_floor.is_fresh():
+                    with self.microphone as source:
+                        self.recognizer.adjust_for_ambient_noise(source, duration=duration)
+                    noise_floor.record(self.recognizer.energy_threshold)
                 self.microphone_available = True
-            else:
-                self.microphone = None
-                self.microphone_available = False
         except Exception as e:
             print(f"Microphone not available: {e}")
             self.microphone = None
             self.microphone_available = False
         
         if self.microphone_available:
-            self.recognizer.energy_threshold = 4000
+            self.recognizer.energy_threshold = noise_floor.threshold()
             self.recognizer.dynamic_energy_threshold = True
             self.recognizer.pause_threshold = 0.8
             self.recognizer.operation_timeout = 1
@@ -151,9 +174,14 @@ class AsyncVoiceRecognizer:
         def listen_worker():
             while self.is_listening:
                 try:
+                    capture_start = time.time()
                     with self.microphone as source:
                         audio = self.recognizer.listen(source, timeout=1, phrase_time_limit=5)
                     
+                    # Drop our own TTS output picked up by the microphone
+                    if playback_marker.overlaps(capture_start):
+                        continue
+                    
                     # Process audio in background
                     future = self.executor.submit(self._process_audio, audio)
                     result = future.result(timeout=10)
@@ -226,88 +254,64 @@ class AsyncVoiceRecognizer:
 class ResponseTimeOptimizer:
     """Optimizes response times for various operations"""
     
-    def __init__(self):
-        self.cache = CacheManager()
-        self.response_times = {}
+    def __init__(self, cache=None, window=None):
+        self.cache = cache or CacheManager()
+        self.window = window or config.latency_window
+        self.response_times = {}  # operation -> LatencyStats
+        self.lock = threading.Lock()
         
     def timed_operation(self, operation_name):
-        """Decorator to measure operation time"""
+        """Decorator to measure operation time; the call is also a span of the running trace"""
         def decorator(func):
             @wraps(func)
             def wrapper(*args, **kwargs):
-                start_time = time.time()
-                result = func(*args, **kwargs)
-                end_time = time.time()
-                
-                response_time = end_time - start_time
-                self.record_response_time(operation_name, response_time)
-                
-                return result
+                span = tracer.span(operation_name)
+                start_time = time.perf_counter()
+                try:
+                    with span:
+                        return func(*args, **kwargs)
+                finally:
+                    # A real span reaches record_response_time through the tracer listener; don't count it twice
+                    if span is NULL_SPAN or self.record_response_time not in tracer.listeners:
+                        self.record_response_time(operation_name, time.perf_counter() - start_time)
             return wrapper
         return decorator
     
     def record_response_time(self, operation, time_taken):
-        """Record response time for analysis"""
-        if operation not in self.response_times:
-            self.response_times[operation] = []
-        
-        self.response_times[operation].append({
-            'time': time_taken,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-        # Keep only last 100 entries
-        if len(self.response_times[operation]) > 100:
-            self.response_times[operation] = self.response_times[operation][-100:]
+        """Record response time for analysis (written into preallocated buffers, nothing is built per sample)"""
+        stats = self.response_times.get(operation)
+        if stats is None:
+            with self.lock:
+                stats = self.response_times.setdefault(operation, LatencyStats(self.window))
+        stats.record(time_taken)
     
     def get_average_response_time(self, operation):
-        """Get average response time for operation"""
-        if operation not in self.response_times:
-            return 0
-        
-        times = [entry['time'] for entry in self.response_times[operation]]
-        return sum(times) / len(times) if times else 0
+        """Get average response time for operation over its recent samples"""
+        stats = self.response_times.get(operation)
+        return stats.mean() if stats else 0
     
     def get_performance_stats(self):
-        """Get overall performance statistics"""
+        """Per operation: recent average, p50/p95/p99 and rate, lifetime count/min/max and histogram percentiles"""
         stats = {}
-        for operation, times in self.response_times.items():
-            time_values = [entry['time'] for entry in times]
-            if time_values:
-                stats[operation] = {
-                    'average': sum(time_values) / len(time_values),
-                    'min': min(time_values),
-                    'max': max(time_values),
-                    'count': len(time_values)
-                }
+        for operation, latency in list(self.response_times.items()):
+            summary = latency.summary(config.latency_rate_window)
+            if summary:
+                stats[operation] = summary
         return stats
+    
+    def get_histogram(self, operation):
+        """Every sample of an operation so far, as non-empty (lower, upper, count) log-spaced buckets"""
+        stats = self.response_times.get(operation)
+        if stats is None:
+            return []
+        with stats.lock:
+            return stats.histogram.buckets()
 
 class PreloadManager:
     """Manages preloading of frequently used resources"""
     
     def __init__(self):
         self.preloaded_data = {}
-        self.preload_tasks = []
-    
-    def preload_weather_data(self, cities):
-        """Preload weather data for common cities"""
-        from Jarvis.features import weather
-        
-        def preload_worker():
-            for city in cities:
-                try:
-                    weather_data = weather.fetch_weather(city)
-                    self.preloaded_data[f"weather_{city}"] = {
-                        'data': weather_data,
-                        'timestamp': datetime.now()
-                    }
-                except Exception as e:
-                    print(f"Error preloading weather for {city}: {e}")
-        
-        thread = threading.Thread(target=preload_worker)
-        thread.daemon = True
-        thread.start()
-        self.preload_tasks.append(thread)
     
     def preload_common_responses(self):
         """Preload common response templates"""
@@ -342,19 +346,24 @@ class ThreadPoolManager:
         self.pending_tasks = {}
     
     def submit_task(self, task_id, func, *args, **kwargs):
-        """Submit a task to the thread pool"""
-        future = self.executor.submit(func, *args, **kwargs)
+        """Submit a task to the thread pool; it runs under the caller's command deadline"""
+        future = self.executor.submit(run_with_context(func, *args, **kwargs))
         self.pending_tasks[task_id] = future
         return future
     
     def get_task_result(self, task_id, timeout=None):
-        """Get result of a submitted task"""
+        """Get result of a submitted task, waiting no longer than the current command's deadline allows"""
         if task_id in self.pending_tasks:
             future = self.pending_tasks[task_id]
             try:
-                result = future.result(timeout=timeout)
+                result = future.result(timeout=time_left(timeout))
                 del self.pending_tasks[task_id]
                 return result
+            except (FutureTimeout, DeadlineExceeded) as e:
+                # Out of time: drop the task if it hasn't started rather than leave it running for nobody
+                future.cancel()
+                del self.pending_tasks[task_id]
+                raise DeadlineExceeded(f"task {task_id} did not finish in time") from e
             except Exception as e:
                 del self.pending_tasks[task_id]
                 raise e
@@ -377,32 +386,29 @@ class PerformanceOptimizer:
     def __init__(self):
         self.cache = CacheManager()
         self.voice_recognizer = AsyncVoiceRecognizer()
-        self.response_optimizer = ResponseTimeOptimizer()
+        self.response_optimizer = ResponseTimeOptimizer(self.cache)
         self.preload_manager = PreloadManager()
         self.thread_pool = ThreadPoolManager()
         
-        # Initialize preloading
-        self.preload_manager.preload_common_responses()
+        # While tracing, every finished span is also a response time sample
+        tracer.add_listener(self.response_optimizer.record_response_time)
         
-        # Common cities for weather preloading
-        common_cities = ['New York', 'London', 'Tokyo', 'Mumbai', 'Delhi', 'Karachi']
-        self.preload_manager.preload_weather_data(common_cities)
+        # Startup work is registered here and run in the background by optimize_startup()
+        self.warmup = WarmupScheduler(idle_wait=config.warmup_idle_wait, max_load=config.warmup_max_load)
+        self.warmup.add('microphone', self.voice_recognizer.calibrate, CRITICAL)
+        self.warmup.add('common_responses', self.preload_manager.preload_common_responses, NORMAL)
+        self.warmup.add('cache_compaction', self.cache.compact, IDLE)
     
-    def optimize_startup(self):
-        """Optimize application startup time"""
+    def optimize_startup(self, is_busy=None):
+        """
+        Start the deferred warmup: critical tasks first, optional ones only once the assistant is idle
+        :param is_busy: callable telling the scheduler when commands are running
+        """
         print("🚀 Optimizing JARVIS startup...")
-        
-        # Preload essential components
-        self.preload_manager.preload_common_responses()
-        
-        # Warm up voice recognition
-        try:
-            with sr.Microphone() as source:
-                self.voice_recognizer.recognizer.adjust_for_ambient_noise(source, duration=0.5)
-        except Exception as e:
-            print(f"Voice recognition warmup error: {e}")
-        
-        print("✅ Startup optimization complete")
+        if is_busy is not None:
+            self.warmup.is_busy = is_busy
+        self.warmup.start()
+        print("✅ Startup optimization scheduled")
     
     def get_cached_response(self, command, func, *args, **kwargs):
         """Get cached response or execute function"""
@@ -419,20 +425,23 @@ class PerformanceOptimizer:
         
         return result
     
-    async def process_command_async(self, command, processor_func):
-        """Process command asynchronously"""
-        loop = asyncio.get_event_loop()
+    async def process_command_async(self, command, processor_func, deadline=None):
+        """Process command asynchronously, cancelling it if it overruns its deadline"""
+        deadline = deadline or Deadline()
+        task_id = f"command_{time.time()}"
         
         # Submit to thread pool
-        future = self.thread_pool.submit_task(
-            f"command_{time.time()}",
-            processor_func,
-            command
-        )
+        with scope(deadline):
+            future = self.thread_pool.submit_task(task_id, processor_func, command)
         
         # Wait for result
-        result = await loop.run_in_executor(None, future.result, 10)
-        return result
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), deadline.remaining())
+        except asyncio.TimeoutError:
+            deadline.cancel()  # work still running stops at its next HTTP call
+            raise DeadlineExceeded(f"'{command}' did not finish in time")
+        finally:
+            self.thread_pool.pending_tasks.pop(task_id, None)
     
     def get_performance_report(self):
         """Get detailed performance report"""
@@ -445,6 +454,8 @@ class PerformanceOptimizer:
             },
             'response_times': stats,
             'preloaded_items': len(self.preload_manager.preloaded_data),
+            'warmup': self.warmup.get_stats(),
+            'tracing': tracer.get_stats(),
             'active_tasks': len(self.thread_pool.pending_tasks)
         }
         
@@ -452,6 +463,8 @@ class PerformanceOptimizer:
     
     def cleanup(self):
         """Clean up resources"""
+        tracer.remove_listener(self.response_optimizer.record_response_time)
+        self.warmup.stop()
         self.voice_recognizer.stop_listening()
         self.thread_pool.shutdown()
         self.cache.save_cache()
@@ -0,0 +1,107 @@
+"""
+Speculative prefetch for JARVIS
+While an answer is being spoken, the likeliest next commands are fetched so they are already cached when asked
+"""
+
+import time
+import threading
+from collections import Counter, deque
+
+from Jarvis.features.deadline import Deadline, scope
+
+
+class IntentPredictor:
+    """Next-intent probabilities from the session's intent transitions, seeded with each intent's declared follow-ups"""
+
+    def __init__(self, follow_ups=None, prior_weight=1.0):
+        self.transitions = {}  # intent -> Counter of the intents that came next
+        self.follow_ups = follow_ups or {}  # intent -> likely next intents, before any history exists
+        self.prior_weight = prior_weight
+        self.previous = None
+        self.lock = threading.Lock()
+
+    def observe(self, intent):
+        """Record that an intent was asked for"""
+        if intent is None:
+            return
+        with self.lock:
+            if self.previous is not None:
+                self.transitions.setdefault(self.previous, Counter())[intent] += 1
+            self.previous = intent
+
+    def predict(self, intent=None, k=2):
+        """Top-k next intents after the given (default: the last observed) intent, as [(intent, probability)]"""
+        with self.lock:
+            intent = intent or self.previous
+            if intent is None:
+                return []
+            counts = Counter(self.transitions.get(intent, {}))
+        for follow_up in self.follow_ups.get(intent, ()):
+            counts[follow_up] += self.prior_weight
+
+        total = sum(counts.values())
+        if not total:
+            return []
+        return [(name, count / total) for name, count in counts.most_common(k)]
+
+
+class SpeculativePrefetcher:
+    """Runs predicted intents ahead of time on a worker pool, within a rolling hourly budget"""
+
+    def __init__(self, registry, predictor, executor, top_k=2, min_probability=0.2, budget_per_hour=30):
+        self.registry = registry
+        self.predictor = predictor
+        self.executor = executor
+        self.top_k = top_k
+        self.min_probability = min_probability
+        self.budget_per_hour = budget_per_hour
+        self.recent = deque()  # start times of prefetches in the last hour
+        self.in_flight = set()
+        self.skipped_budget = 0
+        self.lock = threading.Lock()
+
+    def _take_budget(self):
+        """Use one prefetch from the hourly budget, if any is left"""
+        now = time.time()
+        while self.recent and now - self.recent[0] > 3600:
+            self.recent.popleft()
+        if len(self.recent) >= self.budget_per_hour:
+            self.skipped_budget += 1
+            return False
+        self.recent.append(now)
+        return True
+
+    def start(self, assistant, language='en'):
+        """Prefetch the likeliest next intents in the background; returns the intents submitted"""
+        submitted = []
+        for name, probability in self.predictor.predict(k=self.top_k):
+            if probability < self.min_probability or self.registry.prefetch_target(name, assistant, language) is None:
+                continue  # unlikely, uncacheable or already fresh
+            with self.lock:
+                if name in self.in_flight or not self._take_budget():
+                    continue
+                self.in_flight.add(name)
+            self.executor.submit(self._run, assistant, name, language)
+            submitted.append(name)
+        return submitted
+
+    def _run(self, assistant, name, language):
+        try:
+            with scope(Deadline()):
+                fetched = self.registry.prefetch(assistant, name, language)
+            if fetched:
+                print(f"🔮 Prefetched {name}")
+        except Exception as e:
+            print(f"Prefetch error for {name}: {e}")
+        finally:
+            with self.lock:
+                self.in_flight.discard(name)
+
+    def get_stats(self):
+        """Prefetch accuracy and budget use"""
+        stats = self.registry.get_prefetch_stats()
+        with self.lock:
+            stats['budget_used_last_hour'] = len(self.recent)
+            stats['budget_per_hour'] = self.budget_per_hour
+            stats['skipped_over_budget'] = self.skipped_budget
+        return stats
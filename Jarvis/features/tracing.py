@@ -0,0 +1,238 @@
+"""
+Latency tracing for JARVIS
+Each utterance or command gets a trace ID; spans for capture, recognition, routing, HTTP calls, translation and speech
+follow it across threads (through the same context copy as the deadline) and the finished trace is written as one JSON line
+"""
+
+import os
+import json
+import time
+import itertools
+import logging
+import threading
+import contextvars
+from logging.handlers import RotatingFileHandler
+
+from Jarvis.config import config
+
+_current_span = contextvars.ContextVar('jarvis_span', default=None)
+_span_ids = itertools.count(1)
+
+
+class NullSpan:
+    """Stands in for a span while tracing is off or outside a trace, so instrumented code costs next to nothing"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **attributes):
+        pass
+
+    def discard(self):
+        pass
+
+
+NULL_SPAN = NullSpan()
+
+
+class Trace:
+    """The spans of one utterance or command"""
+
+    def __init__(self):
+        self.trace_id = os.urandom(8).hex()
+        self.started = time.time()
+        self.origin = time.perf_counter()
+        self.spans = []
+        self.lock = threading.Lock()
+        self.finished = False
+        self.discarded = False
+
+
+class Span:
+    """One timed step of a trace; use as a context manager"""
+
+    __slots__ = ('tracer', 'trace', 'name', 'span_id', 'parent_id', 'attributes', 'start', 'end', 'error', 'thread', 'token')
+
+    def __init__(self, tracer, trace, name, parent_id, attributes):
+        self.tracer = tracer
+        self.trace = trace
+        self.name = name
+        self.span_id = f"{next(_span_ids):x}"
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.start = self.end = None
+        self.error = None
+        self.thread = threading.current_thread().name
+        self.token = None
+
+    def __enter__(self):
+        self.token = _current_span.set(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end = time.perf_counter()
+        if exc_type is not None:
+            self.error = exc_type.__name__  # not the message: request errors quote URLs with API keys in them
+        _current_span.reset(self.token)
+        self.tracer.finish(self)
+        return False
+
+    def set(self, **attributes):
+        """Attach attributes (intent name, cache state, ...) to the span"""
+        self.attributes.update(attributes)
+
+    def discard(self):
+        """Drop the whole trace, e.g. when listening heard nothing"""
+        self.trace.discarded = True
+
+    @property
+    def seconds(self):
+        return self.end - self.start
+
+    def to_dict(self):
+        origin = self.trace.origin
+        span = {
+            'name': self.name,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'start_ms': round((self.start - origin) * 1e3, 3),
+            'duration_ms': round((self.end - self.start) * 1e3, 3),
+            'thread': self.thread
+        }
+        if self.attributes:
+            span['attributes'] = self.attributes
+        if self.error:
+            span['error'] = self.error
+        return span
+
+
+class Tracer:
+    """Creates spans while enabled and exports finished traces to a rotating JSONL file"""
+
+    def __init__(self, path=None, enabled=False, max_bytes=None, backups=None):
+        self.path = path or config.tracing_file
+        self.enabled = enabled
+        self.max_bytes = max_bytes or config.tracing_max_bytes
+        self.backups = backups or config.tracing_backups
+        self.listeners = []  # (span name, seconds) for every finished span
+        self.logger = None
+        self.lock = threading.Lock()
+        self.exported = 0
+        self.discarded = 0
+        self.late_spans = 0
+
+    def enable(self, path=None):
+        """Start tracing; new traces go to path (config.tracing_file by default)"""
+        with self.lock:
+            if path and path != self.path:
+                self.path = path
+                self._close_logger()
+            self.enabled = True
+
+    def disable(self):
+        """Stop creating spans; traces already started still finish"""
+        self.enabled = False
+
+    def trace(self, name, **attributes):
+        """Span that starts a new trace, or a child span if one is already running on this context"""
+        if not self.enabled:
+            return NULL_SPAN
+        parent = _current_span.get()
+        if parent is None:
+            return Span(self, Trace(), name, None, attributes)
+        return Span(self, parent.trace, name, parent.span_id, attributes)
+
+    def span(self, name, **attributes):
+        """Child span of the running one; outside a trace this does nothing"""
+        if not self.enabled:
+            return NULL_SPAN
+        parent = _current_span.get()
+        if parent is None:
+            return NULL_SPAN
+        return Span(self, parent.trace, name, parent.span_id, attributes)
+
+    def current_trace_id(self):
+        span = _current_span.get()
+        return span.trace.trace_id if span is not None else None
+
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def finish(self, span):
+        """Called as each span ends; the root span's end exports the trace"""
+        trace = span.trace
+        with trace.lock:
+            if trace.finished:
+                self.late_spans += 1  # background work that outlived its command
+                return
+            trace.spans.append(span)
+            if span.parent_id is None:
+                trace.finished = True
+
+        for listener in list(self.listeners):
+            try:
+                listener(span.name, span.seconds)
+            except Exception as e:
+                print(f"Trace listener error: {e}")
+
+        if span.parent_id is None:
+            if trace.discarded:
+                self.discarded += 1
+            else:
+                self.export(trace, span)
+
+    def export(self, trace, root):
+        """Write a finished trace as one JSON line"""
+        record = {
+            'trace_id': trace.trace_id,
+            'name': root.name,
+            'started': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(trace.started)),
+            'duration_ms': round(root.seconds * 1e3, 3),
+            'spans': [span.to_dict() for span in sorted(trace.spans, key=lambda span: span.start)]
+        }
+        try:
+            self._get_logger().info(json.dumps(record, ensure_ascii=False, default=str))
+            self.exported += 1
+        except Exception as e:
+            print(f"Error exporting trace: {e}")
+
+    def _get_logger(self):
+        with self.lock:
+            if self.logger is None:
+                os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+                handler = RotatingFileHandler(self.path, maxBytes=self.max_bytes, backupCount=self.backups, encoding='utf-8')
+                handler.setFormatter(logging.Formatter('%(message)s'))
+                logger = logging.getLogger('jarvis.traces')
+                logger.setLevel(logging.INFO)
+                logger.propagate = False
+                logger.addHandler(handler)
+                self.logger = logger
+            return self.logger
+
+    def _close_logger(self):
+        if self.logger is not None:
+            for handler in list(self.logger.handlers):
+                self.logger.removeHandler(handler)
+                handler.close()
+            self.logger = None
+
+    def get_stats(self):
+        return {
+            'enabled': self.enabled,
+            'path': self.path,
+            'exported': self.exported,
+            'discarded': self.discarded,
+            'late_spans': self.late_spans
+        }
+
+
+# Process-wide tracer; instrumented code calls tracer.span(...)
+tracer = Tracer(enabled=config.tracing_enabled or bool(os.getenv('JARVIS_TRACE')))
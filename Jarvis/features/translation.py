@@ -0,0 +1,339 @@
+"""
+Translation helpers for JARVIS
+Pooled translation client with deadlines and a circuit breaker, and a persistent cache of translated phrases
+"""
+
+import os
+import json
+import time
+import queue
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+from Jarvis.config import config
+
+# Items in a batched request are separated by newlines, which translation keeps intact
+BATCH_SEPARATOR = '\n'
+MAX_BATCH_CHARS = 4500
+
+_shared_client = None
+_client_lock = threading.Lock()
+
+
+class TranslationUnavailable(Exception):
+    """Translation is switched off or missed its deadline, callers should fall back to English"""
+
+
+class CircuitBreaker:
+    """Stops calling a failing service and probes it in the background until it recovers"""
+
+    def __init__(self, probe, failure_threshold=None, reset_timeout=None, name="Service"):
+        self.probe = probe
+        self.failure_threshold = failure_threshold or config.translation_breaker_failures
+        self.reset_timeout = reset_timeout or config.translation_breaker_reset
+        self.name = name
+        self.state = 'closed'
+        self.failures = 0
+        self.trips = 0
+        self.rejected = 0
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+
+    @property
+    def is_open(self):
+        """Whether calls are currently being refused"""
+        return self.state == 'open'
+
+    def allow(self):
+        """Whether a call may go out right now"""
+        if self.state == 'closed':
+            return True
+        with self.lock:
+            self.rejected += 1
+        return False
+
+    def record_success(self):
+        """A call succeeded, reset the failure streak"""
+        with self.lock:
+            self.failures = 0
+
+    def record_failure(self):
+        """A call failed, open the breaker once the streak reaches the threshold"""
+        with self.lock:
+            self.failures += 1
+            if self.state == 'open' or self.failures < self.failure_threshold:
+                return
+            self.state = 'open'
+            self.trips += 1
+
+        print(f"⚠️ {self.name} unavailable after {self.failure_threshold} failures, using fallbacks until it recovers")
+        threading.Thread(target=self._probe_until_recovered, daemon=True).start()
+
+    def _probe_until_recovered(self):
+        """Background loop: probe with exponential backoff, close the breaker on the first success"""
+        delay = self.reset_timeout
+        while not self.stop_event.wait(delay):
+            try:
+                self.probe()
+            except Exception:
+                delay = min(delay * 2, self.reset_timeout * 8)
+                continue
+
+            with self.lock:
+                self.state = 'closed'
+                self.failures = 0
+            print(f"✅ {self.name} is reachable again")
+            return
+
+    def stop(self):
+        """Stop background probing"""
+        self.stop_event.set()
+
+    def get_stats(self):
+        """Get breaker state and counters"""
+        return {
+            'state': self.state,
+            'consecutive_failures': self.failures,
+            'trips': self.trips,
+            'rejected_calls': self.rejected
+        }
+
+
+class TranslationClient:
+    """
+    Pooled googletrans workers with per-call deadlines and a circuit breaker
+    googletrans is synchronous, so calls run on a small executor and are awaited as futures
+    """
+
+    def __init__(self, pool_size=None, timeout=None):
+        self.pool_size = pool_size or config.translation_pool_size
+        self.timeout = timeout or config.translation_timeout
+        # Each worker checks out its own Translator so keep-alive connections are reused
+        self.translators = queue.Queue()
+        self.executor = ThreadPoolExecutor(max_workers=self.pool_size, thread_name_prefix="translate")
+        self.breaker = CircuitBreaker(self._probe, name="Translation service")
+        self.deadline_misses = 0
+
+    def _call(self, text, source_lang, target_lang):
+        """Run one translation on a pooled Translator (executor thread)"""
+        try:
+            translator = self.translators.get_nowait()
+        except queue.Empty:
+            # googletrans and httpx are only imported once a session actually translates
+            import httpx
+            from googletrans import Translator
+            translator = Translator(timeout=httpx.Timeout(self.timeout), raise_exception=True)
+
+        try:
+            return translator.translate(text, src=source_lang, dest=target_lang).text
+        finally:
+            self.translators.put(translator)
+
+    def _probe(self):
+        """Cheap request used to check whether the service is back"""
+        self._call("hello", 'en', 'es')
+
+    def _record(self, future):
+        """Feed a finished call into the breaker"""
+        if future.cancelled() or getattr(future, 'deadline_missed', False):
+            return
+        if future.exception() is None:
+            self.breaker.record_success()
+        else:
+            self.breaker.record_failure()
+
+    def submit(self, text, target_lang='en', source_lang='auto'):
+        """Start a translation and return its Future (fails immediately while the breaker is open)"""
+        if not self.breaker.allow():
+            future = Future()
+            future.set_exception(TranslationUnavailable("translation service is switched off"))
+            return future
+
+        future = self.executor.submit(self._call, text, source_lang, target_lang)
+        future.add_done_callback(self._record)
+        return future
+
+    def result(self, future, timeout=None):
+        """Wait for a submitted translation, raising TranslationUnavailable past the deadline"""
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            return future.result(timeout=max(timeout, 0))
+        except FutureTimeoutError:
+            self._missed_deadline(future)
+            raise TranslationUnavailable(f"translation took longer than {timeout:.1f}s")
+
+    def translate(self, text, target_lang='en', source_lang='auto', timeout=None):
+        """Translate text, blocking for at most the deadline"""
+        return self.result(self.submit(text, target_lang, source_lang), timeout)
+
+    async def translate_async(self, text, target_lang='en', source_lang='auto', timeout=None):
+        """Translate text from a coroutine without blocking the event loop"""
+        timeout = self.timeout if timeout is None else timeout
+        future = self.submit(text, target_lang, source_lang)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            self._missed_deadline(future)
+            raise TranslationUnavailable(f"translation took longer than {timeout:.1f}s")
+
+    def _missed_deadline(self, future):
+        """Count a call the caller stopped waiting for as a failure"""
+        future.deadline_missed = True
+        self.deadline_misses += 1
+        self.breaker.record_failure()
+
+    def close(self):
+        """Stop probing and release the worker threads; the next get_translation_client() builds a new client"""
+        global _shared_client
+        self.breaker.stop()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        with _client_lock:
+            if _shared_client is self:
+                _shared_client = None
+
+    def get_stats(self):
+        """Get breaker state and deadline misses"""
+        stats = self.breaker.get_stats()
+        stats['deadline_misses'] = self.deadline_misses
+        return stats
+
+
+def get_translation_client():
+    """Get the process-wide translation client (created on first use)"""
+    global _shared_client
+    with _client_lock:
+        if _shared_client is None:
+            _shared_client = TranslationClient()
+        return _shared_client
+
+
+def normalize_text(text):
+    """Collapse whitespace so trivially different phrasings share a cache entry"""
+    return ' '.join(str(text).split())
+
+
+def pack_batches(texts, max_chars=MAX_BATCH_CHARS):
+    """
+    Group texts into separator-joined batches under the request size limit
+    Texts are normalized first, so an item can never contain the separator itself
+    """
+    batches = []
+    current = []
+    size = 0
+
+    for text in texts:
+        line = normalize_text(text)
+        if current and size + len(line) + 1 > max_chars:
+            batches.append(current)
+            current = []
+            size = 0
+        current.append(line)
+        size += len(line) + 1
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+def unpack_batch(translated, expected_count):
+    """Split a translated batch back into items, or None if the service merged or split lines"""
+    lines = [line.strip() for line in translated.split(BATCH_SEPARATOR) if line.strip()]
+    if len(lines) != expected_count:
+        return None
+    return lines
+
+
+class TranslationCache:
+    """LRU cache of translations with TTL expiry and on-disk persistence"""
+
+    def __init__(self, cache_dir="/tmp/jarvis_cache", max_size=None, ttl_hours=None, save_every=10):
+        self.max_size = max_size or config.translation_cache_size
+        self.ttl = (ttl_hours or config.translation_cache_ttl_hours) * 3600
+        self.save_every = save_every
+        self.cache_file = os.path.join(cache_dir, "translations.json")
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.unsaved_writes = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self.load_cache()
+
+    @staticmethod
+    def make_key(text, source_lang, target_lang):
+        """Cache key from (normalized text, source, target)"""
+        return f"{source_lang}|{target_lang}|{normalize_text(text)}"
+
+    def get(self, text, source_lang, target_lang):
+        """Get a cached translation, or None on a miss"""
+        key = self.make_key(text, source_lang, target_lang)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and time.time() - entry[1] < self.ttl:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+
+            if entry is not None:
+                del self.entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, text, source_lang, target_lang, translation):
+        """Store a translation, evicting the least recently used entry when full"""
+        key = self.make_key(text, source_lang, target_lang)
+        with self.lock:
+            self.entries[key] = (translation, time.time())
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+            self.unsaved_writes += 1
+            should_save = self.unsaved_writes >= self.save_every
+
+        if should_save:
+            self.save_cache()
+
+    def clear(self):
+        """Clear all cached translations"""
+        with self.lock:
+            self.entries.clear()
+        self.save_cache()
+
+    def load_cache(self):
+        """Load unexpired translations from file"""
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+
+                now = time.time()
+                for key, (translation, stored_at) in data.get('entries', []):
+                    if now - stored_at < self.ttl:
+                        self.entries[key] = (translation, stored_at)
+        except Exception as e:
+            print(f"Error loading translation cache: {e}")
+
+    def save_cache(self):
+        """Save translations to file, oldest first so LRU order survives a restart"""
+        try:
+            with self.lock:
+                data = {'entries': [[key, list(entry)] for key, entry in self.entries.items()]}
+                self.unsaved_writes = 0
+
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+        except Exception as e:
+            print(f"Error saving translation cache: {e}")
+
+    def get_stats(self):
+        """Get cache size and hit rate"""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self.entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 'N/A'
+        }
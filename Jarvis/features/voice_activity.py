@@ -0,0 +1,176 @@
+"""
+Voice activity detection and barge-in support for JARVIS
+Lets the user cut JARVIS off by speaking over its TTS playback
+"""
+
+import os
+import math
+import time
+import array
+import threading
+from collections import deque
+
+import speech_recognition as sr
+
+from Jarvis.config import config
+
+try:
+    import audioop
+except ImportError:  # Removed from the standard library in Python 3.13
+    audioop = None
+
+
+def frame_energy(frame, sample_width=2):
+    """Root-mean-square energy of a raw 16-bit PCM frame"""
+    if audioop is not None:
+        return audioop.rms(frame, sample_width)
+
+    samples = array.array('h', frame)
+    if not samples:
+        return 0
+    return math.sqrt(sum(s * s for s in samples) / len(samples))
+
+
+class PlaybackMarker:
+    """Marks the time windows in which JARVIS itself is speaking"""
+
+    def __init__(self, echo_tail=0.3, max_windows=20):
+        self.echo_tail = echo_tail
+        self.windows = deque(maxlen=max_windows)
+        self.lock = threading.Lock()
+        self.playback_started = None
+
+    def begin(self):
+        """Mark the start of TTS playback"""
+        with self.lock:
+            self.playback_started = time.time()
+
+    def end(self):
+        """Mark the end of TTS playback"""
+        with self.lock:
+            if self.playback_started is not None:
+                self.windows.append((self.playback_started, time.time()))
+                self.playback_started = None
+
+    @property
+    def is_playing(self):
+        return self.playback_started is not None
+
+    def overlaps(self, capture_start, capture_end=None):
+        """Check whether a capture window overlapped our own playback"""
+        capture_end = capture_end or time.time()
+        with self.lock:
+            if self.playback_started is not None and self.playback_started < capture_end:
+                return True
+
+            for start, end in self.windows:
+                if start < capture_end and capture_start < end + self.echo_tail:
+                    return True
+        return False
+
+
+# Shared between the TTS side (LanguageSupport) and every capture path
+playback_marker = PlaybackMarker()
+
+
+class NoiseFloor:
+    """Ambient energy measured by the recognizer, reused until it is max_age seconds old instead of re-measured"""
+
+    def __init__(self, max_age=None):
+        self.max_age = max_age or config.noise_floor_max_age
+        self.level = None
+        self.measured_at = None
+
+    def is_fresh(self):
+        return self.level is not None and time.time() - self.measured_at < self.max_age
+
+    def record(self, level):
+        """Remember a level measured by adjust_for_ambient_noise"""
+        self.level = level
+        self.measured_at = time.time()
+
+    def threshold(self):
+        """Energy threshold for listening: the configured one, raised in rooms noisier than that"""
+        return max(self.level or 0, config.energy_threshold)
+
+    def snapshot(self):
+        if self.level is None:
+            return None
+        return {'level': self.level, 'measured_at': self.measured_at}
+
+    def restore(self, data):
+        level, measured_at = float(data['level']), float(data['measured_at'])
+        if time.time() - measured_at < self.max_age:
+            self.level, self.measured_at = level, measured_at
+
+
+# Shared by every capture path, and saved with the warm state
+noise_floor = NoiseFloor()
+
+
+class BargeInDetector:
+    """Energy-based voice activity detector that runs while JARVIS is speaking"""
+
+    def __init__(self, on_speech, energy_ratio=None, min_speech_ms=None):
+        self.on_speech = on_speech
+        self.energy_ratio = energy_ratio or config.barge_in_energy_ratio
+        self.min_speech_ms = min_speech_ms or config.barge_in_min_speech_ms
+        self.base_threshold = config.energy_threshold
+        self.triggered = False
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def is_available(self):
+        """Barge-in needs a real microphone"""
+        if os.getenv('JARVIS_DEMO_MODE') or (os.getenv('DISPLAY') is None and os.name != 'nt'):
+            return False
+        return True
+
+    def set_energy_threshold(self, threshold):
+        """Use the threshold calibrated by the recognizer as the baseline"""
+        if threshold:
+            self.base_threshold = threshold
+
+    def arm(self):
+        """Start monitoring the microphone for the current utterance"""
+        if not self.is_available() or (self.thread and self.thread.is_alive()):
+            return False
+
+        self.triggered = False
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._monitor)
+        self.thread.daemon = True
+        self.thread.start()
+        return True
+
+    def disarm(self):
+        """Stop monitoring once playback has finished"""
+        self.stop_event.set()
+        if self.thread and self.thread is not threading.current_thread():
+            self.thread.join(timeout=1)
+        self.thread = None
+
+    def _monitor(self):
+        """Read microphone frames and fire on sustained speech"""
+        try:
+            with sr.Microphone() as source:
+                frame_ms = 1000.0 * source.CHUNK / source.SAMPLE_RATE
+                needed_frames = max(1, int(math.ceil(self.min_speech_ms / frame_ms)))
+                # Our own voice leaks into the mic, so demand more than the usual threshold
+                threshold = self.base_threshold * self.energy_ratio
+                loud_frames = 0
+
+                while not self.stop_event.is_set():
+                    frame = source.stream.read(source.CHUNK)
+                    if frame_energy(frame, source.SAMPLE_WIDTH) > threshold:
+                        loud_frames += 1
+                    else:
+                        loud_frames = 0
+
+                    if loud_frames >= needed_frames:
+                        self.triggered = True
+                        print("✋ Barge-in detected, stopping playback")
+                        self.on_speech()
+                        break
+        except Exception as e:
+            print(f"Barge-in monitor unavailable: {e}")
@@ -0,0 +1,118 @@
+"""
+Voice loop for JARVIS
+Listen, dispatch and speak until stopped; the Qt GUI thread and the headless daemon both run this loop
+"""
+
+import time
+import datetime
+
+from Jarvis.features.tracing import tracer
+
+
+class VoiceLoop:
+    """The assistant's listen/dispatch/speak cycle, with optional callbacks for a front end"""
+
+    def __init__(self, assistant, listen=None, on_status=None, on_command=None, on_error=None, pause=0.5):
+        self.assistant = assistant
+        self.listen = listen or assistant.mic_input  # returns a command, or a falsy value if nothing was heard
+        self.on_status = on_status  # (message)
+        self.on_command = on_command  # (command, response)
+        self.on_error = on_error  # (message)
+        self.pause = pause  # seconds between commands, so the loop never spins
+        self.is_running = False
+        self.command_count = 0
+
+    def speak(self, text):
+        self.assistant.tts(text)
+
+    def status(self, message):
+        if self.on_status:
+            self.on_status(message)
+
+    def greet(self):
+        """Time-of-day greeting, the current time and a ready message"""
+        hour = datetime.datetime.now().hour
+        if hour <= 12:
+            self.speak("Good Morning")
+        elif hour < 18:
+            self.speak("Good afternoon")
+        else:
+            self.speak("Good evening")
+
+        c_time = self.assistant.tell_time()
+        self.speak(self.assistant.language_support.get_template('time_response', time=c_time))
+        self.speak("I am JARVIS Enhanced Assistant. Online and ready sir. Please tell me how may I help you")
+
+    def respond(self, command, on_part=None):
+        """Answer one command; unknown commands get the closest suggestions, 'goodbye' ends the loop"""
+        try:
+            # Every command, desktop ones included, is dispatched through the intent registry
+            response = self.assistant.process_command_intelligently(command, on_part)
+
+            if self.assistant.last_intent == 'goodbye':
+                self.stop()
+            elif self.assistant.last_intent is None:
+                suggestions = self.assistant.get_context_suggestions(command)
+                help_msg = "I didn't understand that command. "
+                if suggestions:
+                    help_msg += f"Did you mean: {', '.join(suggestions[:2])}? "
+                help_msg += "Say 'help' to see all available commands."
+                return help_msg
+
+            return response
+
+        except Exception as e:
+            return self.assistant.error_handler.handle_error('command_error', e, 'command_processing')
+
+    def run_once(self):
+        """Listen for one command and answer it; False if nothing was heard"""
+        # One trace per utterance, from capture to the end of speech
+        with tracer.trace('utterance') as utterance:
+            return self._run_once(utterance)
+
+    def _run_once(self, utterance):
+        self.status("👂 Listening...")
+        command = self.listen()
+        if not command:
+            utterance.discard()
+            return False
+        utterance.set(command=command)
+
+        self.command_count += 1
+        self.status(f"🎯 Processing command #{self.command_count}")
+
+        # Speak each answer as soon as it is ready
+        spoken = []
+
+        def speak_part(part):
+            self.speak(part)
+            spoken.append(part)
+
+        response = self.respond(command, speak_part)
+        if self.on_command:
+            self.on_command(command, response)
+
+        # Speak the response unless its parts were already spoken
+        if response and not spoken:
+            self.speak(response)
+        return True
+
+    def run(self):
+        """Answer commands until stop() or 'goodbye'"""
+        self.is_running = True
+        self.status("🎤 Ready for voice commands")
+        while self.is_running:
+            try:
+                self.run_once()
+                time.sleep(self.pause)
+            except (KeyboardInterrupt, EOFError):
+                self.stop()
+            except Exception as e:
+                error_msg = self.assistant.error_handler.handle_error('system_error', e, 'task_execution')
+                if self.on_error:
+                    self.on_error(error_msg)
+                self.speak(error_msg)
+
+    def stop(self):
+        """Finish after the current command"""
+        self.is_running = False
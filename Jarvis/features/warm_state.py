@@ -0,0 +1,160 @@
+"""
+Warm-state snapshots for JARVIS
+Things learned while running (noise floor, voice map, location, geocodes) are saved on shutdown and periodically,
+and restored at the next start on the same machine so it does not have to rediscover them
+"""
+
+import os
+import json
+import time
+import socket
+import platform
+import tempfile
+import threading
+
+STATE_VERSION = 1  # bump when a section's format changes; older snapshots are then ignored
+
+RESTORED = 'restored'
+EXPIRED = 'expired'
+REJECTED = 'rejected'
+MISSING = 'missing'
+
+
+def machine_id():
+    """Identifies this machine, so a snapshot copied from another one is not trusted"""
+    return f"{socket.gethostname()}|{platform.system()}|{platform.machine()}"
+
+
+class WarmSection:
+    """One named piece of warm state"""
+
+    def __init__(self, name, capture, restore=None, max_age=None):
+        self.name = name
+        self.capture = capture  # () -> JSON-serializable data, or None to keep what was saved before
+        self.restore = restore  # (data) -> None; raising rejects the data
+        self.max_age = max_age  # seconds a saved copy stays usable, None for no limit
+        self.state = MISSING
+
+
+class WarmState:
+    """Versioned snapshot file of warm state sections"""
+
+    def __init__(self, path, max_age=None):
+        self.path = path
+        self.max_age = max_age  # seconds after which the whole snapshot is ignored
+        self.sections = {}
+        self.saved = {}  # name -> {'saved_at', 'data'} from the snapshot file or the last save
+        self.load_error = None
+        self.saves = 0
+        self.last_saved_at = None
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def load(self):
+        """Read the snapshot; one from another version or machine, or too old, is ignored"""
+        try:
+            if not os.path.exists(self.path):
+                self.load_error = 'no snapshot'
+                return False
+            with open(self.path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+
+            if snapshot.get('version') != STATE_VERSION:
+                self.load_error = f"version {snapshot.get('version')} != {STATE_VERSION}"
+            elif snapshot.get('machine') != machine_id():
+                self.load_error = 'saved on another machine'
+            elif self.max_age is not None and time.time() - snapshot.get('saved_at', 0) > self.max_age:
+                self.load_error = 'snapshot too old'
+            else:
+                self.saved = {
+                    name: section for name, section in snapshot.get('sections', {}).items()
+                    if isinstance(section, dict) and 'data' in section and 'saved_at' in section
+                }
+                self.load_error = None
+                return True
+        except Exception as e:
+            self.load_error = f"{type(e).__name__}: {e}"
+            print(f"Error loading warm state: {e}")
+        return False
+
+    def register(self, name, capture, restore=None, max_age=None):
+        """Add a section and, if the snapshot has a fresh copy of it, restore it right away"""
+        section = WarmSection(name, capture, restore, max_age)
+        self.sections[name] = section
+
+        saved = self.saved.get(name)
+        if saved is None or restore is None:
+            return section
+        if max_age is not None and time.time() - saved['saved_at'] > max_age:
+            section.state = EXPIRED
+            del self.saved[name]
+            return section
+
+        try:
+            restore(saved['data'])
+            section.state = RESTORED
+        except Exception as e:
+            print(f"Discarding warm state '{name}': {e}")
+            section.state = REJECTED
+            del self.saved[name]
+        return section
+
+    def save(self):
+        """Capture every section and replace the snapshot file atomically"""
+        with self.lock:
+            now = time.time()
+            for name, section in self.sections.items():
+                try:
+                    data = section.capture()
+                except Exception as e:
+                    print(f"Error capturing warm state '{name}': {e}")
+                    continue
+                previous = self.saved.get(name)
+                if data is not None and (previous is None or previous['data'] != data):
+                    # Unchanged data keeps its original time, so restored state still ages out
+                    self.saved[name] = {'saved_at': now, 'data': data}
+
+            snapshot = {'version': STATE_VERSION, 'machine': machine_id(), 'saved_at': now, 'sections': self.saved}
+            temp_path = None
+            try:
+                directory = os.path.dirname(self.path) or '.'
+                os.makedirs(directory, exist_ok=True)
+                fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.warm_state.')
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(snapshot, f, ensure_ascii=False)
+                os.replace(temp_path, self.path)
+            except Exception as e:
+                print(f"Error saving warm state: {e}")
+                if temp_path is not None and os.path.exists(temp_path):
+                    os.remove(temp_path)  # a half-written snapshot must not pile up next to the real one
+                return False
+
+            self.saves += 1
+            self.last_saved_at = now
+            return True
+
+    def start_autosave(self, interval, save=None):
+        """Save every interval seconds on a background thread; save defaults to self.save"""
+        if self.thread is None and interval:
+            def autosave():
+                while not self.stopped.wait(interval):
+                    (save or self.save)()
+
+            self.thread = threading.Thread(target=autosave, name='jarvis-warm-state', daemon=True)
+            self.thread.start()
+        return self.thread
+
+    def stop(self):
+        """Stop the periodic saves"""
+        self.stopped.set()
+
+    def get_stats(self):
+        """What was restored at startup, and when state was last saved"""
+        return {
+            'path': self.path,
+            'load_error': self.load_error,
+            'sections': {name: section.state for name, section in self.sections.items()},
+            'saves': self.saves,
+            'last_saved_age': round(time.time() - self.last_saved_at, 1) if self.last_saved_at else None
+        }
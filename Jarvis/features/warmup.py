@@ -0,0 +1,158 @@
+"""
+Deferred warmup for JARVIS
+Startup work runs once, on a background thread, in priority and dependency order; optional work waits for an idle moment
+"""
+
+import os
+import time
+import threading
+
+CRITICAL = 0  # needed before the first command, runs first
+NORMAL = 1  # useful soon, runs right after
+IDLE = 2  # nice to have, only runs while nothing else is happening
+
+PENDING = 'pending'
+DONE = 'done'
+FAILED = 'failed'
+SKIPPED = 'skipped'
+
+
+class WarmupTask:
+    """One piece of startup work"""
+
+    def __init__(self, name, func, priority=NORMAL, depends_on=(), optional=None):
+        self.name = name
+        self.func = func
+        self.priority = priority
+        self.depends_on = list(depends_on)
+        self.optional = priority == IDLE if optional is None else optional  # may be skipped under load
+        self.state = PENDING
+        self.seconds = None
+        self.error = None
+        self.finished = threading.Event()
+
+
+class WarmupScheduler:
+    """Runs each warmup task once, highest priority first, after the tasks it depends on"""
+
+    def __init__(self, is_busy=None, idle_wait=30.0, max_load=0.75):
+        self.tasks = {}
+        self.is_busy = is_busy  # callable: True while a command is running or JARVIS is speaking
+        self.idle_wait = idle_wait  # seconds an optional task waits for an idle moment before it is skipped
+        self.max_load = max_load  # load average per CPU above which the machine counts as busy
+        self.thread = None
+        self.stopped = threading.Event()
+        self.lock = threading.Lock()
+
+    def add(self, name, func, priority=NORMAL, depends_on=(), optional=None):
+        """Register a task; registering a name twice keeps the first, so nothing is warmed twice"""
+        with self.lock:
+            if name not in self.tasks:
+                self.tasks[name] = WarmupTask(name, func, priority, depends_on, optional)
+            return self.tasks[name]
+
+    def start(self):
+        """Run the registered tasks on a background thread"""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run_all, name='jarvis-warmup', daemon=True)
+            self.thread.start()
+        return self.thread
+
+    def wait(self, name, timeout=None):
+        """Block until a task has finished (or been skipped); False if it has not by the timeout"""
+        task = self.tasks.get(name)
+        return task is None or task.finished.wait(timeout)
+
+    def stop(self):
+        """Skip whatever has not started yet"""
+        self.stopped.set()
+
+    def _ordered(self):
+        """Tasks sorted by priority, each after the tasks it depends on"""
+        ordered, visiting = [], set()
+
+        def visit(task):
+            if task in ordered or task.name in visiting:
+                return
+            visiting.add(task.name)
+            for dependency in task.depends_on:
+                if dependency in self.tasks:
+                    visit(self.tasks[dependency])
+            ordered.append(task)
+
+        for task in sorted(self.tasks.values(), key=lambda task: task.priority):
+            visit(task)
+        return ordered
+
+    def _run_all(self):
+        for task in self._ordered():
+            if self.stopped.is_set():
+                self._skip(task, 'stopped')
+                continue
+            if task.optional and not self._wait_for_idle():
+                self._skip(task, 'system busy')
+                continue
+            self._run(task)
+
+    def _skip(self, task, reason):
+        """Mark a task skipped, unless it has already been started or finished elsewhere"""
+        with self.lock:
+            if task.state != PENDING:
+                return
+            task.state = 'running'
+        self._finish(task, SKIPPED, reason)
+
+    def _run(self, task):
+        with self.lock:
+            if task.state != PENDING:
+                return
+            task.state = 'running'
+
+        for dependency in task.depends_on:
+            self.wait(dependency)
+            if self.tasks.get(dependency) and self.tasks[dependency].state != DONE:
+                self._finish(task, SKIPPED, f"{dependency} did not finish")
+                return
+
+        started = time.perf_counter()
+        try:
+            task.func()
+            task.seconds = time.perf_counter() - started
+            self._finish(task, DONE)
+        except Exception as e:
+            task.seconds = time.perf_counter() - started
+            print(f"Warmup error in {task.name}: {e}")
+            self._finish(task, FAILED, str(e))
+
+    def _finish(self, task, state, error=None):
+        task.state = state
+        task.error = error
+        task.finished.set()
+
+    def busy(self):
+        """Whether optional work should hold off"""
+        if self.is_busy and self.is_busy():
+            return True
+        if hasattr(os, 'getloadavg'):
+            return os.getloadavg()[0] / (os.cpu_count() or 1) > self.max_load
+        return False
+
+    def _wait_for_idle(self):
+        """Wait until the system is idle; False if it stays busy for idle_wait seconds"""
+        deadline = time.monotonic() + self.idle_wait
+        while self.busy():
+            if time.monotonic() > deadline or self.stopped.wait(0.25):
+                return False
+        return True
+
+    def get_stats(self):
+        """State and duration of every task"""
+        return {
+            task.name: {
+                'state': task.state,
+                'priority': ('critical', 'normal', 'idle')[task.priority],
+                'ms': None if task.seconds is None else round(task.seconds * 1e3, 1),
+                **({'reason': task.error} if task.error else {})
+            }
+            for task in self._ordered()
+        }
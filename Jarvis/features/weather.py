@@ -1,5 +1,7 @@
 import requests
 from Jarvis.config import config
+from Jarvis.features.deadline import http_timeout
+from Jarvis.features.tracing import tracer
 
 
 
@@ -15,7 +17,8 @@ def fetch_weather(city):
     base_url = "http://api.openweathermap.org/data/2.5/weather?q="
     complete_url = base_url + city + "&appid=" + api_key + units_format
 
-    response = requests.get(complete_url)
+    with tracer.span('http', host='api.openweathermap.org'):
+        response = requests.get(complete_url, timeout=http_timeout())
 
     city_weather_data = response.json()
 
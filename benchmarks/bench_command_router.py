@@ -0,0 +1,117 @@
+"""
+Command router benchmark
+Compares the old nested substring scan, a regex alternation and the Aho-Corasick CommandRouter with thousands of patterns
+
+    python benchmarks/bench_command_router.py [--patterns N] [--queries N]
+"""
+
+import os
+import re
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Jarvis.features.command_router import CommandRouter
+
+WORDS = [
+    'open', 'close', 'play', 'stop', 'pause', 'next', 'previous', 'set', 'show', 'hide', 'send', 'read',
+    'music', 'song', 'video', 'file', 'folder', 'window', 'screen', 'light', 'door', 'alarm', 'reminder',
+    'weather', 'news', 'time', 'date', 'volume', 'message', 'email', 'note', 'calendar', 'meeting', 'task',
+    'kitchen', 'bedroom', 'office', 'morning', 'evening', 'tomorrow', 'today', 'up', 'down', 'all', 'my',
+]
+
+
+def make_patterns(count, rng):
+    """Unique 1-3 word phrases, the shape of real voice command patterns"""
+    patterns = set()
+    while len(patterns) < count:
+        patterns.add(' '.join(rng.choice(WORDS) for _ in range(rng.randint(1, 3))))
+    return sorted(patterns)
+
+
+def make_queries(count, rng):
+    """Short utterances, roughly half of which contain a multi-word command"""
+    queries = []
+    for _ in range(count):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(3, 8))]
+        if rng.random() < 0.5:
+            words.insert(0, 'please')
+        queries.append(' '.join(words))
+    return queries
+
+
+def nested_scan(categories, text):
+    """The previous find_matching_command(): first hit in declaration order"""
+    for category, patterns in categories.items():
+        for pattern in patterns:
+            if pattern in text:
+                return category
+    return None
+
+
+def nested_longest(categories, text):
+    """Nested scan that honours specificity: every pattern is checked to find the longest hit"""
+    best = None
+    for category, patterns in categories.items():
+        for pattern in patterns:
+            if pattern in text and (best is None or len(pattern) > len(best[1])):
+                best = (category, pattern)
+    return best
+
+
+def timed(name, fn, queries, build_seconds=None):
+    """Run fn over every query and print the time per query"""
+    start = time.perf_counter()
+    for query in queries:
+        fn(query)
+    per_query_us = (time.perf_counter() - start) / len(queries) * 1e6
+    build = f"   build {build_seconds * 1e3:8.1f} ms" if build_seconds is not None else ""
+    print(f"{name:<20} {per_query_us:10.1f} us/query{build}")
+    return per_query_us
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--patterns', type=int, default=5000, help='number of patterns to route')
+    parser.add_argument('--queries', type=int, default=2000, help='number of utterances to route')
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    patterns = make_patterns(args.patterns, rng)
+    queries = make_queries(args.queries, rng)
+    categories = {}
+    for index, pattern in enumerate(patterns):
+        categories.setdefault(f"category_{index % 50}", []).append(pattern)
+
+    start = time.perf_counter()
+    router = CommandRouter()
+    for category, category_patterns in categories.items():
+        for pattern in category_patterns:
+            router.add(pattern, category)
+    router.compile()
+    router_build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ordered = sorted(patterns, key=len, reverse=True)
+    regex = re.compile('|'.join(re.escape(pattern) for pattern in ordered))
+    regex_build = time.perf_counter() - start
+
+    print(f"{len(patterns)} patterns, {len(queries)} queries")
+    timed('nested, first hit', lambda text: nested_scan(categories, text), queries)
+    nested = timed('nested, longest hit', lambda text: nested_longest(categories, text), queries)
+    timed('regex alternation', regex.search, queries, regex_build)
+    routed = timed('CommandRouter', router.match, queries, router_build)
+    print(f"speedup over a longest-hit nested scan {nested / routed:.1f}x")
+
+    # Every routed pattern must be a longest substring hit
+    for query in queries[:200]:
+        _, pattern = router.match(query)
+        longest = max((len(p) for p in patterns if p in query), default=None)
+        assert (pattern is None and longest is None) or len(pattern) == longest, query
+
+
+if __name__ == "__main__":
+    main()
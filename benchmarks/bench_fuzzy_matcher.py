@@ -0,0 +1,95 @@
+"""
+Fuzzy matcher benchmark
+Scores misheard commands against thousands of phrases: difflib one phrase at a time vs the vectorized TF-IDF FuzzyMatcher
+
+    python benchmarks/bench_fuzzy_matcher.py [--patterns N] [--queries N]
+"""
+
+import os
+import sys
+import time
+import random
+import difflib
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Jarvis.features.fuzzy_matcher import FuzzyMatcher
+
+SYLLABLES = [consonant + vowel for consonant in 'bcdfghklmnprstvwz' for vowel in 'aeiou']
+
+
+def make_vocabulary(count, rng):
+    """Pronounceable made-up words, so every phrase has its own content like a real command set"""
+    words = set()
+    while len(words) < count:
+        words.add(''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+def make_patterns(count, vocabulary, rng):
+    """Unique 1-3 word phrases, the shape of real voice command patterns"""
+    patterns = set()
+    while len(patterns) < count:
+        patterns.add(' '.join(rng.choice(vocabulary) for _ in range(rng.randint(1, 3))))
+    return sorted(patterns)
+
+
+def mishear(phrase, rng):
+    """Drop, double or swap a letter in each word, the way speech recognition garbles a command"""
+    words = []
+    for word in phrase.split():
+        index = rng.randrange(len(word))
+        edit = rng.choice(['drop', 'double', 'swap'])
+        if edit == 'drop' and len(word) > 2:
+            word = word[:index] + word[index + 1:]
+        elif edit == 'double':
+            word = word[:index] + word[index] + word[index:]
+        elif index < len(word) - 1:
+            word = word[:index] + word[index + 1] + word[index] + word[index + 2:]
+        words.append(word)
+    return ' '.join(words)
+
+
+def difflib_best(patterns, text):
+    """Closest phrase by SequenceMatcher ratio, checking every phrase"""
+    return max(patterns, key=lambda pattern: difflib.SequenceMatcher(None, text, pattern).ratio())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--patterns', type=int, default=5000, help='number of known phrases')
+    parser.add_argument('--queries', type=int, default=500, help='number of misheard commands')
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    patterns = make_patterns(args.patterns, make_vocabulary(args.patterns, rng), rng)
+    targets = [rng.choice(patterns) for _ in range(args.queries)]
+    queries = [f"please {mishear(target, rng)} now" for target in targets]
+
+    start = time.perf_counter()
+    matcher = FuzzyMatcher()
+    for index, pattern in enumerate(patterns):
+        matcher.add(pattern, index)
+    matcher.compile()
+    build_ms = (time.perf_counter() - start) * 1e3
+
+    print(f"{len(patterns)} phrases, {len(queries)} misheard commands (index built in {build_ms:.1f} ms)")
+
+    sample = queries[:max(1, len(queries) // 10)]
+    start = time.perf_counter()
+    difflib_hits = sum(difflib_best(patterns, query) == target for query, target in zip(sample, targets))
+    difflib_us = (time.perf_counter() - start) / len(sample) * 1e6
+    print(f"{'difflib':<14} {difflib_us:10.1f} us/query   top-1 {difflib_hits / len(sample):6.1%} (first {len(sample)})")
+
+    start = time.perf_counter()
+    ranked = [matcher.rank(query, 3) for query in queries]
+    fuzzy_us = (time.perf_counter() - start) / len(queries) * 1e6
+    top1 = sum(bool(result) and result[0][1] == target for result, target in zip(ranked, targets))
+    top3 = sum(any(phrase == target for _, phrase, _ in result) for result, target in zip(ranked, targets))
+    print(f"{'FuzzyMatcher':<14} {fuzzy_us:10.1f} us/query   top-1 {top1 / len(queries):6.1%}   top-3 {top3 / len(queries):6.1%}")
+    print(f"speedup {difflib_us / fuzzy_us:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
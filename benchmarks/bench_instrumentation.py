@@ -0,0 +1,50 @@
+"""
+Instrumentation overhead benchmark
+Cost of one call to a trivial function: plain, wrapped with recording off, and wrapped with recording on
+
+    python benchmarks/bench_instrumentation.py [--calls N]
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Jarvis.features.instrumentation import InstrumentationRegistry
+
+
+def noop(value):
+    return value
+
+
+def per_call_ns(func, calls):
+    start = time.perf_counter()
+    for index in range(calls):
+        func(index)
+    return (time.perf_counter() - start) / calls * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--calls', type=int, default=1000000, help='calls per measurement')
+    parser.add_argument('--repeat', type=int, default=5, help='measurements to take the best of')
+    args = parser.parse_args()
+
+    registry = InstrumentationRegistry()
+    wrapped = registry.wrap(noop, 'bench.noop')
+
+    plain = min(per_call_ns(noop, args.calls) for _ in range(args.repeat))
+    registry.disable()
+    disabled = min(per_call_ns(wrapped, args.calls) for _ in range(args.repeat))
+    registry.enable()
+    enabled = min(per_call_ns(wrapped, args.calls // 10) for _ in range(args.repeat))
+
+    print(f"plain call            {plain:>7.0f} ns")
+    print(f"wrapped, disabled     {disabled:>7.0f} ns   (+{disabled - plain:.0f} ns)")
+    print(f"wrapped, recording    {enabled:>7.0f} ns   (+{enabled - plain:.0f} ns)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Language detection benchmark
+Compares plain langdetect with the layered LanguageDetector on short voice commands
+
+    python benchmarks/bench_language_detection.py [--repeat N]
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langdetect import DetectorFactory, detect
+
+from Jarvis.features.language_detection import LanguageDetector
+
+SUPPORTED = ['en', 'hi', 'es', 'fr', 'de', 'it', 'pt', 'ru', 'ja', 'ko', 'zh', 'ar',
+             'bn', 'ta', 'te', 'ml', 'gu', 'kn', 'mr', 'pa', 'ur', 'tr']
+
+# (expected language, short command as a user would say it)
+COMMANDS = [
+    ('en', 'what time is it'),
+    ('en', 'open youtube'),
+    ('en', 'weather in london'),
+    ('es', 'qué hora es'),
+    ('es', 'abre el navegador'),
+    ('fr', 'quelle heure est-il'),
+    ('de', 'wie spät ist es'),
+    ('it', 'che ore sono'),
+    ('pt', 'que horas são'),
+    ('tr', 'saat kaç'),
+    ('hi', 'समय क्या है'),
+    ('hi', 'मौसम बताओ'),
+    ('mr', 'आज हवामान कसे आहे'),
+    ('bn', 'এখন কটা বাজে'),
+    ('ta', 'நேரம் என்ன'),
+    ('te', 'సమయం ఎంత'),
+    ('ml', 'സമയം എത്രയായി'),
+    ('gu', 'કેટલા વાગ્યા'),
+    ('kn', 'ಸಮಯ ಎಷ್ಟು'),
+    ('pa', 'ਕੀ ਸਮਾਂ ਹੈ'),
+    ('ar', 'كم الساعة'),
+    ('ur', 'کیا وقت ہے'),
+    ('ru', 'который час'),
+    ('ja', '今何時ですか'),
+    ('ko', '지금 몇 시야'),
+    ('zh', '现在几点'),
+]
+
+
+def baseline_detect(text):
+    """The detector LanguageSupport used before: langdetect on every call"""
+    try:
+        detected_lang = detect(text)
+        return detected_lang if detected_lang in SUPPORTED else 'en'
+    except Exception:
+        return 'en'
+
+
+def run(name, detect_fn, repeat):
+    """Time detect_fn over the corpus and score it against the expected labels"""
+    correct = sum(1 for expected, text in COMMANDS if detect_fn(text) == expected)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for _, text in COMMANDS:
+            detect_fn(text)
+    elapsed = time.perf_counter() - start
+
+    per_call_us = elapsed / (repeat * len(COMMANDS)) * 1e6
+    print(f"{name:<22} {per_call_us:>10.1f} us/call   accuracy {correct}/{len(COMMANDS)}")
+    return per_call_us
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=20, help='passes over the command corpus')
+    args = parser.parse_args()
+
+    DetectorFactory.seed = 0
+    baseline_detect('warm up')  # load langdetect profiles outside the timed loop
+
+    detector = LanguageDetector(SUPPORTED)
+    baseline = run('langdetect', baseline_detect, args.repeat)
+    layered = run('LanguageDetector', detector.detect, args.repeat)
+
+    print(f"speedup {baseline / layered:.0f}x, layers used: {detector.stats}")
+
+
+if __name__ == "__main__":
+    main()
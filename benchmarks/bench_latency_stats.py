@@ -0,0 +1,75 @@
+"""
+Latency statistics benchmark
+Compares the old list-of-dicts response time recorder with the ring buffer + histogram in ResponseTimeOptimizer
+
+    python benchmarks/bench_latency_stats.py [--samples N]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Jarvis.features.latency_stats import LatencyStats
+
+
+class ListRecorder:
+    """The recorder ResponseTimeOptimizer used before: a dict with an ISO timestamp per sample, trimmed to 100"""
+
+    def __init__(self):
+        self.times = []
+
+    def record(self, seconds):
+        self.times.append({'time': seconds, 'timestamp': datetime.now().isoformat()})
+        if len(self.times) > 100:
+            self.times = self.times[-100:]
+
+    def summary(self):
+        values = [entry['time'] for entry in self.times]
+        return {'average': sum(values) / len(values), 'min': min(values), 'max': max(values), 'count': len(values)}
+
+
+def run(name, recorder, samples):
+    """Time recording every sample and one summary, and measure the memory 10000 more samples keep allocated"""
+    start = time.perf_counter()
+    for seconds in samples:
+        recorder.record(seconds)
+    record_ns = (time.perf_counter() - start) / len(samples) * 1e9
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for seconds in samples[:10000]:
+        recorder.record(seconds)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    recorder.summary()  # the first NumPy percentile call pays for lazy imports inside NumPy
+    start = time.perf_counter()
+    summary = recorder.summary()
+    summary_us = (time.perf_counter() - start) * 1e6
+
+    print(f"{name:<14} record {record_ns:>7.0f} ns/sample   retained {(after - before) / 1024:>6.1f} KiB   summary {summary_us:>8.1f} us")
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--samples', type=int, default=200000, help='latencies to record')
+    args = parser.parse_args()
+
+    random.seed(0)
+    samples = [random.lognormvariate(-3, 1) for _ in range(args.samples)]  # ~50 ms median, long tail
+
+    run('list of dicts', ListRecorder(), samples)
+    summary = run('LatencyStats', LatencyStats(), samples)
+    print(f"p50 {summary['p50'] * 1e3:.1f} ms, p95 {summary['p95'] * 1e3:.1f} ms, p99 {summary['p99'] * 1e3:.1f} ms "
+          f"(lifetime p99 {summary['lifetime']['p99'] * 1e3:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+"""
+Startup benchmark
+Cold and warm import time per module (from -X importtime), constructor time per subsystem and time to the first
+command, written as JSON and checked against budgets so startup regressions fail before release
+
+    python benchmarks/bench_startup.py [--repeat N] [--output startup.json] [--budgets benchmarks/startup_budgets.json]
+
+Exits with status 1 if any measurement is over its budget, a budgeted measurement is missing, or a child run failed.
+Measurements that were skipped on purpose (the GUI without PyQt5 or with --no-gui) are not failures.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BUDGETS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'startup_budgets.json')
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+# =================== IMPORT TIME ===================
+
+def parse_importtime(stderr):
+    """Per-module self and cumulative import time (ms) and nesting depth from -X importtime output"""
+    modules = {}
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules[name] = {
+                'self_ms': int(self_us) / 1e3,
+                'cumulative_ms': int(cumulative_us) / 1e3,
+                'depth': (len(indent) - 1) // 2
+            }
+    return modules
+
+
+def measure_import(module, pycache_prefix):
+    """Import a module in a fresh interpreter; bytecode lives under pycache_prefix, so an empty prefix means cold"""
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=pycache_prefix)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)  # warm runs need the bytecode the cold run wrote
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, env=env, capture_output=True, text=True
+    )
+    wall_ms = (time.perf_counter() - started) * 1e3
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+    modules = parse_importtime(result.stderr)
+    return {'total_ms': modules.get(module, {}).get('cumulative_ms'), 'process_ms': wall_ms, 'modules': modules}
+
+
+def top_modules(modules, limit, prefix=None):
+    """Slowest modules by cumulative time, optionally only those under a package"""
+    selected = {
+        name: entry for name, entry in modules.items()
+        if (prefix is None or name == prefix or name.startswith(prefix + '.'))
+    }
+    ranked = sorted(selected.items(), key=lambda item: -item[1]['cumulative_ms'])[:limit]
+    return {name: {'self_ms': round(entry['self_ms'], 2), 'cumulative_ms': round(entry['cumulative_ms'], 2)}
+            for name, entry in ranked}
+
+
+def third_party_roots(modules):
+    """Cumulative import time of each top-level package imported directly by Jarvis"""
+    roots = {}
+    for name, entry in modules.items():
+        root = name.split('.')[0]
+        if root in ('Jarvis', 'encodings') or root in sys.stdlib_module_names or root.startswith('_'):
+            continue
+        roots[root] = max(roots.get(root, 0.0), entry['cumulative_ms'])
+    return {name: round(ms, 2) for name, ms in sorted(roots.items(), key=lambda item: -item[1])}
+
+
+def import_benchmark(module, repeat, limit):
+    """One cold import, then the median of warm ones"""
+    prefix = tempfile.mkdtemp(prefix='jarvis-bench-pycache-')
+    try:
+        cold = measure_import(module, prefix)
+        warm_runs = [measure_import(module, prefix) for _ in range(repeat)]
+    finally:
+        shutil.rmtree(prefix, ignore_errors=True)
+
+    warm = min(warm_runs, key=lambda run: abs(run['total_ms'] - statistics.median(r['total_ms'] for r in warm_runs)))
+    return {
+        'cold_ms': round(cold['total_ms'], 2),
+        'warm_ms': round(statistics.median(run['total_ms'] for run in warm_runs), 2),
+        'warm_runs_ms': [round(run['total_ms'], 2) for run in warm_runs],
+        'warm_process_ms': round(statistics.median(run['process_ms'] for run in warm_runs), 2),
+        'slowest_jarvis_modules': top_modules(warm['modules'], limit, 'Jarvis'),
+        'slowest_modules': top_modules(warm['modules'], limit),
+        'third_party_packages': dict(list(third_party_roots(warm['modules']).items())[:limit])
+    }
+
+
+# =================== CONSTRUCTORS (run in a child process) ===================
+
+def timed(results, name, func):
+    started = time.perf_counter()
+    try:
+        value = func()
+        results[name] = round((time.perf_counter() - started) * 1e3, 2)
+        return value
+    except Exception as e:
+        results[name] = None
+        results.setdefault('errors', {})[name] = f"{type(e).__name__}: {e}"
+        return None
+
+
+def child_constructors(first_command):
+    """Time each subsystem, the whole assistant and its first command; prints JSON on the last line of stdout"""
+    sys.path.insert(0, ROOT)
+    real_stdout = sys.stdout
+    sys.stdout = sys.stderr  # the assistant's own prints must not mix with the JSON
+
+    results = {}
+    timed(results, 'import_jarvis_ms', lambda: __import__('Jarvis'))
+
+    from Jarvis.features.language_support import LanguageSupport
+    from Jarvis.features.performance_optimizer import PerformanceOptimizer
+    from Jarvis.features.enhanced_features import EnhancedErrorHandler, EnhancedVoiceCommands, ContextAwareProcessor
+    from Jarvis.features.command_patterns import CommandPatterns
+    from Jarvis.features.intents import build_registry
+
+    subsystems = {}
+    language_support = timed(subsystems, 'LanguageSupport', LanguageSupport)
+    optimizer = timed(subsystems, 'PerformanceOptimizer', PerformanceOptimizer)
+    error_handler = timed(subsystems, 'EnhancedErrorHandler', lambda: EnhancedErrorHandler(language_support))
+    timed(subsystems, 'EnhancedVoiceCommands', lambda: EnhancedVoiceCommands(error_handler))
+    timed(subsystems, 'ContextAwareProcessor', ContextAwareProcessor)
+    timed(subsystems, 'CommandPatterns', CommandPatterns)
+    timed(subsystems, 'IntentRegistry', build_registry)
+    results['subsystems_ms'] = subsystems
+    if optimizer is not None:
+        optimizer.warmup.stop()
+
+    from Jarvis import JarvisAssistant
+    jarvis = timed(results, 'jarvis_assistant_ms', JarvisAssistant)
+    if jarvis is not None:
+        timed(results, 'first_command_ms', lambda: jarvis.handle_command(first_command))
+        timed(results, 'second_command_ms', lambda: jarvis.handle_command(first_command))
+        results['lazy_imports'] = jarvis.get_import_report()['loaded']
+        jarvis.performance_optimizer.warmup.stop()
+
+    real_stdout.write(json.dumps(results) + '\n')
+    real_stdout.flush()
+
+
+def child_gui():
+    """Time EnhancedMain() (the PyQt5 window) offscreen, if PyQt5 is installed"""
+    sys.path.insert(0, ROOT)
+    real_stdout = sys.stdout
+    sys.stdout = sys.stderr
+
+    results = {}
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    try:
+        from PyQt5.QtWidgets import QApplication
+    except ImportError as e:
+        results['skipped'] = f"PyQt5 not available: {e}"
+    else:
+        application = QApplication([])
+        main_enhanced = timed(results, 'import_main_enhanced_ms', lambda: __import__('main_enhanced'))
+        if main_enhanced is not None:
+            timed(results, 'enhanced_main_ms', main_enhanced.EnhancedMain)
+        application.quit()
+
+    real_stdout.write(json.dumps(results) + '\n')
+    real_stdout.flush()
+
+
+def run_child(mode, *args):
+    """Run this script in a fresh interpreter and return the JSON it prints"""
+    result = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--child', mode, *args],
+        cwd=ROOT, capture_output=True, text=True, timeout=300
+    )
+    lines = result.stdout.strip().splitlines()
+    if result.returncode != 0 or not lines:
+        return {'errors': {mode: result.stderr[-2000:]}}
+    return json.loads(lines[-1])
+
+
+# =================== BUDGETS ===================
+
+def lookup(results, path):
+    """Value at a dotted path ("constructors.jarvis_assistant_ms"), or None"""
+    value = results
+    for key in path.split('.'):
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+
+def skipped(results, path):
+    """Whether a measurement was left out on purpose: its section did not run or reported itself skipped"""
+    section = path.split('.')[0]
+    return section not in results or 'skipped' in results[section]
+
+
+def check_budgets(results, budgets):
+    """Compare every budgeted measurement with its limit"""
+    checks = {}
+    for path, limit in budgets.items():
+        value = lookup(results, path)
+        if value is None:
+            status = 'skipped' if skipped(results, path) else 'missing'
+        else:
+            status = 'ok' if value <= limit else 'over'
+        checks[path] = {'value_ms': value, 'budget_ms': limit, 'status': status}
+    return checks
+
+
+def child_errors(results):
+    """Errors reported by the child runs, by dotted path of the section that reported them"""
+    errors = {}
+    for path in ('constructors', 'constructors.subsystems_ms', 'gui'):
+        value = lookup(results, path)
+        if isinstance(value, dict) and value.get('errors'):
+            errors[path] = value['errors']
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help='warm imports to take the median of')
+    parser.add_argument('--top', type=int, default=15, help='slowest modules to list')
+    parser.add_argument('--command', default="what's the time", help='first command to time')
+    parser.add_argument('--budgets', default=DEFAULT_BUDGETS, help='JSON file of {"dotted.path": budget_ms}')
+    parser.add_argument('--output', help='write the JSON report here instead of stdout')
+    parser.add_argument('--no-gui', action='store_true', help='skip timing the PyQt5 window')
+    parser.add_argument('--child', choices=['constructors', 'gui'], help=argparse.SUPPRESS)
+    parser.add_argument('child_args', nargs='*', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child == 'constructors':
+        return child_constructors(*(args.child_args or [args.command]))
+    if args.child == 'gui':
+        return child_gui()
+
+    print("⏱️ Measuring import time...", file=sys.stderr)
+    results = {
+        'python': sys.version.split()[0],
+        'platform': sys.platform,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'imports': {'Jarvis': import_benchmark('Jarvis', args.repeat, args.top)}
+    }
+
+    print("⏱️ Measuring constructors and first command...", file=sys.stderr)
+    results['constructors'] = run_child('constructors', args.command)
+    if not args.no_gui:
+        print("⏱️ Measuring EnhancedMain...", file=sys.stderr)
+        results['gui'] = run_child('gui')
+
+    budgets = {}
+    if args.budgets and os.path.exists(args.budgets):
+        with open(args.budgets, 'r', encoding='utf-8') as f:
+            budgets = json.load(f)
+    results['budgets'] = check_budgets(results, budgets)
+    failed = [path for path, check in results['budgets'].items() if check['status'] in ('over', 'missing')]
+    errors = child_errors(results)
+
+    report = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(report + '\n')
+        print(f"📝 Report written to {args.output}", file=sys.stderr)
+    else:
+        print(report)
+
+    for path, check in results['budgets'].items():
+        mark = {'ok': '✅', 'over': '❌', 'missing': '❌', 'skipped': '➖'}[check['status']]
+        print(f"{mark} {path}: {check['value_ms']} ms (budget {check['budget_ms']} ms)", file=sys.stderr)
+    for path, section_errors in errors.items():
+        for name, error in section_errors.items():
+            last_line = (error.strip().splitlines() or [''])[-1]  # a crashed child reports its whole stderr
+            print(f"❌ {path}: {name} failed: {last_line}", file=sys.stderr)
+    return 1 if failed or errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""
+JARVIS Enhanced Assistant - Batch Command Runner
+Runs text commands from a file or stdin through the dispatch path and reports latency and throughput as JSON
+
+    python jarvis_batch.py commands.txt --concurrency 4 --repeat 10 > report.json
+    echo "what's the time" | python jarvis_batch.py
+"""
+
+import sys
+import json
+import time
+import argparse
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+def read_commands(source):
+    """One command per line; blank lines and # comments are skipped"""
+    if source == '-':
+        lines = sys.stdin.readlines()
+    else:
+        with open(source, encoding='utf-8') as f:
+            lines = f.readlines()
+    return [line.strip() for line in lines if line.strip() and not line.lstrip().startswith('#')]
+
+
+def run_command(jarvis, index, command, batch_start):
+    """Process one command and time it"""
+    started = time.perf_counter()
+    try:
+        (intent, response), error = jarvis.handle_command(command), None
+    except Exception as e:
+        intent, response, error = None, None, f"{type(e).__name__}: {e}"
+    finished = time.perf_counter()
+
+    return {
+        'index': index,
+        'command': command,
+        'intent': intent,
+        'response': response,
+        'error': error,
+        'started_ms': round((started - batch_start) * 1e3, 3),
+        'latency_ms': round((finished - started) * 1e3, 3)
+    }
+
+
+def summarize(results, wall_seconds):
+    """Throughput and latency percentiles of a batch"""
+    latencies = np.array([result['latency_ms'] for result in results], dtype=float)
+    summary = {
+        'commands': len(results),
+        'errors': sum(result['error'] is not None for result in results),
+        'unrecognized': sum(result['intent'] is None for result in results),
+        'wall_seconds': round(wall_seconds, 4),
+        'throughput_per_second': round(len(results) / wall_seconds, 2) if wall_seconds else None
+    }
+    if len(latencies):
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+        summary['latency_ms'] = {
+            'min': round(float(latencies.min()), 3),
+            'mean': round(float(latencies.mean()), 3),
+            'p50': round(float(p50), 3),
+            'p95': round(float(p95), 3),
+            'p99': round(float(p99), 3),
+            'max': round(float(latencies.max()), 3)
+        }
+    return summary
+
+
+def run_batch(jarvis, commands, concurrency=1):
+    """Run every command, `concurrency` at a time; results come back in input order"""
+    batch_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = [
+            executor.submit(run_command, jarvis, index, command, batch_start)
+            for index, command in enumerate(commands)
+        ]
+        results = [future.result() for future in futures]
+    return results, time.perf_counter() - batch_start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument('input', nargs='?', default='-', help="file with one command per line, '-' for stdin")
+    parser.add_argument('--concurrency', type=int, default=1, help='commands processed at the same time')
+    parser.add_argument('--repeat', type=int, default=1, help='run the command list this many times')
+    parser.add_argument('--warmup', type=int, default=0, help='untimed passes over the command list first')
+    parser.add_argument('--language', default=None, help='language code to switch to before the run')
+    parser.add_argument('--no-responses', action='store_true', help='leave response text out of the report')
+    parser.add_argument('--output', default='-', help="report file, '-' for stdout")
+    args = parser.parse_args()
+
+    commands = read_commands(args.input)
+    if not commands:
+        parser.error("no commands to run")
+
+    # The assistant (and its background threads) narrate to stdout; keep that on stderr so stdout carries only the report
+    report_stream, sys.stdout = sys.stdout, sys.stderr
+    from Jarvis import JarvisAssistant
+
+    started = time.perf_counter()
+    jarvis = JarvisAssistant()
+    startup_seconds = time.perf_counter() - started
+
+    if args.language:
+        jarvis.change_language(args.language)
+    for _ in range(args.warmup):
+        run_batch(jarvis, commands, args.concurrency)
+
+    results, wall_seconds = run_batch(jarvis, commands * args.repeat, args.concurrency)
+    jarvis.cleanup()
+
+    if args.no_responses:
+        for result in results:
+            del result['response']
+
+    report = {
+        'run': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'input': args.input,
+            'unique_commands': len(commands),
+            'concurrency': args.concurrency,
+            'repeat': args.repeat,
+            'warmup': args.warmup,
+            'language': args.language or 'en',
+            'startup_seconds': round(startup_seconds, 4)
+        },
+        'summary': summarize(results, wall_seconds),
+        'commands': results
+    }
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output == '-':
+        print(text, file=report_stream)
+    else:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+        print(f"📄 Report written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
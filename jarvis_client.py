@@ -0,0 +1,121 @@
+"""
+JARVIS Enhanced Assistant - Command Client
+Sends text commands to a running jarvis_server.py and prints the answers as they stream back
+Standard library only: starts instantly, nothing of the assistant is imported
+
+    python jarvis_client.py "what's the time and the weather in london"
+    python jarvis_client.py                       # interactive
+    python jarvis_client.py --stats
+"""
+
+import sys
+import json
+import socket
+import argparse
+
+DEFAULT_SOCKET = "/tmp/jarvis.sock"  # keep in step with config.server_socket_path
+DEFAULT_PORT = 8765
+
+
+class CommandClient:
+    """Line-delimited JSON connection to the command server"""
+
+    def __init__(self, socket_path=DEFAULT_SOCKET, host='127.0.0.1', port=DEFAULT_PORT, timeout=60):
+        if socket_path:
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.settimeout(timeout)
+            self.sock.connect(socket_path)
+        else:
+            self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.stream = self.sock.makefile('r', encoding='utf-8')
+        self.next_id = 0
+
+    def request(self, message):
+        """Send a request and yield its replies until the last one"""
+        self.next_id += 1
+        message = dict(message, id=self.next_id)
+        self.sock.sendall((json.dumps(message, ensure_ascii=False) + '\n').encode('utf-8'))
+        for line in self.stream:
+            reply = json.loads(line)
+            yield reply
+            if reply.get('type') in ('done', 'error', 'stats'):
+                return
+        raise ConnectionError("server closed the connection")
+
+    def send_command(self, command, timeout=None):
+        """Yield ('part', text) for each streamed answer, then ('done', reply); timeout overrides the server's deadline"""
+        message = {'command': command}
+        if timeout:
+            message['timeout'] = timeout
+        for reply in self.request(message):
+            if reply['type'] == 'part':
+                yield 'part', reply['text']
+            elif reply['type'] == 'error':
+                raise RuntimeError(reply['error'])
+            else:
+                yield reply['type'], reply
+
+    def close(self):
+        self.stream.close()
+        self.sock.close()
+
+
+def run_command(client, command, verbose=False, timeout=None):
+    """Print each answer as it arrives"""
+    streamed = False
+    for kind, payload in client.send_command(command, timeout):
+        if kind == 'part':
+            print(f"🤖 {payload}", flush=True)
+            streamed = True
+        elif kind == 'done':
+            if not streamed and payload.get('response'):
+                print(f"🤖 {payload['response']}")
+            if verbose:
+                print(f"   [{payload.get('intent')}, {payload.get('latency_ms')} ms]")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument('command', nargs='*', help='command to send; interactive if omitted')
+    parser.add_argument('--socket', default=DEFAULT_SOCKET, help='Unix socket path')
+    parser.add_argument('--tcp', action='store_true', help='connect over localhost TCP instead of a Unix socket')
+    parser.add_argument('--host', default='127.0.0.1', help='TCP host')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='TCP port')
+    parser.add_argument('--timeout', type=float, help='seconds the server may spend on a command')
+    parser.add_argument('--stats', action='store_true', help='print server statistics and exit')
+    parser.add_argument('-v', '--verbose', action='store_true', help='show intent and latency of each command')
+    args = parser.parse_args()
+
+    try:
+        client = CommandClient(None if args.tcp else args.socket, args.host, args.port)
+    except OSError as e:
+        print(f"❌ JARVIS server not reachable ({e}). Start it with: python jarvis_server.py", file=sys.stderr)
+        return 1
+
+    try:
+        if args.stats:
+            for reply in client.request({'type': 'stats'}):
+                print(json.dumps(reply.get('stats', reply), indent=2, ensure_ascii=False))
+        elif args.command:
+            run_command(client, ' '.join(args.command), args.verbose, args.timeout)
+        else:
+            while True:
+                try:
+                    command = input("👤 You: ").strip()
+                except (EOFError, KeyboardInterrupt):
+                    print()
+                    break
+                if command.lower() in ('exit', 'quit'):
+                    break
+                if command:
+                    run_command(client, command, args.verbose, args.timeout)
+    except (OSError, RuntimeError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    finally:
+        client.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""
+JARVIS Enhanced Assistant - Headless Daemon
+Runs the listen/dispatch/speak loop on plain threads for always-on boxes without a display
+PyQt5, matplotlib and pyautogui are never imported: desktop-only commands answer that they are unavailable
+
+    python jarvis_daemon.py                 # voice loop
+    python jarvis_daemon.py --stdin         # read commands from standard input instead of the microphone
+    python jarvis_daemon.py --serve         # also host the command server for jarvis_client.py
+"""
+
+import sys
+import time
+import signal
+import asyncio
+import argparse
+import threading
+
+from Jarvis.features.headless import block_gui_imports, loaded_gui_modules
+
+# Before the assistant is built and before any feature module is lazily loaded
+block_gui_imports()
+
+from Jarvis.config import config
+
+
+def read_stdin():
+    """One command per line from standard input; EOFError at the end of input stops the loop"""
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.strip()
+
+
+def start_server(jarvis, args):
+    """Host the command server on its own event loop thread"""
+    from Jarvis.features.command_server import CommandServer
+
+    socket_path = None if args.tcp or not hasattr(asyncio, 'start_unix_server') else args.socket
+    server = CommandServer(jarvis, socket_path, args.host, args.port, config.server_workers)
+    thread = threading.Thread(target=lambda: asyncio.run(server.serve_forever()), name='jarvis-server', daemon=True)
+    thread.start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument('--stdin', action='store_true', help='read commands from standard input, one per line')
+    parser.add_argument('--no-greeting', action='store_true', help='skip the spoken greeting')
+    parser.add_argument('--serve', action='store_true', help='also accept commands from jarvis_client.py')
+    parser.add_argument('--socket', default=config.server_socket_path, help='Unix socket path for --serve')
+    parser.add_argument('--tcp', action='store_true', help='serve on localhost TCP instead of a Unix socket')
+    parser.add_argument('--host', default=config.server_host, help='TCP host for --serve (loopback only)')
+    parser.add_argument('--port', type=int, default=config.server_port, help='TCP port for --serve')
+    args = parser.parse_args()
+
+    if args.serve:
+        from Jarvis.features.command_server import is_loopback
+        if (args.tcp or not args.socket or not hasattr(asyncio, 'start_unix_server')) and not is_loopback(args.host):
+            parser.error(f"--host {args.host} is not a loopback address; commands are not authenticated")
+
+    from Jarvis import JarvisAssistant
+    from Jarvis.features.voice_loop import VoiceLoop
+
+    started = time.perf_counter()
+    jarvis = JarvisAssistant()
+    print(f"⏱️ Assistant ready in {time.perf_counter() - started:.2f}s")
+
+    loop = VoiceLoop(jarvis, listen=read_stdin if args.stdin else None, on_status=print)
+
+    def shut_down(signum, frame):
+        print("\n👋 Stopping after the current command")
+        loop.stop()
+        if args.stdin:
+            raise KeyboardInterrupt  # don't wait for another line
+
+    signal.signal(signal.SIGTERM, shut_down)
+    signal.signal(signal.SIGINT, shut_down)
+
+    server = start_server(jarvis, args) if args.serve else None
+    try:
+        if not args.no_greeting:
+            loop.greet()
+        loop.run()
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        if server:
+            server.close()
+        jarvis.cleanup()
+        loaded = loaded_gui_modules()
+        print(f"🖥️ GUI packages loaded: {', '.join(loaded) if loaded else 'none'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
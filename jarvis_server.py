@@ -0,0 +1,49 @@
+"""
+JARVIS Enhanced Assistant - Command Server
+Hosts one warmed JarvisAssistant for every client (see jarvis_client.py), so no client pays the startup cost
+
+    python jarvis_server.py                      # Unix socket from config.server_socket_path
+    python jarvis_server.py --tcp --port 8765    # localhost TCP
+"""
+
+import sys
+import time
+import asyncio
+import argparse
+
+from Jarvis.config import config
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument('--socket', default=config.server_socket_path, help='Unix socket path')
+    parser.add_argument('--tcp', action='store_true', help='listen on localhost TCP instead of a Unix socket')
+    parser.add_argument('--host', default=config.server_host, help='TCP host (loopback only)')
+    parser.add_argument('--port', type=int, default=config.server_port, help='TCP port')
+    parser.add_argument('--workers', type=int, default=config.server_workers, help='commands processed at the same time')
+    args = parser.parse_args()
+
+    socket_path = None if args.tcp or not hasattr(asyncio, 'start_unix_server') else args.socket
+
+    from Jarvis.features.command_server import CommandServer, is_loopback
+    if not socket_path and not is_loopback(args.host):
+        parser.error(f"--host {args.host} is not a loopback address; commands are not authenticated")
+
+    from Jarvis import JarvisAssistant
+
+    started = time.perf_counter()
+    jarvis = JarvisAssistant()
+    print(f"⏱️ Assistant ready in {time.perf_counter() - started:.2f}s")
+
+    server = CommandServer(jarvis, socket_path, args.host, args.port, args.workers)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print("\n👋 Command server stopped")
+    finally:
+        jarvis.cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
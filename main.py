@@ -112,7 +112,7 @@ class MainThread(QThread):
         wish()
 
         while True:
-            command = obj.mic_input()
+            command = obj.canonicalize_command(obj.mic_input())
 
             if re.search('date', command):
                 date = obj.tell_me_date()
@@ -172,6 +172,9 @@ class MainThread(QThread):
                 for index, articles in enumerate(news_res):
                     pprint.pprint(articles['title'])
                     speak(articles['title'])
+                    if obj.language_support.was_interrupted:
+                        # User barged in, stop the readout and listen
+                        break
                     if index == len(news_res)-2:
                         break
                 speak('These were the top headlines, Have a nice day Sir!!..')